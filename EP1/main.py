@@ -7,223 +7,19 @@ Rodrigo Ryuji Ikegami, NUSP 10297265, Eng. Elétrica
 
 Jul. 2021.
 """
+import os
+import sys
 import numpy as np
 from typing import Tuple
-from math import copysign, cos, sin, pi
+from math import cos, sin, pi
+from functools import partial
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
-def sgn(x):
-    """
-        Função Sinal
-        ------------
-
-        `sgn(x)` retorna 1 se x >= 0, -1 caso contrário.
-    """
-    return copysign(1, x)
-
-def qr_factorization(alphas : np.array, betas : np.array) -> Tuple[np.array, np.array, np.array, np.array]:
-    """
-        Fatoração QR
-        ------------
-        Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
-        sua diagonal principal e sua sobrediagonal, retorna sua fatoração QR utilizando rotações de Givens.
-
-        A matriz Q é retornada por meio de dois vetores `c_ks` e `s_ks` que recebem os cossenos e senos utilizados em cada etapa da
-        fatoração. A matriz R, triangular superior, é retornada em dois vetores que armazenam sua diagonal principal e a
-        sobrediagonal. A diagonal extra que é adicionada pela aplicação das rotações de Givens não foi calculada pois não
-        será necessárias para a implementação do algoritmo QR.
-
-        Parâmetros
-        ----------
-
-        alphas  :   np.array
-            Vetor que armazena as entradas da diagonal principal da matriz.
-
-        betas   :   np.array
-            Vetor que armazena as entradas da sobrediagonal da matriz.
-
-        Retorna
-        -------
-        (c_ks, s_ks, alphas, betas) : Tuple[np.array, np.array, np.array, np.array]
-            Quadra que retorna os vetores `c_ks` e `s_ks`, que são os cossenos e senos utilizados nas rotações de Givens,
-            e `alphas` e `betas`, que retornam a representação da matriz R.
-    """
-    c_ks, s_ks = [], []
-    (alphas, betas) = (alphas.copy(), betas.copy())
-
-    for k in range(len(alphas) - 1):
-        if abs(alphas[k]) > abs(betas[k]):
-            tau_k = - betas[k] / alphas[k]
-            c_ks.append(1 / np.sqrt(1 + tau_k**2))
-            s_ks.append(tau_k * c_ks[k])
-        else:
-            tau_k = - alphas[k] / betas[k]
-            s_ks.append(1 / np.sqrt(1 + tau_k**2))
-            c_ks.append(tau_k * s_ks[k])
-
-        alphas[k] = c_ks[k] * alphas[k] - s_ks[k] * betas[k]
-        betas[k] *= c_ks[k - 1] if k > 0 else 1
-        (alphas[k + 1], betas[k]) = (s_ks[k] * betas[k] + c_ks[k] * alphas[k + 1], c_ks[k] * betas[k] - s_ks[k] * alphas[k + 1])
-
-    return (c_ks, s_ks, alphas, betas)
-
-def update_matrix(c_ks : np.array, s_ks : np.array, alphas : np.array, betas : np.array) -> Tuple[np.array, np.array]:
-    """
-        Atualização da matriz
-        ------------
-        Dada uma matriz triangular superior, representada por dois vetores `alphas` e `betas`, que armazenam
-        sua diagonal principal e sua sobrediagonal, e as matrizes de rotação de Givens, representadas por dois
-        vetores com senos e cossenos utilizados a cada rotação, retorna uma nova matriz tridiagonal simétrica.
-
-        Os valores fora das diagonais mencionadas, mas pertencentes ao triângulo superior da matriz não são
-        utilizados para o cálculo dos valores na nova matriz.
-
-        A matriz é retornada por meio de dois vetores, `alphas` e `betas`, que recebem sua diagonal principal
-        e sua sobrediagonal, respectivamente.
-
-        Parâmetros
-        ----------
-
-        c_ks    :   np.array
-            Vetor que armazena os cossenos utilizados nas rotações de Givens.
-
-        s_ks    :   np.array
-            Vetor que armazena os senos utilizados nas rotações de Givens.
-
-        alphas  :   np.array
-            Vetor que armazena as entradas da diagonal principal da matriz.
-
-        betas   :   np.array
-            Vetor que armazena as entradas da sobrediagonal da matriz.
-
-        Retorna
-        -------
-        (alphas, betas) : Tuple[np.array, np.array]
-            Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
-            tridiagonal simétrica, através de sua diagonal principal e sua sobrediagonal.
-    """
-    (alphas, betas) = (alphas.copy(), betas.copy())
-
-    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
-        (alphas[i], betas[i], alphas[i + 1]) = (c * alphas[i] - s * betas[i], -s * alphas[i + 1], c * alphas[i + 1])
-
-    return (alphas, betas)
-
-def update_eigenvectors(V : np.array, c_ks : np.array, s_ks : np.array) -> np.array:
-    """
-        Atualização dos Autovetores da Matriz
-        -------------------------------------
-        Dada uma matriz V, que armazena os autovetores encontrados até a `(k-1)-ésima` iteração do algoritmo QR, atualiza-os
-        por meio das rotações inversas de Givens, que são construídas a partir de operações nas colunas com os cossenos e
-        senos obtidos anteriormente pela fatoração QR.
-
-        Parâmetros
-        ----------
-
-        V   :   np.array
-            Matriz cujas colunas são os autovetores encontrados até a `(k-1)ésima` iteração do algoritmo QR.
-
-        c_ks    :   np.array
-            Vetor que armazena os cossenos utilizados nas rotações de Givens.
-
-        s_ks    :   np.array
-            Vetor que armazena os senos utilizados nas rotações de Givens.
-
-        Retorna
-        -------
-
-        V_k :   np.array
-            Matriz cujas colunas são os autovetores atualizados até a `k=ésima` iteração do algoritmo QR.
-    """
-    V_k = V.copy()
-    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
-        (V_k[:, i], V_k[:, i + 1]) = (c * V_k[:, i] - s * V_k[:, i + 1], s * V_k[:, i] + c * V_k[:, i + 1])
-    return V_k
-
-def wilkinson_h(alphas : np.array, betas : np.array) -> float:
-    """
-        Coeficientes de Deslocamento Espectral
-        --------------------------------------
-        Dada a matriz A, representada por seus valores da diagonal principal e sobrediagonal com os vetores `alphas` e `betas`,
-        calcula o valor do coeficiente de deslocamento espectral da `k-ésima` iteração por meio da heurística de Wilkinson.
-
-        Parâmetros
-        ----------
-
-        alphas  :   np.array
-            Vetor da diagonal principal da matriz A.
-
-        betas   :   np.array
-            Vetor da sobrediagonal da matriz A.
-
-        Retorna
-        -------
-
-        \mu_k   :   float
-            Valor do coeficiente de deslocamento espectral para a `k-ésima` iteração.
-    """
-    d_k = (alphas[len(alphas) - 2]  - alphas[len(alphas) - 1]) / 2
-    return alphas[len(alphas) - 1] + d_k - sgn(d_k) * np.sqrt(d_k**2 + betas[len(alphas) - 2]**2)
-
-def qr_algorithm(alphas : np.array, betas : np.array, spectralShift : bool = True, epsilon : float = 1e-6) -> Tuple[np.array, np.array, np.array, int]:
-    """
-        Algoritmo QR
-        --------------------------------------
-        Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
-        sua diagonal principal e sua sobrediagonal, efetua o Algoritmo QR, com ou sem deslocamento espectral, até
-        atingir um determinado erro epsilon, e retorna a matriz com os auto-valores calculados, a matriz com os
-        auto-vetores e o número total de iterações executadas pelo algoritmo
-
-        Parâmetros
-        ----------
-
-        alphas  :   np.array
-            Vetor da diagonal principal da matriz A.
-
-        betas   :   np.array
-            Vetor da sobrediagonal da matriz A.
-
-        spectralShift : bool
-            Se for True, a função executa o algoritmo com deslocamento espectral. Se for False, executa o algoritmo
-            sem deslocamento espectral.
-
-        epsilon : float
-            Valor utilizado para determinar convergência dos valores calculados. Quanto menor for, menor será o erro
-            do valor final calculado em relação ao ideal.
-
-        Retorna
-        -------
-
-        (alphas, betas)   :   Tuple[np.array, np.array]
-            Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
-            tridiagonal simétrica dos auto-valores, através de sua diagonal principal e sua sobrediagonal.
-
-        V : np.array
-            Matriz com os auto-vetores da matriz A.
-
-        iterations : int
-            Número de iterações executadas pelo algoritmo.
-    """
-    alphas_k = alphas.copy()
-    betas_k = betas.copy()
-    V = np.identity(len(alphas_k))
-    mu = 0
-    iterations = 0
-    for m in reversed(range(1, len(alphas))):
-        while abs(betas_k[m - 1]) >= epsilon:
-            (c_ks, s_ks, alphas_sub, betas_sub) = qr_factorization(alphas_k[: m + 1] - mu * np.ones(m + 1), betas_k[: m + 1])
-            (alphas_k[: m + 1], betas_k[: m + 1]) = update_matrix(c_ks, s_ks, alphas_sub, betas_sub)
-
-            alphas_k[: m + 1] += mu * np.ones(m + 1)
-
-            V = update_eigenvectors(V, c_ks, s_ks)
-
-            mu = wilkinson_h(alphas_k[: m + 1], betas_k[: m + 1]) if spectralShift else 0
-
-            iterations += 1
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
 
-    return (alphas_k, betas_k, V, iterations)
+from eigen import modal_response, qr_algorithm, qr_factorization, spring_chain, update_matrix, update_eigenvectors, wilkinson_h
+from render import EXPORT, export_animation, export_path
 
 def qr_1(alphas : np.array, betas : np.array, shift : bool = True, eps : float = 1e-6) -> Tuple[np.array, np.array, np.array, np.array, int]:
     """"
@@ -311,7 +107,7 @@ def teste_1():
         print("""      Matriz original:""")
         print("     ", np.array2string(np.diag(betas, k = 1) + np.diag(betas, k = -1) + np.diag(alphas), prefix = "      "))
 
-        (alphas_k, _, V, iterations_sem) = qr_algorithm(alphas, betas, spectralShift = False)
+        (alphas_k, _, V, iterations_sem) = qr_algorithm(alphas, betas, spectralShift = False, epsilon = 1e-6)
 
         print("""\n      > Procedimentos sem deslocamento espectral <
         """)
@@ -323,7 +119,7 @@ def teste_1():
         """)
         print("     ", np.array2string(V, prefix = "      "))
 
-        (alphas_k, _, V, iterations_com) = qr_algorithm(alphas, betas)
+        (alphas_k, _, V, iterations_com) = qr_algorithm(alphas, betas, epsilon = 1e-6)
 
         print("""\n      > Procedimentos com deslocamento espectral <
         """)
@@ -337,7 +133,7 @@ def teste_1():
 
         eigenvectors = np.array([[sin(i * j * pi/ (n + 1)) for j in range(1, (n + 1))][::-1] for i in range(1, (n + 1))])
 
-        (_, _, V, _) = qr_algorithm(alphas, betas)
+        (_, _, V, _) = qr_algorithm(alphas, betas, epsilon = 1e-6)
         print(f"      Razão de proporcionalidade: {np.divide(eigenvectors, V)[0,0]}")
 
         input("\n     Pressione [ENTER] para continuar para a próxima rotina.")
@@ -365,8 +161,7 @@ def teste_2():
         print(f"        k{i + 1} = {j} N/m.")
     print("      =====================")
 
-    alphas = np.array([(a + b)/2 for (a, b) in zip(k, k[1:])])
-    betas = np.array([-b/2 for b in k[1:-1]])
+    (alphas, betas) = spring_chain(k)
 
     print("""
       Matriz A dos Coeficientes da EDO:
@@ -374,7 +169,7 @@ def teste_2():
 
     print("     ", np.array2string(np.diag(alphas) + np.diag(betas, k = 1) + np.diag(betas, k = -1), prefix = "      "))
 
-    (alphas_k, _, V, iterations_w) = qr_algorithm(alphas, betas)
+    (alphas_k, _, V, iterations_w) = qr_algorithm(alphas, betas, epsilon = 1e-6)
 
     print("\n      > Solução da EDO <")
     print(f"""
@@ -424,8 +219,9 @@ def teste_2():
         # C(t) = [cos(np.sqrt(alphas_k[i]) t) for i in range(5)]^T
         # X(t) = Q x Y(t) = Q x (Y(0) \cdot C(t))
         
-        for t in [0, 5, 10]:
-            print(f"      X(t = {t:2}) = {np.array([sum([V[i][j] * Y0[j] * cos(np.sqrt(alphas_k[j]) * t) for j in range(5)]) for i in range(5)])}")
+        X = modal_response(alphas_k, V, X0, [0, 5, 10])
+        for (j, t) in enumerate([0, 5, 10]):
+            print(f"      X(t = {t:2}) = {X[:, j]}")
 
 def teste_3():
     """
@@ -447,8 +243,7 @@ def teste_3():
             print(f"        k{i + 1} = {j} N/m.")
     print("      =====================")
 
-    alphas = np.array([(a + b)/2 for (a, b) in zip(k, k[1:])])
-    betas = np.array([-b/2 for b in k[1:-1]])
+    (alphas, betas) = spring_chain(k)
 
     print("""
       Matriz A dos Coeficientes da EDO:
@@ -456,7 +251,7 @@ def teste_3():
 
     print("     ", np.array2string(np.diag(alphas) + np.diag(betas, k = 1) + np.diag(betas, k = -1), prefix = "      "))
 
-    (alphas_k, _, V, iterations_w) = qr_algorithm(alphas, betas)
+    (alphas_k, _, V, iterations_w) = qr_algorithm(alphas, betas, epsilon = 1e-6)
 
     print("\n      > Solução da EDO <")
     print(f"""
@@ -506,8 +301,9 @@ def teste_3():
         # C(t) = [cos(np.sqrt(alphas_k[i]) t) for i in range(5)]^T
         # X(t) = Q x Y(t) = Q x (Y(0) \cdot C(t))
         
-        for t in [0, 5, 10]:
-            print(f"      X(t = {t:2}) = {np.array([sum([V[i][j] * Y0[j] * cos(np.sqrt(alphas_k[j]) * t) for j in range(10)]) for i in range(10)])}")
+        X = modal_response(alphas_k, V, X0, [0, 5, 10])
+        for (j, t) in enumerate([0, 5, 10]):
+            print(f"      X(t = {t:2}) = {X[:, j]}")
 
 def plot_1():
     """
@@ -532,10 +328,10 @@ def plot_1():
         alphas = np.array(i * [2.0])
         betas = np.array((i-1) * [-1.0])
     
-        (_, _, _, iterations) = qr_algorithm(alphas, betas, spectralShift = False)
+        (_, _, _, iterations) = qr_algorithm(alphas, betas, spectralShift = False, epsilon = 1e-6)
         iters_sem.append(iterations)
 
-        (_, _, _, iterations) = qr_algorithm(alphas, betas)
+        (_, _, _, iterations) = qr_algorithm(alphas, betas, epsilon = 1e-6)
         iters_com.append(iterations)
 
         sys.stdout.write('\x1b[1A')
@@ -599,23 +395,103 @@ def plot_1():
 
     plt.show()
 
-def plot_spring(x0, x, ax):
+def spring_template(points = 1001, coils = 5, radius = 0.03, pad = 100):
     """
-        Desenha uma mola.
-        Este código foi baseado na implementação de Christian, do blog Scipython. 
+        Molde de Mola
+        ------------------
+
+        Calcula uma única vez o desenho de uma mola de comprimento unitário, com início na origem: `points` pontos
+        (u, v), com u de 0 a 1 e v = -radius sin(2 pi coils u), exceto nos `pad` pontos de cada extremidade, que
+        ficam retos. Este desenho foi baseado na implementação de Christian, do blog Scipython.
         Disponível em: <https://scipython.com/blog/the-spring-pendulum/>. Acesso: 01 Jul. 2021.
     """
-    L = np.abs(x-x0)
-    rs, ns = 0.03, 5
-    Ns = 1000
-    ipad1, ipad2 = 100, 100
-    w = np.linspace(0, L, Ns)
-    xp = np.zeros(Ns)
-    xp[ipad1:-ipad2] = rs * np.sin(2*np.pi * ns * w[ipad1:-ipad2] / L)
-    R = np.array([[np.cos(pi/2), -np.sin(pi/2)],
-                  [np.sin(pi/2), np.cos(pi/2)]])
-    xs, ys = - R @ np.vstack((xp, w))
-    return ax.plot(x0 * np.ones(len(xs)) + xs, ys, c='silver', lw = 2)
+    u = np.linspace(0, 1, points)
+    v = np.zeros(points)
+    v[pad:-pad] = -radius * np.sin(2 * np.pi * coils * u[pad:-pad])
+    return u, v
+
+SPRING_TEMPLATE = spring_template()
+
+def spring_coordinates(x0, x, density = 20, template = SPRING_TEMPLATE):
+    """
+        Retorna as coordenadas (x, y) do desenho de uma mola entre as posições x0 e x, sem criar artistas: o molde
+        unitário é apenas escalado para o comprimento x - x0 e transladado para x0. Molas curtas usam uma amostra do
+        molde (1 a cada 2, 4 ou 8 pontos), com cerca de `density` pontos por unidade de comprimento, mas nunca menos
+        que 1/8 dos pontos do molde.
+    """
+    L = x - x0
+    step = 1
+    while step < 8 and len(template[0]) / (2 * step) >= density * abs(L):
+        step *= 2
+    (u, v) = (template[0][::step], template[1][::step])
+    return x0 + L * u, v
+
+def plot_spring(x0, x, ax):
+    """
+        Desenha uma mola entre as posições x0 e x, criando um novo artista (veja spring_coordinates). Nas animações, o
+        artista é criado uma única vez e apenas atualizado a cada quadro.
+    """
+    return ax.plot(*spring_coordinates(x0, x), c='silver', lw = 2)
+
+def springs_figure(fig, trajectory, P0, xlim, ylim = None, left = -10):
+    """
+        Animação de um Sistema Massa-Mola
+        ------------------
+
+        Cria, na figura fig, os artistas da animação do sistema massa-mola: se ylim for dado, uma grade 2 x 3 com o
+        deslocamento de cada massa na última janela de 1 s e o sistema no último quadro (plot_2); caso contrário,
+        apenas o sistema (plot_3). A trajetória é a tupla (time, solution), com os instantes de cada quadro e o
+        deslocamento de cada massa em cada instante (uma linha por massa). As paredes ficam em left e xlim.
+
+        Retorna a função animate(index), que leva os artistas ao quadro index e os retorna, para o FuncAnimation
+        ou para a exportação sem janela (veja render.export_animation).
+    """
+    (time, solution) = trajectory
+    fig.suptitle('Evolução do Sistema no Tempo')
+    curves = []
+
+    if ylim is not None:
+        axes = fig.subplots(2, 3)
+        fig.text(0.5, .94, 'Deslocamento da Mola em relação ao Equilíbrio', fontsize = 10, ha = "center")
+        fig.subplots_adjust(hspace = 0.4)
+
+        for (i, (axis, color)) in enumerate(zip(axes.flat, ["blue", "red", "lime", "purple", "coral"])):
+            curves += axis.plot([], [], color = color, lw = 1.5)
+            axis.set_ylim(-ylim, ylim)
+            axis.set_ylabel("Deslocamento (cm)")
+            axis.set_title(f"Massa {i+1}")
+            axis.set_xticks([])
+
+        ax = axes[1, 2]
+        ax.set_xlabel("Posição (cm)")
+        ax.set_title("Sistema")
+    else:
+        ax = fig.add_subplot(111)
+
+    ax.set_yticks([])
+    ax.set_xlim(left, xlim)
+    ax.set_ylim(-1, 1)
+
+    springs = [plot_spring(0, 1, ax)[0] for i in range(len(solution) + 1)]
+    mat = ax.plot([], [], 'o')
+
+    def animate(index):
+        t = time[index]
+
+        for (curve, x) in zip(curves, solution):
+            curve.set_data(time[:index + 1], x[:index + 1])
+            curve.axes.set_xlim(t - 1, t)
+
+        X = np.array(P0[:len(solution)]) + solution[:, index]
+        mat[0].set_data(X, np.zeros(np.shape(X)))
+
+        ends = [left] + list(X) + [xlim]
+        for (spring, a, b) in zip(springs, ends, ends[1:]):
+            spring.set_data(*spring_coordinates(a, b))
+
+        return curves + springs + list(mat)
+
+    return animate
 
 def plot_2():
     """
@@ -627,22 +503,21 @@ def plot_2():
     print("")
     k = [40 + 2 * i for i in range(1, 7)]
 
-    alphas = np.array([(a + b)/2 for (a, b) in zip(k, k[1:])])
-    betas = np.array([-b/2 for b in k[1:-1]])
+    (alphas, betas) = spring_chain(k)
 
-    (alphas_k, _, V, _) = qr_algorithm(alphas, betas)
+    (alphas_k, _, V, _) = qr_algorithm(alphas, betas, epsilon = 1e-6)
 
     initial_conditions = [np.array([-2.0, -3.0, -1.0, -3.0, -1.0]), np.array([1.0, 10.0, -4.0, 3.0, -2.0]), V[:, 0]]
     mass_positions = [[10 * i for i in range(0, 6)], [20 * i for i in range(0, 6)], [10 * i for i in range(0, 6)]]
     xlims = [50, 90, 50]
     ylims = [4, 12, 2]
 
-    for (X0, P0, xlim, ylim) in zip(initial_conditions, mass_positions, xlims, ylims):
+    time = np.linspace(0, 10, int(10 / 0.025))
+    solutions = modal_response(alphas_k, V, np.transpose(initial_conditions), time)
+
+    for (index, (X0, P0, xlim, ylim)) in enumerate(zip(initial_conditions, mass_positions, xlims, ylims)):
         print(f"      Exibindo gráfico para X(0) = {X0}")
-        Y0 = np.matmul(np.transpose(V), X0)
-        
-        time = np.linspace(0, 10, int(10 / 0.025))
-        solution = np.array([[sum([V[i][j] * Y0[j] * np.cos(np.sqrt(alphas_k[j]) * t) for j in range(5)]) for t in time] for i in range(5)])
+        solution = solutions[index]
 
         fig, axes = plt.subplots(2, 3)
         fig.set_size_inches(18.5, 10.5)
@@ -670,104 +545,18 @@ def plot_2():
         if option != 'n' and option != 'N':
             print("")
 
-            time = []
-        
-            solution = [[], [], [], [], []]
+            time = np.arange(400 if EXPORT else 4800) * 0.025
+            solution = modal_response(alphas_k, V, X0, time)
+            setup = partial(springs_figure, P0 = P0, xlim = xlim, ylim = ylim)
+
+            if EXPORT:
+                path = export_animation(setup, (time, solution), len(time), export_path(EXPORT, f"molas5_{index + 1}"))
+                print(f"      Animação salva em: {path}\n")
+                continue
 
-            fig, axes = plt.subplots(2, 3)
-            plt.figtext(0.5, .94, 'Deslocamento da Mola em relação ao Equilíbrio', fontsize = 10, ha = "center")
+            fig = plt.figure()
             fig.set_size_inches(18.5, 10.5)
-            fig.suptitle('Evolução do Sistema no Tempo')
-            fig.subplots_adjust(hspace = 0.4)
-
-            mat0 = axes[0, 0].plot([], [], color = "blue", lw = 1.5)
-            mat1 = axes[0, 1].plot([], [], color = "red", lw = 1.5)
-            mat2 = axes[0, 2].plot([], [], color = "lime", lw = 1.5)
-            mat3 = axes[1, 0].plot([], [], color = "purple", lw = 1.5)
-            mat4 = axes[1, 1].plot([], [], color = "coral", lw = 1.5)
-            axes[1, 2].set_xlim(-10, xlim)
-            mat5 = axes[1, 2].plot([], [], 'o')
-            
-            mola1 = plot_spring(0, 1, axes[1,2])
-            mola2 = plot_spring(0, 1, axes[1,2])
-            mola3 = plot_spring(0, 1, axes[1,2])
-            mola4 = plot_spring(0, 1, axes[1,2])
-            molapar1 = plot_spring(0, 1, axes[1,2])
-            molapar2 = plot_spring(0, 1, axes[1,2])
-
-            patches = list(mat0) + list(mat1) + list(mat2) + list(mat3) + list(mat4) + list(mola1) + list(mola2) + list(mola3) + list(mola4) + list(molapar1) + list(molapar2) + list(mat5)
-
-            axes[0, 0].set_ylim(-ylim, ylim)
-            axes[0, 1].set_ylim(-ylim, ylim)
-            axes[0, 2].set_ylim(-ylim, ylim)
-            axes[1, 0].set_ylim(-ylim, ylim)
-            axes[1, 1].set_ylim(-ylim, ylim)
-            axes[1, 2].set_ylim(-1, 1)
-
-            def init():
-                global time
-                global solution
-                time = []
-                solution = [[], [], [], [], []]
-                mat0[0].set_data([], [])
-                mat1[0].set_data([], [])
-                mat2[0].set_data([], [])
-                mat3[0].set_data([], [])
-                mat4[0].set_data([], [])
-                mat5[0].set_data([], [])
-                return patches
-
-            def animate(index):
-                t = index * 0.025
-                time.append(t)
-
-                for i in range(5):
-                    solution[i].append(sum([V[i][j] * Y0[j] * np.cos(np.sqrt(alphas_k[j]) * t) for j in range(5)]))
-
-                mat0[0].set_data(time, solution[0])
-                mat1[0].set_data(time, solution[1])
-                mat2[0].set_data(time, solution[2])
-                mat3[0].set_data(time, solution[3])
-                mat4[0].set_data(time, solution[4])
-                mat0[0].axes.set_xlim(t - 1, t)
-                axes[0, 1].set_xlim(t - 1, t)
-                axes[0, 2].set_xlim(t - 1, t)
-                axes[1, 0].set_xlim(t - 1, t)
-                axes[1, 1].set_xlim(t - 1, t)
-
-                X = np.array([P0[i] + solution[i][index] for i in range(5)])
-                Y = np.zeros(np.shape(X))
-
-                mat5[0].set_data(X,Y)
-
-                a = plot_spring(X[0], X[1], axes[1, 2])[0]
-                b = plot_spring(X[1], X[2], axes[1, 2])[0]
-                c = plot_spring(X[2], X[3], axes[1, 2])[0]
-                d = plot_spring(X[3], X[4], axes[1, 2])[0]
-                e = plot_spring(-10, X[0], axes[1, 2])[0]
-                f = plot_spring(X[4], xlim, axes[1, 2])[0]
-
-                mola1[0].set_data(a.get_xdata(), a.get_ydata())
-                mola2[0].set_data(b.get_xdata(), b.get_ydata())
-                mola3[0].set_data(c.get_xdata(), c.get_ydata())
-                mola4[0].set_data(d.get_xdata(), d.get_ydata())
-                molapar1[0].set_data(e.get_xdata(), e.get_ydata())
-                molapar2[0].set_data(f.get_xdata(), f.get_ydata())
-
-                return patches
-            
-            for i, axis in enumerate(axes.flat[:-1]):
-                axis.set_ylabel("Deslocamento (cm)")
-                axis.set_title(f"Massa {i+1}")
-                axis.set_xticks([])
-
-            anim = FuncAnimation(fig, animate, init_func=init, frames=1000000, interval=10, blit=True)
-
-            for i, axis in enumerate(axes.flat[:-1]):
-                axis.set_ylabel("Deslocamento (cm)")
-            axes[1, 2].set_xlabel("Posição (cm)")
-            axes[1, 2].set_yticks([])
-            axes[1, 2].set_title("Sistema")
+            anim = FuncAnimation(fig, setup(fig, (time, solution)), frames = len(time), interval = 10, blit = True)
 
             plt.show()
 
@@ -781,21 +570,20 @@ def plot_3():
     print("")
     k = [40 + 2 * (-1) ** i for i in range(1, 12)]
 
-    alphas = np.array([(a + b)/2 for (a, b) in zip(k, k[1:])])
-    betas = np.array([-b/2 for b in k[1:-1]])
+    (alphas, betas) = spring_chain(k)
 
-    (alphas_k, _, V, _) = qr_algorithm(alphas, betas)
+    (alphas_k, _, V, _) = qr_algorithm(alphas, betas, epsilon = 1e-6)
 
     initial_conditions = [np.array([-2.0, -3.0, -1.0, -3.0, -1.0, -2.0, -3.0, -1.0, -3.0, -1.0]), np.array([1.0, 10.0, -4.0, 3.0, -2.0, 1.0, 10.0, -4.0, 3.0, -2.0]), V[:, 0]]
     mass_positions = [[10 * i for i in range(0, 11)], [20 * i for i in range(0, 11)], [10 * i for i in range(0, 11)]]
     xlims = [100, 190, 100]
 
-    for (X0, P0, xlim) in zip(initial_conditions, mass_positions, xlims):
+    time = np.linspace(0, 10, int(10 / 0.025))
+    solutions = modal_response(alphas_k, V, np.transpose(initial_conditions), time)
+
+    for (index, (X0, P0, xlim)) in enumerate(zip(initial_conditions, mass_positions, xlims)):
         print(f"      Exibindo gráfico para X(0) = {X0}")
-        Y0 = np.matmul(np.transpose(V), X0)
-        
-        time = np.linspace(0, 10, int(10 / 0.025))
-        solution = np.array([[sum([V[i][j] * Y0[j] * np.cos(np.sqrt(alphas_k[j]) * t) for j in range(10)]) for t in time] for i in range(10)])
+        solution = solutions[index]
 
         fig, axes = plt.subplots(2, 3)
         plt.figtext(0.5, .94, 'Deslocamento da Mola em relação ao Equilíbrio', fontsize = 10, ha = "center")
@@ -837,87 +625,21 @@ def plot_3():
         if option != 'n' and option != 'N':
             print("")
 
-            time = []
-            solution = [[], [], [], [], [], [], [], [], [], []]
+            time = np.arange(400 if EXPORT else 4800) * 0.025
+            solution = modal_response(alphas_k, V, X0, time)
+            setup = partial(springs_figure, P0 = P0, xlim = xlim, left = -15)
+
+            if EXPORT:
+                path = export_animation(setup, (time, solution), len(time), export_path(EXPORT, f"molas10_{index + 1}"))
+                print(f"      Animação salva em: {path}\n")
+                continue
 
             fig = plt.figure()
             fig.set_size_inches(18.5, 10.5)
-            fig.suptitle("Evolução do Sistema no Tempo")
-
-            ax = fig.add_subplot(111)
-            ax.set_yticks([])
-            ax.set_xlim(-15, xlim)
-            ax.set_ylim(-1, 1)
-
-            mat = ax.plot([], [], 'o')
-                 
-            mola1 = plot_spring(0, 1, ax)
-            mola2 = plot_spring(0, 1, ax)
-            mola3 = plot_spring(0, 1, ax)
-            mola4 = plot_spring(0, 1, ax)
-            mola5 = plot_spring(0, 1, ax)
-            mola6 = plot_spring(0, 1, ax)
-            mola7 = plot_spring(0, 1, ax)
-            mola8 = plot_spring(0, 1, ax)
-            mola9 = plot_spring(0, 1, ax)
-            molapar1 = plot_spring(0, 1, ax)
-            molapar2 = plot_spring(0, 1, ax)
-
-            patches = list(mola1) + list(mola2) + list(mola3) + list(mola4) + list(mola5) + list(mola6) + list(mola7) + list(mola8) + list(mola9) + list(molapar1) + list(molapar2) + list(mat)
-
-            def init():
-                global time
-                global solution
-                time = []
-                solution = [[], [], [], [], [], [], [], [], [], []]
-                mat[0].set_data([], [])
-
-                return patches
-
-            def animate(index):
-                t = index * 0.025
-                time.append(t)
-
-                for i in range(10):
-                    solution[i].append(sum([V[i][j] * Y0[j] * np.cos(np.sqrt(alphas_k[j]) * t) for j in range(10)]))
-
-                X = np.array([P0[i] + solution[i][index] for i in range(10)])
-                Y = np.zeros(np.shape(X))
-
-                mat[0].set_data(X,Y)
-
-                a = plot_spring(X[0], X[1], ax)[0]
-                b = plot_spring(X[1], X[2], ax)[0]
-                c = plot_spring(X[2], X[3], ax)[0]
-                d = plot_spring(X[3], X[4], ax)[0]
-                e = plot_spring(X[4], X[5], ax)[0]
-                f = plot_spring(X[5], X[6], ax)[0]
-                g = plot_spring(X[6], X[7], ax)[0]
-                h = plot_spring(X[7], X[8], ax)[0]
-                i = plot_spring(X[8], X[9], ax)[0]
-                j = plot_spring(-15, X[0], ax)[0]
-                k = plot_spring(X[9], xlim, ax)[0]
-
-                mola1[0].set_data(a.get_xdata(), a.get_ydata())
-                mola2[0].set_data(b.get_xdata(), b.get_ydata())
-                mola3[0].set_data(c.get_xdata(), c.get_ydata())
-                mola4[0].set_data(d.get_xdata(), d.get_ydata())
-                mola5[0].set_data(e.get_xdata(), e.get_ydata())
-                mola6[0].set_data(f.get_xdata(), f.get_ydata())
-                mola7[0].set_data(g.get_xdata(), g.get_ydata())
-                mola8[0].set_data(h.get_xdata(), h.get_ydata())
-                mola9[0].set_data(i.get_xdata(), i.get_ydata())
-                molapar1[0].set_data(j.get_xdata(), j.get_ydata())
-                molapar2[0].set_data(k.get_xdata(), k.get_ydata())
-
-                return patches
-
-            anim = FuncAnimation(fig, animate, init_func=init, frames=1000000, interval=10, blit=True)
+            anim = FuncAnimation(fig, setup(fig, (time, solution)), frames = len(time), interval = 10, blit = True)
 
             plt.show()
 
-import sys
-
 if __name__ == "__main__":
     np.set_printoptions(precision = 12, linewidth = 200, suppress = True, sign = ' ')
 
@@ -995,7 +717,7 @@ if __name__ == "__main__":
       Utilizar deslocamento espectral? (S/n): """) == 'n':
             spectralShift = False
 
-        (alphas_k, betas_k, V, iterations_w) = qr_algorithm(alphas, betas, spectralShift)
+        (alphas_k, betas_k, V, iterations_w) = qr_algorithm(alphas, betas, spectralShift = spectralShift, epsilon = 1e-6)
 
         print("""
       Matriz a ser diagonalizada:
@@ -1,323 +1,54 @@
+import os
+import sys
 import numpy as np
-from typing import Tuple
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from math import copysign, pi
-from functools import reduce
-
-
-def sgn(x):
-    """
-    Função Sinal
-    ------------
-
-    `sgn(x)` retorna 1 se x >= 0, -1 caso contrário.
-    """
-    return copysign(1, x)
-
-
-def qr_factorization(
-    alphas: np.array, betas: np.array
-) -> Tuple[np.array, np.array, np.array, np.array]:
-    """
-    Fatoração QR
-    ------------
-    Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
-    sua diagonal principal e sua sobrediagonal, retorna sua fatoração QR utilizando rotações de Givens.
-
-    A matriz Q é retornada por meio de dois vetores `c_ks` e `s_ks` que recebem os cossenos e senos utilizados em cada etapa da
-    fatoração. A matriz R, triangular superior, é retornada em dois vetores que armazenam sua diagonal principal e a
-    sobrediagonal. A diagonal extra que é adicionada pela aplicação das rotações de Givens não foi calculada pois não
-    será necessárias para a implementação do algoritmo QR.
-
-    Parâmetros
-    ----------
-
-    alphas  :   np.array
-        Vetor que armazena as entradas da diagonal principal da matriz.
-
-    betas   :   np.array
-        Vetor que armazena as entradas da sobrediagonal da matriz.
-
-    Retorna
-    -------
-    (c_ks, s_ks, alphas, betas) : Tuple[np.array, np.array, np.array, np.array]
-        Quadra que retorna os vetores `c_ks` e `s_ks`, que são os cossenos e senos utilizados nas rotações de Givens,
-        e `alphas` e `betas`, que retornam a representação da matriz R.
-    """
-    c_ks, s_ks = [], []
-    (alphas, betas) = (alphas.copy(), betas.copy())
-
-    for k in range(len(alphas) - 1):
-        if abs(alphas[k]) > abs(betas[k]):
-            tau_k = -betas[k] / alphas[k]
-            c_ks.append(1 / np.sqrt(1 + tau_k ** 2))
-            s_ks.append(tau_k * c_ks[k])
-        else:
-            tau_k = -alphas[k] / betas[k]
-            s_ks.append(1 / np.sqrt(1 + tau_k ** 2))
-            c_ks.append(tau_k * s_ks[k])
-
-        alphas[k] = c_ks[k] * alphas[k] - s_ks[k] * betas[k]
-        betas[k] *= c_ks[k - 1] if k > 0 else 1
-        (alphas[k + 1], betas[k]) = (
-            s_ks[k] * betas[k] + c_ks[k] * alphas[k + 1],
-            c_ks[k] * betas[k] - s_ks[k] * alphas[k + 1],
-        )
-
-    return (np.array(c_ks), np.array(s_ks), alphas, betas)
-
-
-def update_matrix(
-    c_ks: np.array, s_ks: np.array, alphas: np.array, betas: np.array
-) -> Tuple[np.array, np.array]:
-    """
-    Atualização da matriz
-    ------------
-    Dada uma matriz triangular superior, representada por dois vetores `alphas` e `betas`, que armazenam
-    sua diagonal principal e sua sobrediagonal, e as matrizes de rotação de Givens, representadas por dois
-    vetores com senos e cossenos utilizados a cada rotação, retorna uma nova matriz tridiagonal simétrica.
-
-    Os valores fora das diagonais mencionadas, mas pertencentes ao triângulo superior da matriz não são
-    utilizados para o cálculo dos valores na nova matriz.
-
-    A matriz é retornada por meio de dois vetores, `alphas` e `betas`, que recebem sua diagonal principal
-    e sua sobrediagonal, respectivamente.
-
-    Parâmetros
-    ----------
-
-    c_ks    :   np.array
-        Vetor que armazena os cossenos utilizados nas rotações de Givens.
-
-    s_ks    :   np.array
-        Vetor que armazena os senos utilizados nas rotações de Givens.
-
-    alphas  :   np.array
-        Vetor que armazena as entradas da diagonal principal da matriz.
-
-    betas   :   np.array
-        Vetor que armazena as entradas da sobrediagonal da matriz.
-
-    Retorna
-    -------
-    (alphas, betas) : Tuple[np.array, np.array]
-        Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
-        tridiagonal simétrica, através de sua diagonal principal e sua sobrediagonal.
-    """
-    (alphas, betas) = (alphas.copy(), betas.copy())
-
-    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
-        (alphas[i], betas[i], alphas[i + 1]) = (
-            c * alphas[i] - s * betas[i],
-            -s * alphas[i + 1],
-            c * alphas[i + 1],
-        )
-
-    return (alphas, betas)
-
-
-def update_eigenvectors(V: np.array, c_ks: np.array, s_ks: np.array) -> np.array:
-    """
-    Atualização dos Autovetores da Matriz
-    -------------------------------------
-    Dada uma matriz V, que armazena os autovetores encontrados até a `(k-1)-ésima` iteração do algoritmo QR, atualiza-os
-    por meio das rotações inversas de Givens, que são construídas a partir de operações nas colunas com os cossenos e
-    senos obtidos anteriormente pela fatoração QR.
-
-    Parâmetros
-    ----------
-
-    V   :   np.array
-        Matriz cujas colunas são os autovetores encontrados até a `(k-1)ésima` iteração do algoritmo QR.
-
-    c_ks    :   np.array
-        Vetor que armazena os cossenos utilizados nas rotações de Givens.
-
-    s_ks    :   np.array
-        Vetor que armazena os senos utilizados nas rotações de Givens.
-
-    Retorna
-    -------
-
-    V_k :   np.array
-        Matriz cujas colunas são os autovetores atualizados até a `k=ésima` iteração do algoritmo QR.
-    """
-    V_k = V.copy()
-    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
-        (V_k[:, i], V_k[:, i + 1]) = (
-            c * V_k[:, i] - s * V_k[:, i + 1],
-            s * V_k[:, i] + c * V_k[:, i + 1],
-        )
-    return V_k
-
-
-def wilkinson_h(alphas: np.array, betas: np.array) -> float:
-    """
-    Coeficientes de Deslocamento Espectral
-    --------------------------------------
-    Dada a matriz A, representada por seus valores da diagonal principal e sobrediagonal com os vetores `alphas` e `betas`,
-    calcula o valor do coeficiente de deslocamento espectral da `k-ésima` iteração por meio da heurística de Wilkinson.
-
-    Parâmetros
-    ----------
-
-    alphas  :   np.array
-        Vetor da diagonal principal da matriz A.
-
-    betas   :   np.array
-        Vetor da sobrediagonal da matriz A.
-
-    Retorna
-    -------
-
-    mu_k   :   float
-        Valor do coeficiente de deslocamento espectral para a `k-ésima` iteração.
+from matplotlib.collections import LineCollection
+from math import pi
+from functools import lru_cache, partial
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+from eigen import (
+    connected_components,
+    is_binary,
+    lobpcg,
+    mass_normalize,
+    open_binary,
+    pack_rows,
+    read_text,
+    shift_invert,
+    solve,
+    solve_components,
+    solve_generalized,
+    tridiagonalization,
+    unpack,
+)
+from render import EXPORT, export_animation, export_path
+
+
+def dense(matrix):
     """
-    d_k = (alphas[len(alphas) - 2] - alphas[len(alphas) - 1]) / 2
-    return (
-        alphas[len(alphas) - 1]
-        + d_k
-        - sgn(d_k) * np.sqrt(d_k ** 2 + betas[len(alphas) - 2] ** 2)
-    )
-
-
-def qr_algorithm(
-    alphas: np.array,
-    betas: np.array,
-    V0: np.array,
-    spectralShift: bool = True,
-    epsilon: float = 1e-7,
-) -> Tuple[np.array, np.array, np.array, int]:
+    Retorna a matriz `matrix` como um `np.array` denso, convertendo-a se for esparsa.
     """
-    Algoritmo QR
-    --------------------------------------
-    Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
-    sua diagonal principal e sua sobrediagonal, efetua o Algoritmo QR, com ou sem deslocamento espectral, até
-    atingir um determinado erro epsilon, e retorna a matriz com os auto-valores calculados, a matriz com os
-    auto-vetores e o número total de iterações executadas pelo algoritmo
-
-    Parâmetros
-    ----------
-
-    alphas  :   np.array
-        Vetor da diagonal principal da matriz A.
-
-    betas   :   np.array
-        Vetor da sobrediagonal da matriz A.
-
-    spectralShift : bool
-        Se for True, a função executa o algoritmo com deslocamento espectral. Se for False, executa o algoritmo
-        sem deslocamento espectral.
+    return matrix.toarray() if hasattr(matrix, "toarray") else np.asarray(matrix)
 
-    epsilon : float
-        Valor utilizado para determinar convergência dos valores calculados. Quanto menor for, menor será o erro
-        do valor final calculado em relação ao ideal.
 
-    Retorna
-    -------
-
-    (alphas, betas)   :   Tuple[np.array, np.array]
-        Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
-        tridiagonal simétrica dos auto-valores, através de sua diagonal principal e sua sobrediagonal.
-
-    V : np.array
-        Matriz com os auto-vetores da matriz A.
-
-    iterations : int
-        Número de iterações executadas pelo algoritmo.
-    """
-    alphas_k = alphas.copy()
-    betas_k = betas.copy()
-    V = V0.copy()
-    mu = 0
-    iterations = 0
-    for m in reversed(range(1, len(alphas))):
-        while abs(betas_k[m - 1]) >= epsilon:
-            (c_ks, s_ks, alphas_sub, betas_sub) = qr_factorization(
-                alphas_k[: m + 1] - mu * np.ones(m + 1), betas_k[: m + 1]
-            )
-            (alphas_k[: m + 1], betas_k[: m + 1]) = update_matrix(
-                c_ks, s_ks, alphas_sub, betas_sub
-            )
-
-            alphas_k[: m + 1] += mu * np.ones(m + 1)
-
-            V = update_eigenvectors(V, c_ks, s_ks)
-
-            mu = (
-                wilkinson_h(alphas_k[: m + 1], betas_k[: m + 1]) if spectralShift else 0
-            )
-
-            iterations += 1
-
-    return (alphas_k, betas_k, V, iterations)
-
-
-def tridiagonalization(A: np.array) -> Tuple[np.array, np.array, np.array]:
-    """
-    Tridiagonalização
-    --------------------------------------
-    Dada uma matriz real simétrica, `A`, efetua a sua tridiagonalização, através de
-    subsequentes transformações de Householder, e retorna a matriz tridiagonal resultante,
-    representada pelos vetores `alphas` e `betas`: sua diagonal principal e sua sobrediagonal, respectivamente;
-    e a matriz `Ht`, resultado do produtório das matrizes de transformação de Householder à direita da identidade.
-
-    Parâmetros
-    ----------
-
-    A  :   np.array
-        Matriz real simétrica qualquer.
-
-    Retorna
-    -------
-
-    (alphas, betas, Ht)   :   Tuple[np.array, np.array, np.array]
-        Tupla que retorna os vetores `alphas` e `betas`, que representam a matriz
-        tridiagonal simétrica resultante, através de sua diagonal principal e sua sobrediagonal;
-        e `Ht`, a matriz resultante do produtório sucessivo das matrizes de transformação
-        de Householder à direita da matriz identidade.
-
-    """
-    A = A.copy()
-    alphas = []
-    betas = []
-
-    H = np.identity(np.size(A, 0))
-
-    for m in reversed(range(2, np.size(A, 0))):
-        w_i = A[1:, 0]
-
-        alphas.append(A[0, 0])
-        betas.append(-sgn(w_i[0]) * np.sqrt(np.dot(w_i, w_i)))
-
-        w_i[0] -= betas[-1]
-        w_i2 = np.dot(w_i, w_i)
-
-        A = A[1:, 1:]
-
-        for col in np.transpose(A):
-            col -= 2 * np.dot(w_i, col) / w_i2 * w_i
-
-        for row in A:
-            row -= 2 * np.dot(w_i, row) / w_i2 * w_i
-
-        for row in H[:, -m:]:
-            row -= 2 * np.dot(w_i, row) / w_i2 * w_i
-
-    alphas.extend(np.diag(A))
-    betas.append(A[1, 0])
-
-    return (np.array(alphas), np.array(betas), H)
-
-
-def matrix_from_file(filename):
+def matrix_from_file(filename, packed: bool = False):
     """
         Obtenção de matriz em arquivo
         --------------------------------------
-        Dado um arquivo `filename`, varre as linhas e monta uma matriz simétrica.
-        Observação: a formatação deve seguir à dos arquivos fornecidos
-        _input-a_ e _input-b_.
+        Dado um arquivo `filename`, lê a matriz simétrica nele contida (veja `eigen.read_text`).
+        Observação: a formatação deve seguir à dos arquivos fornecidos _input-a_ e _input-b_, ou ao
+        formato binário de `eigen.write_binary`, cujas entradas são mapeadas em memória em vez de
+        interpretadas; no formato compactado, as linhas da matriz são copiadas uma a uma, sem montar
+        a matriz densa.
 
         Parâmetros
         ----------
@@ -325,26 +56,24 @@ def matrix_from_file(filename):
         filename  :   str
             Nome do arquivo com a matriz a ser construída.
 
+        packed  :   bool
+            Se True, retorna apenas o triângulo inferior da matriz, no formato compactado de
+            `eigen.packed`: da linha `i`, apenas as entradas `A[i, i:]` são guardadas.
+
         Retorna
         -------
 
         matrix   :   np.array
-            Matriz real simétrica presente no arquivo de entrada.
+            Matriz real simétrica presente no arquivo de entrada (ou seu vetor compactado).
 
     """
-    with open(filename, encoding="utf-8") as file:
-        matrix_size: int = int(file.readline())
-        matrix = np.zeros((matrix_size, matrix_size))
-
-        treatline = lambda line: list(map(float, line.split()))
-        rows = list(
-            filter(lambda line: len(line) > 0, map(treatline, file.readlines()))
-        )
+    if is_binary(filename):
+        matrix = open_binary(filename)
+        if np.ndim(matrix) == 1:
+            return np.array(matrix) if packed else unpack(matrix)
+        return pack_rows(matrix, len(matrix)) if packed else np.array(matrix)
 
-        for i, line in enumerate(rows):
-            matrix[i, :] = line
-
-    return matrix
+    return read_text(filename, packed)
 
 
 def teste_1():
@@ -377,7 +106,7 @@ def teste_1():
         ),
     )
 
-    Lambda, _, V, _ = qr_algorithm(alphas, betas, H)
+    Lambda, _, V, _ = solve(alphas, betas, H)
 
     print(
         f"\n      Autovalores:\n\t- Encontrados:\t{np.array(sorted(Lambda, reverse = True))}\n\t- Esperados:\t{np.array([7.0, 2.0, -1.0, -2.0])}"
@@ -455,7 +184,7 @@ def teste_2():
         ),
     )
 
-    Lambda, _, V, _ = qr_algorithm(alphas, betas, H)
+    Lambda, _, V, _ = solve(alphas, betas, H)
 
     print(
         f"\n      Autovalores:\n\t- Encontrados:\t{np.array(sorted(Lambda, reverse = True))}\n\t- Esperados:\t{expectedEigenvalues}"
@@ -501,75 +230,105 @@ def teste_2():
     print("\n      Rotina de teste concluída! Obrigado pela execução!")
 
 
-def addBar(
-    i: int,
-    j: int,
-    L: float,
-    c: float,
-    s: float,
+def addBars(
+    i: np.array,
+    j: np.array,
+    L: np.array,
+    c: np.array,
+    s: np.array,
     E: float,
     p: float,
     A: float,
-    M: np.array,
-    K: np.array,
+    free_nodes: int,
 ):
     """
-        Adição das contribuições de rigidez e massa das barras
+        Montagem das contribuições de rigidez e massa das barras
         --------------------------------------
-        Dados:
-        os nós `i` e `j`, pontos extremos da barra;
-        o comprimento da barra, `L`;
-        o cosseno e o seno do ângulo que a barra forma com o eixo horizontal, `c` e `s`, respectivamente;
+        Dados, para todas as barras de uma vez:
+        os nós `i` e `j`, pontos extremos de cada barra;
+        o comprimento de cada barra, `L`;
+        o cosseno e o seno do ângulo que cada barra forma com o eixo horizontal, `c` e `s`, respectivamente;
         o módulo de Young do material, `E`;
         a densidade do material, `p`;
-        a área de seção transversal da barra, `A`;
-        as matrizes de massas e rigidez do sistema, `M` e `K`, respectivamente,
-        adiciona as contribuições de rigidez e massa da barra ao sistema.
+        a área de seção transversal das barras, `A`;
+        o número de nós livres, `free_nodes`,
+        calcula as contribuições de massa e as matrizes de rigidez locais de todas as barras como vetores e monta
+        as matrizes de massas e rigidez do sistema. Cada barra contribui com quatro blocos 2x2 para `K`, gerados
+        como triplas (linha, coluna, valor) e somados na conversão para o formato CSR. Nós de índice maior ou igual
+        a `free_nodes` são fixos e não têm graus de liberdade.
 
         Parâmetros
         ----------
 
-        `i` e `j` :   int, int
-            Índices dos nós nos pontos extremos da barra.
+        `i` e `j` :   np.array, np.array
+            Índices (a partir de 0) dos nós nos pontos extremos das barras.
 
-        `L`   :   float
-            O comprimento, em metros, da barra.
+        `L`   :   np.array
+            Os comprimentos, em metros, das barras.
 
-        `c` e `s`   :   float, float
-            O cosseno e o seno, respectivamente, do ângulo que a barra forma com o eixo horizontal.
+        `c` e `s`   :   np.array, np.array
+            Os cossenos e os senos, respectivamente, dos ângulos que as barras formam com o eixo horizontal.
 
         `E`   :   float
-            O módulo de Young, em Pa, do material que compõe a barra.
+            O módulo de Young, em Pa, do material que compõe as barras.
 
         `p`   :   float
-            A densidade, em kg/m^3, do material que compõe a barra.
+            A densidade, em kg/m^3, do material que compõe as barras.
 
         `A`   :   float
-            A área, em m^2, de seção transversal da barra.
+            A área, em m^2, de seção transversal das barras.
+
+        `free_nodes`    :   int
+            O número de nós livres do sistema.
+
+        Retorna
+        -------
 
-        `M`, `K`   :   np.array, np.array
-            As matrizes de massas e rigidez do sistema de treliças, respectivamente.
+        (M, K)  :   Tuple[np.array, scipy.sparse.csr_array]
+            As massas dos nós livres e a matriz de rigidez do sistema (densa, se o SciPy não estiver disponível).
 
     """
     mass_contribution = 0.5 * p * A * L
-    M[i] += mass_contribution
+    (free_i, free_j) = (i < free_nodes, j < free_nodes)
+    M = np.bincount(i[free_i], mass_contribution[free_i], free_nodes) + np.bincount(
+        j[free_j], mass_contribution[free_j], free_nodes
+    )
 
-    local_stiffness = (A * E) / L * np.array([[c ** 2, c * s], [c * s, s ** 2]])
-    K[2 * i : 2 * i + 2, 2 * i : 2 * i + 2] += local_stiffness
+    local_stiffness = ((A * E) / L)[:, None, None] * np.stack(
+        (np.stack((c ** 2, c * s), -1), np.stack((c * s, s ** 2), -1)), 1
+    )
+    (di, dj) = np.meshgrid([0, 1], [0, 1], indexing="ij")
+    both = free_i & free_j
+
+    rows, cols, values = [], [], []
+    for (a, b, sign, mask) in (
+        (i, i, 1, free_i),
+        (j, j, 1, free_j),
+        (i, j, -1, both),
+        (j, i, -1, both),
+    ):
+        rows.append((2 * a[mask, None, None] + di).ravel())
+        cols.append((2 * b[mask, None, None] + dj).ravel())
+        values.append(sign * local_stiffness[mask].ravel())
+    (rows, cols, values) = map(np.concatenate, (rows, cols, values))
 
-    if j in range(len(M)):
-        M[j] += mass_contribution
-        K[2 * i : 2 * i + 2, 2 * j : 2 * j + 2] += -local_stiffness
-        K[2 * j : 2 * j + 2, 2 * i : 2 * i + 2] += -local_stiffness
-        K[2 * j : 2 * j + 2, 2 * j : 2 * j + 2] += local_stiffness
+    if sparse is None:
+        K = np.zeros((2 * free_nodes, 2 * free_nodes))
+        np.add.at(K, (rows, cols), values)
+        return M, K
 
+    K = sparse.coo_array(
+        (values, (rows, cols)), shape=(2 * free_nodes, 2 * free_nodes)
+    ).tocsr()
+    return M, K
 
-def truss_from_file(filename):
+
+def truss_from_file(filename, chunk: int = 2 ** 16):
     """
         Obtenção de treliça em arquivo
         --------------------------------------
-        Dado um arquivo `filename`, varre as linhas e monta as matrizes de massas e
-        rigidez do sistema de nós de uma treliça.
+        Dado um arquivo `filename`, lê as barras em blocos de `chunk` linhas, cada bloco convertido de uma só vez
+        em um vetor, e monta as matrizes de massas e rigidez do sistema de nós de uma treliça (veja `addBars`).
         Observação: a formatação deve seguir à do arquivo fornecido _input-c_.
 
         Parâmetros
@@ -578,15 +337,19 @@ def truss_from_file(filename):
         filename  :   str
             Nome do arquivo com as barras da treliça.
 
+        chunk   :   int
+            Número de linhas de barras lidas de cada vez.
+
         Retorna
         -------
 
-        (M, K, total_nodes, free_nodes, bars)   :   Tuple[np.array, np.array, int, int, int]
+        (M, K, total_nodes, free_nodes, bars)   :   Tuple[np.array, np.array, int, int, np.array]
             Tupla que retorna:
-            as matrizes de massa e rigidez do sistema, `M` e `K`, respectivamente;
+            as matrizes de massa e rigidez do sistema, `M` e `K`, respectivamente (`K` esparsa, no formato CSR,
+            se o SciPy estiver disponível);
             o número total de nós do sistema, `total_nodes`;
             o número de nós livres do sistema, `free_nodes`;
-            o número de barras do sistema, `bars`.
+            as barras do sistema, `bars`, uma por linha: (i, j, ângulo em graus, comprimento).
 
     """
     with open(filename, encoding="utf-8") as file:
@@ -594,28 +357,215 @@ def truss_from_file(filename):
         p, A, E = map(float, file.readline().split())
         E *= 1e9
 
-        treatline = lambda line: tuple(map(int, line.split()[:2])) + tuple(
-            map(float, line.split()[2:])
-        )
-        bars = list(
-            filter(lambda line: len(line) > 0, map(treatline, file.readlines()))
-        )
+        blocks = [np.zeros((0, 4))]
+        while True:
+            lines = list(islice(file, chunk))
+            if not lines:
+                break
+            blocks.append(np.fromstring("".join(lines), sep=" ").reshape(-1, 4))
 
-        K = np.zeros((2 * free_nodes, 2 * free_nodes), float)
-        M = np.zeros(free_nodes, float)
-
-        for bar in bars:
-            (i, j, theta, L) = bar
-            theta = np.deg2rad(theta)
-            addBar(i - 1, j - 1, L, np.cos(theta), np.sin(theta), E, p, A, M, K)
+    bars = np.concatenate(blocks)
+    M, K = truss_from_arrays(bars, free_nodes, p, A, E)
 
     return M, K, total_nodes, free_nodes, bars
 
 
+def truss_from_arrays(bars: np.array, free_nodes: int, p: float, A: float, E: float):
+    """
+        Montagem de treliça a partir das barras
+        --------------------------------------
+        Monta as matrizes de massas e rigidez (veja `addBars`) de uma treliça dada diretamente pelas suas barras,
+        no formato de `truss_from_file` (por exemplo, geradas pelo módulo `trusses`), sem passar por um arquivo.
+
+        Parâmetros
+        ----------
+
+        bars    :   np.array
+            As barras da treliça, uma por linha: (i, j, ângulo em graus, comprimento), com os nós a partir de 1.
+
+        free_nodes    :   int
+            O número de nós livres do sistema.
+
+        `p`, `A` e `E`   :   float, float, float
+            A densidade, em kg/m^3, a área de seção transversal, em m^2, e o módulo de Young, em Pa, das barras.
+
+        Retorna
+        -------
+
+        (M, K)  :   Tuple[np.array, scipy.sparse.csr_array]
+            As massas dos nós livres e a matriz de rigidez do sistema.
+
+    """
+    i, j = bars[:, 0].astype(int) - 1, bars[:, 1].astype(int) - 1
+    theta = np.deg2rad(bars[:, 2])
+
+    return addBars(i, j, bars[:, 3], np.cos(theta), np.sin(theta), E, p, A, free_nodes)
+
+
+def truss_material(filename):
+    """
+        Retorna a densidade `p`, em kg/m^3, a área de seção transversal `A`, em m^2, e o módulo de Young `E`, em Pa,
+        comuns a todas as barras da treliça descrita no arquivo `filename` (no formato de `truss_from_file`).
+    """
+    with open(filename, encoding="utf-8") as file:
+        file.readline()
+        p, A, E = map(float, file.readline().split())
+    return p, A, E * 1e9
+
+
+@lru_cache(maxsize=8)
+def truss_solution(filename, mtime: int, k: int = None):
+    """
+        Resolve o problema generalizado `K z = λ M z` da treliça do arquivo `filename` com o seu material e seção:
+        pelo método LOBPCG pré-condicionado pela fatoração esparsa de `K` (veja `eigen.lobpcg`), se `k` for dado, ou
+        por `eigen.solve_generalized`, para todos os autovalores. Os 8 resultados mais recentes ficam guardados em
+        memória, um para cada trio (`filename`, `mtime`, `k`), com os vetores somente para leitura (veja
+        `truss_reference`).
+    """
+    M, K, _, _, _ = truss_from_file(filename)
+    M = np.repeat(M, 2)
+    if k is None:
+        Lambda, Z = solve_generalized(K, M)
+    else:
+        Lambda, Z, _ = lobpcg(K, M, k=k, preconditioner=shift_invert(K))
+
+    Lambda.setflags(write=False)
+    Z.setflags(write=False)
+    return Lambda, Z, truss_material(filename)
+
+
+def truss_reference(filename, k: int = None):
+    """
+        Solução de referência de uma treliça
+        --------------------------------------
+        Monta a treliça do arquivo `filename` (veja `truss_from_file`) com o seu material e seção e resolve o
+        problema generalizado `K z = λ M z` uma única vez por versão do arquivo (veja `truss_solution`): o resultado
+        é guardado em memória com a data de modificação do arquivo na chave, de modo que alterações posteriores no
+        arquivo levam a uma nova solução. Os vetores retornados são compartilhados entre as chamadas e, por isso,
+        somente para leitura; use `np.array(Z)` para obter uma cópia modificável.
+
+        Parâmetros
+        ----------
+
+        filename  :   str
+            Nome do arquivo com as barras da treliça.
+
+        k   :   int
+            Se dado, apenas os `k` menores autovalores e seus modos são calculados.
+
+        Retorna
+        -------
+
+        (Lambda, Z, material)   :   Tuple[np.array, np.array, Tuple[float, float, float]]
+            Os autovalores em ordem crescente, os modos `M`-ortonormais nas colunas de `Z` e o material de
+            referência, (p, A, E).
+
+    """
+    filename = os.path.abspath(filename)
+    return truss_solution(filename, os.stat(filename).st_mtime_ns, k)
+
+
+def truss_rescaled(filename, p: float, A: float, E: float, k: int = None):
+    """
+        Frequências e modos de uma treliça para outro material ou seção
+        --------------------------------------
+        Como `p`, `A` e `E` são os mesmos para todas as barras, `K` é proporcional a `A E` e `M`, a `p A`: trocar o
+        material ou a seção apenas multiplica as duas matrizes por constantes. Os autovalores ficam multiplicados por
+        `(E / p) / (E0 / p0)`, sem depender da área, e os modos são os mesmos, divididos por `sqrt(p A / (p0 A0))`
+        para continuarem `M`-ortonormais. A resposta é exata e obtida da solução de referência de
+        `truss_reference`, sem resolver um novo problema de autovalores; os vetores retornados são cópias novas.
+
+        Parâmetros
+        ----------
+
+        filename  :   str
+            Nome do arquivo com as barras da treliça.
+
+        `p`, `A` e `E`   :   float, float, float
+            A densidade, em kg/m^3, a área de seção transversal, em m^2, e o módulo de Young, em Pa, das barras.
+
+        k   :   int
+            Se dado, apenas os `k` menores autovalores e seus modos são retornados.
+
+        Retorna
+        -------
+
+        (Lambda, Z)   :   Tuple[np.array, np.array]
+            Os autovalores em ordem crescente e os modos `M`-ortonormais correspondentes, nas colunas de `Z`.
+
+    """
+    Lambda, Z, (p0, A0, E0) = truss_reference(filename, k)
+    return Lambda * ((E * p0) / (E0 * p)), Z / np.sqrt((p * A) / (p0 * A0))
+
+
+def mode_frames(X0, Y0, mode: np.array, bars: np.array, frames: int = 60):
+    """
+        Quadros da animação de um modo de vibração
+        --------------------------------------
+        Calcula de uma só vez, por um produto externo, as posições dos nós da treliça em `frames` instantes
+        igualmente espaçados de um período da oscilação `u(t) = mode cos(ω t)`, e os segmentos de reta das barras
+        em cada instante, prontos para um `LineCollection`: cada quadro da animação apenas indexa esses vetores.
+
+        Parâmetros
+        ----------
+
+        `X0` e `Y0` :   np.array, np.array
+            As coordenadas de equilíbrio de todos os nós, na numeração do arquivo (os nós livres primeiro).
+
+        mode    :   np.array
+            O deslocamento dos nós livres, (x, y) de cada nó, na amplitude desejada.
+
+        bars    :   np.array
+            As barras, no formato de `truss_from_file`.
+
+        frames  :   int
+            O número de quadros por período.
+
+        Retorna
+        -------
+
+        (positions, segments)   :   Tuple[np.array, np.array]
+            As posições dos nós em cada quadro, `frames x nós x 2`, e os segmentos das barras em cada quadro,
+            `frames x barras x 2 x 2`.
+
+    """
+    nodes = np.column_stack((X0, Y0)).astype(float)
+    displacement = np.zeros_like(nodes)
+    displacement.ravel()[: len(mode)] = mode
+
+    phases = np.cos(2 * pi * np.arange(frames) / frames)
+    positions = nodes + np.multiply.outer(phases, displacement)
+    return positions, positions[:, bars[:, :2].astype(int) - 1]
+
+
+def truss_figure(fig, trajectory, title: str = ""):
+    """
+        Cria, na figura `fig`, os artistas da animação de uma treliça: todas as barras em um único `LineCollection`
+        e os nós em uma única linha de marcadores, com os eixos ajustados a todo o movimento. A trajetória é a tupla
+        `(positions, segments)` de `mode_frames`. Retorna a função `animate(index)`, que leva os artistas ao quadro
+        `index` e os retorna (para o `FuncAnimation` ou para a exportação em `render`).
+    """
+    positions, segments = trajectory
+    fig.suptitle(title)
+
+    ax = fig.add_subplot(111)
+    lines = ax.add_collection(LineCollection(segments[0], colors="k"))
+    (mat,) = ax.plot(positions[0, :, 0], positions[0, :, 1], "o")
+    ax.update_datalim(positions.reshape(-1, 2))
+    ax.autoscale_view()
+
+    def animate(index):
+        lines.set_segments(segments[index])
+        mat.set_data(positions[index, :, 0], positions[index, :, 1])
+        return lines, mat
+
+    return animate
+
+
 def teste_3():
     """"
-        Realiza a rotina de testes para a aplicação de Treliças. Realiza a tridiagonalização, aplica o Algoritmo QR e mostra autovalores, autovetores, encontra frequências e modos de vibração.
-        Por fim, cria e exibe a animação da oscilação da treliça.
+        Realiza a rotina de testes para a aplicação de Treliças. Resolve o problema generalizado K z = λ M z pelo método LOBPCG sobre o par (K, M), pré-condicionado pela fatoração esparsa de K (veja `eigen.lobpcg` e `truss_reference`), e mostra os 5 menores autovalores, frequências e modos de vibração, além das frequências da mesma treliça em outros materiais, obtidas sem novos problemas de autovalores (veja `truss_rescaled`).
+        Por fim, cria e exibe a animação da oscilação da treliça (ou, com a variável de ambiente ANIMATION_EXPORT, grava-a sem janela; veja `render.export_animation`).
 
         Não há parâmetros nem retorno.
     """
@@ -629,49 +579,36 @@ def teste_3():
     M, K, total_nodes, free_nodes, bars = truss_from_file("input-c")
 
     print("""\n      Matriz de Rigidez (K):\n""")
-    print("     K = ", np.array2string(K, prefix="          "))
+    print("     K = ", np.array2string(dense(K), prefix="          "))
 
     print("""\n      Matriz de Massa (M):\n""")
     print("     M = ", np.array2string(np.diag(M), prefix="          "))
 
-    M = 1.0 / np.sqrt(M)
-
-    for i in range(2 * len(M)):
-        for j in range(2 * len(M)):
-            K[i, j] *= M[i // 2] * M[j // 2]
+    M = np.repeat(M, 2)
 
     print("""\n      Matriz da Equação Diferencial (K~):\n""")
-    print("      K~ = ", np.array2string(K, prefix="            "))
-
-    alphas, betas, H = tridiagonalization(K)
-    Lambda, _, V, _ = qr_algorithm(alphas, betas, H)
-
-    print("""\n      K~ Tridiagonalizado:\n""")
     print(
-        "      HK~Ht = ",
-        np.array2string(
-            np.diag(alphas) + np.diag(betas, -1) + np.diag(betas, 1),
-            prefix="               ",
-        ),
+        "      K~ = ",
+        np.array2string(dense(mass_normalize(K, M)[0]), prefix="            "),
     )
-    print(f"\n      Autovalores Encontrados: {np.array(sorted(Lambda))}")
 
-    frequencies = list(map(np.sqrt, sorted(Lambda)))
-    eigenvalues = sorted(Lambda)[:5]
-    modes = []
+    Lambda, Z, (p, A, E) = truss_reference("input-c", 5)
 
-    for i in map(lambda eig: list(Lambda).index(eig), eigenvalues):
-        modes.append(V[:, i])
+    print(f"\n      5 menores Autovalores Encontrados: {Lambda}")
 
-    for mode in modes:
-        for i in range(len(mode)):
-            mode[i] *= M[i // 2]
+    frequencies = list(map(np.sqrt, Lambda))
+    modes = list(Z.T)
 
     print(f"\n      5 menores Frequências Encontrados: {frequencies[:5]}")
     print("""\n      Modos de vibração associados às 5 menores frequências:\n""")
 
     print("      Z = ", np.array2string(np.array(modes).transpose(), prefix="         "))
 
+    print("""\n      5 menores Frequências para outros materiais, com a mesma seção:\n""")
+    for name, p_material, E_material in (("Alumínio", 2700.0, 70e9), ("Titânio", 4500.0, 110e9)):
+        Lambda_material, _ = truss_rescaled("input-c", p_material, A, E_material, k=5)
+        print(f"      {name}: {np.sqrt(Lambda_material)}")
+
     if (
         str(
             input(
@@ -687,10 +624,7 @@ def teste_3():
             print(f"\n      Exibindo a {titles[i]} animação!")
 
             freq = frequencies[i]
-            mode = modes[i]
-
-            for j in range(len(mode)):
-                mode[j] *= scale[i]
+            mode = scale[i] * modes[i]
 
             print(f"\n      Frequência natural de oscilação: {freq:.4f} rad/s")
             print(f"      Modo de vibração:")
@@ -700,54 +634,46 @@ def teste_3():
                 f"\n      Iremos excitar a treliça com uma condição inicial igual a {scale[i]} vezes o modo de oscilação associado a esta frequência."
             )
 
-            print(
-                f"\n      Animação aberta. Por favor, feche a janela para prosseguir."
-            )
-
-            fig = plt.figure()
-            fig.set_size_inches(18.5, 10.5)
-            fig.suptitle(f"Evolução do Sistema no Tempo - Frequência: {freq:.4f}")
-
             X0 = [15, 5, 25, 15, 5, -5, 25, 15, 5, -5, 15, 5, 20, 0]
             Y0 = [40, 40, 30, 30, 30, 30, 20, 20, 20, 20, 10, 10, 0, 0]
 
-            bar_lines = [0] * len(bars)
-
-            ax = fig.add_subplot(111)
-
-            mat = ax.plot(X0, Y0, "o")
+            trajectory = mode_frames(X0, Y0, mode, bars)
+            setup = partial(
+                truss_figure,
+                title=f"Evolução do Sistema no Tempo - Frequência: {freq:.4f}",
+            )
 
-            for k, (i, j, _, _) in enumerate(bars):
-                bar_lines[k] = ax.plot(
-                    [X0[i - 1], X0[j - 1]], [Y0[i - 1], Y0[j - 1]], c="k"
+            if EXPORT:
+                path = export_animation(
+                    setup,
+                    trajectory,
+                    len(trajectory[0]),
+                    export_path(EXPORT, f"trelica_modo{i + 1}"),
+                    fps=50,
                 )
+                print(f"\n      Animação salva em: {path}")
+                continue
 
-            patch = reduce(lambda a, b: a + b, bar_lines) + list(mat)
-
-            def animate(index):
-                t = index / (2 * pi * freq)
-                solution = [mode[j] * np.cos(freq * t) for j in range(24)]
-                solution += (0, 0, 0, 0)
-
-                X = np.array([X0[i // 2] + solution[i] for i in range(0, 28, 2)])
-
-                Y = np.array([Y0[i // 2] + solution[i] for i in range(1, 28, 2)])
-
-                for k, (i, j, _, _) in enumerate(bars):
-                    bar_lines[k][0].set_data([X[i - 1], X[j - 1]], [Y[i - 1], Y[j - 1]])
-
-                mat[0].set_data(X, Y)
-
-                return patch
+            print(
+                f"\n      Animação aberta. Por favor, feche a janela para prosseguir."
+            )
 
-            anim = FuncAnimation(fig, animate, frames=600000, interval=1, blit=True)
+            fig = plt.figure()
+            fig.set_size_inches(18.5, 10.5)
+            anim = FuncAnimation(
+                fig,
+                setup(fig, trajectory),
+                frames=len(trajectory[0]),
+                interval=20,
+                blit=True,
+            )
             plt.show()
     print("\n      Rotina de teste concluída! Obrigado pela execução!")
 
 
 def teste_4():
     """"
-        Realiza a rotina de testes para o Teste com Matriz Simétrica Arbitrária. Realiza a tridiagonalização, aplica o Algoritmo QR e mostra autovalores, autovetores, o teste da definição de autovalor-autovetor e teste de ortogonalidade.
+        Realiza a rotina de testes para o Teste com Matriz Simétrica Arbitrária. Realiza a tridiagonalização, aplica o Algoritmo QR (em cada bloco desacoplado da matriz, se houver mais de um; veja `eigen.solve_components`) e mostra autovalores, autovetores, o teste da definição de autovalor-autovetor e teste de ortogonalidade.
 
         Não há parâmetros nem retorno.
     """
@@ -817,18 +743,26 @@ def teste_4():
         print("""      Matriz de entrada:\n""")
         print("     ", np.array2string(matrix, prefix="      "))
 
-    alphas, betas, H = tridiagonalization(matrix)
+    components, _ = connected_components(matrix)
 
-    print("""\n      Matriz tridiagonalizada:\n""")
-    print(
-        "     ",
-        np.array2string(
-            np.diag(betas, k=1) + np.diag(betas, k=-1) + np.diag(alphas),
-            prefix="      ",
-        ),
-    )
+    if components > 1:
+        print(
+            f"\n      A matriz tem {components} blocos desacoplados, resolvidos separadamente."
+        )
+        Lambda, V, _ = solve_components(matrix)
+    else:
+        alphas, betas, H = tridiagonalization(matrix)
 
-    Lambda, _, V, _ = qr_algorithm(alphas, betas, H)
+        print("""\n      Matriz tridiagonalizada:\n""")
+        print(
+            "     ",
+            np.array2string(
+                np.diag(betas, k=1) + np.diag(betas, k=-1) + np.diag(alphas),
+                prefix="      ",
+            ),
+        )
+
+        Lambda, _, V, _ = solve(alphas, betas, H)
 
     print(
         f"\n      Autovalores Encontrados:\t{np.array(sorted(Lambda, reverse = True))}"
@@ -871,8 +805,6 @@ def teste_4():
     print("\n      Rotina de teste concluída! Obrigado pela execução!")
 
 
-import sys
-
 if __name__ == "__main__":
     """"
         Função Principal
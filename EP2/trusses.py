@@ -0,0 +1,234 @@
+"""
+Gerador de Treliças
+===================
+Famílias parametrizadas de treliças planas (torres, pontes Pratt e Warren e malhas), de 10 a 10^6 nós, para gerar
+cargas de trabalho realistas e escaláveis na montagem das matrizes e nos algoritmos de autovalores.
+
+Cada gerador retorna `(X, Y, bars, free_nodes)`: as coordenadas dos nós, em metros, as barras no mesmo formato de
+`truss_from_file` (uma por linha: nós `i` e `j`, a partir de 1, ângulo em graus e comprimento) e o número de nós
+livres. Como em _input-c_, os nós livres vêm primeiro e os fixos (apoios), por último. Com `jitter > 0`, as
+coordenadas são perturbadas aleatoriamente, de forma determinística para cada `seed`.
+"""
+from typing import Tuple
+
+import numpy as np
+
+FAMILIES = ("tower", "pratt", "warren", "grid")
+
+
+def bars_from_nodes(X: np.array, Y: np.array, I: np.array, J: np.array) -> np.array:
+    """
+    Retorna as barras entre os nós `I` e `J` (índices a partir de 0) no formato de `truss_from_file`: os índices a
+    partir de 1, o ângulo, em graus no intervalo [0, 180), da direção de `j` para `i` com o eixo horizontal e o
+    comprimento.
+    """
+    (dx, dy) = (X[I] - X[J], Y[I] - Y[J])
+    angle = np.mod(np.degrees(np.arctan2(dy, dx)), 180)
+    return np.column_stack((I + 1, J + 1, angle, np.hypot(dx, dy)))
+
+
+def number_nodes(
+    X: np.array,
+    Y: np.array,
+    I: np.array,
+    J: np.array,
+    fixed: np.array,
+    jitter: float = 0.0,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Renumera os nós para que os livres venham antes dos fixos (mantendo a ordem relativa de cada grupo), perturba
+    as coordenadas por `jitter` vezes um deslocamento normal padrão, com a semente `seed`, e retorna
+    `(X, Y, bars, free_nodes)`.
+    """
+    order = np.argsort(fixed, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    (X, Y) = (np.asarray(X, dtype=float)[order], np.asarray(Y, dtype=float)[order])
+    if jitter > 0:
+        noise = np.random.default_rng(seed).standard_normal((2, len(X)))
+        (X, Y) = (X + jitter * noise[0], Y + jitter * noise[1])
+
+    return (X, Y, bars_from_nodes(X, Y, rank[I], rank[J]), int(np.sum(~fixed)))
+
+
+def tower(
+    levels: int,
+    width: float = 10.0,
+    height: float = 10.0,
+    jitter: float = 0.0,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Torre de `levels` painéis de `width x height` metros, com duas colunas de nós (`2 (levels + 1)` nós),
+    montantes, travessas e contraventamento em X em cada painel. Os dois nós da base são fixos.
+    """
+    k = np.arange(levels + 1)
+    X = np.tile([0.0, width], levels + 1)
+    Y = np.repeat(height * k, 2)
+    (left, right) = (2 * k, 2 * k + 1)
+    (lower, upper) = (slice(None, -1), slice(1, None))
+
+    I = np.concatenate((left, left[lower], right[lower], left[lower], right[lower]))
+    J = np.concatenate((right, left[upper], right[upper], right[upper], left[upper]))
+    fixed = Y == 0
+    return number_nodes(X, Y, I, J, fixed, jitter * width, seed)
+
+
+def pratt(
+    panels: int,
+    length: float = 10.0,
+    height: float = 10.0,
+    jitter: float = 0.0,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Ponte Pratt de `panels` painéis de `length` metros (`panels >= 2`, `2 panels` nós): banzo inferior de
+    `panels + 1` nós, banzo superior sobre os nós interiores, montantes e diagonais descendo em direção ao centro
+    do vão. Os dois nós extremos do banzo inferior são fixos.
+    """
+    bottom = np.arange(panels + 1)
+    top = np.concatenate(([-1], panels + 1 + np.arange(panels - 1), [-1]))
+    X = length * np.concatenate((bottom, np.arange(1, panels)))
+    Y = np.concatenate((np.zeros(panels + 1), np.full(panels - 1, height)))
+
+    inner = np.arange(1, panels)
+    left = np.arange(1, (panels + 1) // 2)
+    right = np.arange(panels // 2 + 1, panels)
+    I = np.concatenate(
+        (bottom[:-1], top[1:-2], bottom[inner], [0, panels], top[left], top[right])
+    )
+    J = np.concatenate(
+        (
+            bottom[1:],
+            top[2:-1],
+            top[inner],
+            [top[1], top[panels - 1]],
+            bottom[left + 1],
+            bottom[right - 1],
+        )
+    )
+    fixed = np.isin(np.arange(len(X)), (0, panels))
+    return number_nodes(X, Y, I, J, fixed, jitter * length, seed)
+
+
+def warren(
+    panels: int,
+    length: float = 10.0,
+    height: float = 10.0,
+    jitter: float = 0.0,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Ponte Warren de `panels` painéis de `length` metros (`2 panels + 1` nós): banzo inferior de `panels + 1` nós,
+    banzo superior com um nó sobre o meio de cada painel e diagonais alternadas, formando triângulos. Os dois nós
+    extremos do banzo inferior são fixos.
+    """
+    bottom = np.arange(panels + 1)
+    top = panels + 1 + np.arange(panels)
+    X = length * np.concatenate((bottom, np.arange(panels) + 0.5))
+    Y = np.concatenate((np.zeros(panels + 1), np.full(panels, height)))
+
+    I = np.concatenate((bottom[:-1], top[:-1], bottom[:-1], top))
+    J = np.concatenate((bottom[1:], top[1:], top, bottom[1:]))
+    fixed = np.isin(np.arange(len(X)), (0, panels))
+    return number_nodes(X, Y, I, J, fixed, jitter * length, seed)
+
+
+def grid(
+    rows: int,
+    columns: int,
+    spacing: float = 10.0,
+    jitter: float = 0.0,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Malha de `rows x columns` nós espaçados de `spacing` metros, com barras horizontais, verticais e uma diagonal
+    por célula, alternando a direção como em um tabuleiro de xadrez. Os nós da linha inferior são fixos.
+    """
+    (r, c) = np.divmod(np.arange(rows * columns), columns)
+    X = spacing * c
+    Y = spacing * r
+    node = np.arange(rows * columns).reshape(rows, columns)
+
+    cells = node[:-1, :-1].ravel()
+    flip = (r[cells] + c[cells]) % 2 == 1
+    I = np.concatenate(
+        (
+            node[:, :-1].ravel(),
+            node[:-1, :].ravel(),
+            np.where(flip, cells + 1, cells),
+        )
+    )
+    J = np.concatenate(
+        (
+            node[:, 1:].ravel(),
+            node[1:, :].ravel(),
+            np.where(flip, cells + columns, cells + columns + 1),
+        )
+    )
+    fixed = r == 0
+    return number_nodes(X, Y, I, J, fixed, jitter * spacing, seed)
+
+
+def truss_model(
+    family: str, nodes: int, jitter: float = 0.0, seed: int = 0
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Gerador de Treliças
+    -------------------
+    Gera uma treliça da família `family` com aproximadamente `nodes` nós (veja `tower`, `pratt`, `warren` e
+    `grid`; as malhas são quadradas).
+
+    Parâmetros
+    ----------
+
+    family  :   str
+        Uma de `FAMILIES`.
+
+    nodes   :   int
+        Número aproximado de nós (pelo menos 4).
+
+    jitter  :   float
+        Amplitude da perturbação aleatória das coordenadas, relativa ao tamanho dos painéis.
+
+    seed    :   int
+        Semente da perturbação.
+
+    Retorna
+    -------
+
+    (X, Y, bars, free_nodes)    :   Tuple[np.array, np.array, np.array, int]
+        As coordenadas dos nós, as barras no formato de `truss_from_file` e o número de nós livres.
+    """
+    if family == "tower":
+        return tower(max(nodes // 2 - 1, 1), jitter=jitter, seed=seed)
+    if family == "pratt":
+        return pratt(max(nodes // 2, 2), jitter=jitter, seed=seed)
+    if family == "warren":
+        return warren(max((nodes - 1) // 2, 1), jitter=jitter, seed=seed)
+    if family == "grid":
+        side = max(int(round(np.sqrt(nodes))), 2)
+        return grid(side, side, jitter=jitter, seed=seed)
+    raise ValueError(f"Família desconhecida: {family}.")
+
+
+def write_truss(
+    filename: str,
+    bars: np.array,
+    total_nodes: int,
+    free_nodes: int,
+    p: float = 7800.0,
+    A: float = 0.1,
+    E: float = 200e9,
+) -> None:
+    """
+    Escreve a treliça em `filename` no formato de `truss_from_file` (e de _input-c_): o número total de nós, o de
+    nós livres e o de barras; a densidade `p`, em kg/m^3, a área `A`, em m^2, e o módulo de Young `E`, escrito em
+    GPa; e as barras, uma por linha.
+    """
+    with open(filename, "w", encoding="utf-8") as file:
+        file.write(f"{total_nodes} {free_nodes} {len(bars)}\n")
+        file.write(f"{p:.16g} {A:.16g} {E / 1e9:.16g}\n")
+        np.savetxt(file, bars, fmt=("%d", "%d", "%.16g", "%.16g"))
@@ -0,0 +1,103 @@
+"""
+Núcleo de Autovalores
+=====================
+Algoritmos para o problema de autovalores simétrico, compartilhados pelos Exercícios-Programa.
+
+Para utilizá-lo a partir das pastas `EP1` e `EP2`, a pasta `eigen` deve estar no diretório pai delas, como
+neste repositório.
+"""
+from .backends import (
+    BACKENDS,
+    CALIBRATION_SIZE,
+    PREFERENCE,
+    TUNING_CACHE,
+    calibrate,
+    implicit_ql,
+    load_tuning,
+    numpy_solver,
+    python_solver,
+    register_backend,
+    save_tuning,
+    size_band,
+    solve,
+    tune,
+    tuned_backend,
+    tuning_table,
+    vectorized_ql,
+)
+from .band import (
+    adjacency,
+    band_reduction,
+    band_storage,
+    band_tridiagonalization,
+    band_window,
+    bandwidth,
+    reverse_cuthill_mckee,
+)
+from .components import connected_components, dense_eigensystem, solve_components
+from .dqds import (
+    definite_shift,
+    dqds,
+    dqds_step,
+    gershgorin_bounds,
+    qd_arrays,
+    qd_pair,
+    unit_scale,
+)
+from .generalized import (
+    ENGINES,
+    mass_normalize,
+    solve_generalized,
+    triangular_solve,
+)
+from .householder import back_transform, tridiagonalization, wy_factor
+from .jacobi import jacobi, round_robin
+from .lanczos import lanczos, lanczos_eigsh, ritz_pairs, shift_invert
+from .lobpcg import DROP_TOLERANCE, apply, lobpcg, m_complement, m_orthonormalize
+from .matrix_io import (
+    HEADER_SIZE,
+    MAGIC,
+    PACKED,
+    SYMMETRIC,
+    is_binary,
+    open_binary,
+    read_header,
+    read_text,
+    text_rows,
+    write_binary,
+)
+from .modal import modal_chunks, modal_response, spring_chain
+from .mrrr import (
+    cluster_vectors,
+    ldl_bisection,
+    ldl_negcount,
+    ldl_shift,
+    mrrr,
+    mrrr_cluster,
+    tridiagonal_solve,
+    twisted_vectors,
+)
+from .outofcore import back_transform_ooc, panel_rows, tridiagonalization_ooc
+from .packed import (
+    pack,
+    pack_rows,
+    packed_matvec,
+    packed_offset,
+    packed_order,
+    packed_rank2_update,
+    tridiagonalization_packed,
+    unpack,
+)
+from .qr import (
+    anytime_qr,
+    exceptional_h,
+    qr_algorithm,
+    qr_factorization,
+    rayleigh_h,
+    sgn,
+    shifted_qr,
+    update_eigenvectors,
+    update_matrix,
+    wilkinson_h,
+    zero_h,
+)
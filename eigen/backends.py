@@ -0,0 +1,453 @@
+"""
+Registro de Backends
+====================
+Registro dos algoritmos que resolvem o problema de autovalores tridiagonal simétrico e escolha automática do mais
+rápido para cada faixa de tamanhos, com calibração salva em disco.
+
+Todo backend é uma função `solver(alphas, betas, V0=None)` que retorna `(alphas, betas, V, iterations)`, no mesmo
+formato do `qr_algorithm`, com precisão de máquina: a escolha automática considera apenas o tempo, de modo que
+todos os backends registrados devem ter a mesma precisão (por isso o backend `python` usa uma tolerância relativa
+à norma da matriz, e não a tolerância absoluta padrão do `qr_algorithm`).
+
+A calibração só é executada quando pedida explicitamente, por `tune`; enquanto uma faixa não foi calibrada,
+`solve` usa o primeiro backend disponível de `PREFERENCE`. A tabela calibrada é lida do disco uma única vez e
+mantida em memória.
+"""
+import json
+import os
+import threading
+import time
+from math import copysign, hypot
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .dqds import gershgorin_bounds
+from .mrrr import mrrr
+from .qr import qr_algorithm
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import scipy.linalg as scipy_linalg
+except ImportError:
+    scipy_linalg = None
+
+
+TUNING_CACHE = os.environ.get(
+    "EIGEN_TUNING_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "map3121", "eigen_backends.json"),
+)
+
+BACKENDS = {}
+CALIBRATION_LIMITS = {}
+
+PREFERENCE = ("scipy", "numba", "mrrr", "numpy", "python")
+
+CALIBRATION_SIZE = 512
+
+TUNING = {}
+TUNING_LOCK = threading.Lock()
+
+
+def register_backend(name: str, solver, max_calibration_size: int = None):
+    """
+    Registro de Backend
+    -------------------
+    Registra `solver` sob o nome `name`. Backends com `max_calibration_size` só participam da calibração de faixas
+    de tamanho até esse valor, o que evita calibrar a implementação de referência em matrizes grandes.
+    """
+    BACKENDS[name] = solver
+    CALIBRATION_LIMITS[name] = max_calibration_size
+
+
+def implicit_ql(d: np.array, e: np.array, Z: np.array, epsilon: float) -> int:
+    """
+    Algoritmo QL Implícito
+    ----------------------
+    Diagonaliza, no próprio lugar, a matriz tridiagonal simétrica de diagonal `d` e sobrediagonal `e` (com
+    `e[n - 1] = 0`), pelo Algoritmo QL implícito com deslocamento de Wilkinson, acumulando as rotações nas colunas
+    de `Z`. Escrito apenas com laços e operações escalares, para ser compilado pelo Numba quando disponível.
+
+    Retorna
+    -------
+
+    iterations  :   int
+        Número de iterações executadas; -1 se algum autovalor não convergir em 30 iterações.
+    """
+    n = d.shape[0]
+    rows = Z.shape[0]
+    iterations = 0
+    for l in range(n):
+        stall = 0
+        while True:
+            m = l
+            while m < n - 1:
+                if abs(e[m]) <= epsilon * (abs(d[m]) + abs(d[m + 1])):
+                    break
+                m += 1
+            if m == l:
+                break
+            if stall == 30:
+                return -1
+            stall += 1
+            iterations += 1
+
+            g = (d[l + 1] - d[l]) / (2.0 * e[l])
+            r = hypot(g, 1.0)
+            g = d[m] - d[l] + e[l] / (g + copysign(r, g))
+            (s, c, p) = (1.0, 1.0, 0.0)
+            underflow = False
+            for i in range(m - 1, l - 1, -1):
+                f = s * e[i]
+                b = c * e[i]
+                r = hypot(f, g)
+                e[i + 1] = r
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[m] = 0.0
+                    underflow = True
+                    break
+                s = f / r
+                c = g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                for k in range(rows):
+                    f = Z[k, i + 1]
+                    Z[k, i + 1] = s * Z[k, i] + c * f
+                    Z[k, i] = c * Z[k, i] - s * f
+            if underflow:
+                continue
+            d[l] -= p
+            e[l] = g
+            e[m] = 0.0
+
+    return iterations
+
+
+def vectorized_ql(d: np.array, e: np.array, Z: np.array, epsilon: float) -> int:
+    """
+    Algoritmo QL Implícito Vetorizado
+    ---------------------------------
+    O mesmo algoritmo de `implicit_ql`, com as rotações acumuladas em `Z` por operações do NumPy sobre colunas
+    inteiras, em vez do laço escalar sobre as linhas, que só é rápido quando compilado. Apenas a recorrência
+    escalar da diagonal, O(n) por varredura, é interpretada pelo Python.
+
+    Retorna
+    -------
+
+    iterations  :   int
+        Número de iterações executadas; -1 se algum autovalor não convergir em 30 iterações.
+    """
+    n = d.shape[0]
+    iterations = 0
+    for l in range(n):
+        stall = 0
+        while True:
+            m = l
+            while m < n - 1:
+                if abs(e[m]) <= epsilon * (abs(d[m]) + abs(d[m + 1])):
+                    break
+                m += 1
+            if m == l:
+                break
+            if stall == 30:
+                return -1
+            stall += 1
+            iterations += 1
+
+            g = (d[l + 1] - d[l]) / (2.0 * e[l])
+            r = hypot(g, 1.0)
+            g = d[m] - d[l] + e[l] / (g + copysign(r, g))
+            (s, c, p) = (1.0, 1.0, 0.0)
+            underflow = False
+            for i in range(m - 1, l - 1, -1):
+                f = s * e[i]
+                b = c * e[i]
+                r = hypot(f, g)
+                e[i + 1] = r
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[m] = 0.0
+                    underflow = True
+                    break
+                s = f / r
+                c = g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                (Z_i, Z_next) = (Z[:, i].copy(), Z[:, i + 1].copy())
+                Z[:, i + 1] = s * Z_i + c * Z_next
+                Z[:, i] = c * Z_i - s * Z_next
+            if underflow:
+                continue
+            d[l] -= p
+            e[l] = g
+            e[m] = 0.0
+
+    return iterations
+
+
+def numpy_solver(
+    alphas: np.array, betas: np.array, V0: np.array = None
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Backend NumPy
+    -------------
+    Algoritmo QL implícito com as rotações vetorizadas (`vectorized_ql`), sem dependências opcionais.
+    """
+    n = len(alphas)
+    d = np.array(alphas, dtype=float)
+    e = np.zeros(n)
+    e[: n - 1] = betas
+    Z = np.identity(n) if V0 is None else np.array(V0, dtype=float)
+    iterations = vectorized_ql(d, e, Z, np.finfo(float).eps)
+    if iterations < 0:
+        raise RuntimeError("O Algoritmo QL implícito não convergiu.")
+    return (d, e[: n - 1], Z, iterations)
+
+
+register_backend("numpy", numpy_solver, max_calibration_size=256)
+
+
+if njit is not None:
+    implicit_ql_jit = njit(cache=True)(implicit_ql)
+
+    def numba_solver(
+        alphas: np.array, betas: np.array, V0: np.array = None
+    ) -> Tuple[np.array, np.array, np.array, int]:
+        """
+        Backend Numba
+        -------------
+        Algoritmo QL implícito (`implicit_ql`) compilado pelo Numba.
+        """
+        n = len(alphas)
+        d = np.array(alphas, dtype=float)
+        e = np.zeros(n)
+        e[: n - 1] = betas
+        Z = np.identity(n) if V0 is None else np.array(V0, dtype=float)
+        iterations = implicit_ql_jit(d, e, Z, np.finfo(float).eps)
+        if iterations < 0:
+            raise RuntimeError("O Algoritmo QL implícito não convergiu.")
+        return (d, e[: n - 1], Z, iterations)
+
+    register_backend("numba", numba_solver)
+
+
+if scipy_linalg is not None:
+
+    def scipy_solver(
+        alphas: np.array, betas: np.array, V0: np.array = None
+    ) -> Tuple[np.array, np.array, np.array, int]:
+        """
+        Backend SciPy
+        -------------
+        Rotinas do LAPACK, por meio de `scipy.linalg.eigh_tridiagonal`.
+        """
+        (Lambda, Z) = scipy_linalg.eigh_tridiagonal(alphas, betas)
+        V = Z if V0 is None else np.matmul(V0, Z)
+        return (Lambda, np.zeros(len(Lambda) - 1), V, 0)
+
+    register_backend("scipy", scipy_solver)
+
+
+def python_solver(
+    alphas: np.array, betas: np.array, V0: np.array = None
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Backend Python
+    --------------
+    Algoritmo QR (`qr_algorithm`) com a tolerância de convergência `eps * ||A||`, com a norma estimada pelo
+    intervalo de Gershgorin, para a mesma precisão dos demais backends.
+    """
+    (lower, upper) = gershgorin_bounds(alphas, betas)
+    epsilon = np.finfo(float).eps * max(abs(lower), abs(upper), np.finfo(float).tiny)
+    return qr_algorithm(alphas, betas, V0, epsilon=epsilon)
+
+
+register_backend("python", python_solver, max_calibration_size=256)
+register_backend("mrrr", mrrr)
+
+
+def size_band(n: int) -> int:
+    """
+    Faixa de Tamanho
+    ----------------
+    Retorna a faixa `b` que contém matrizes de ordem `n`, isto é, `2^(b - 1) < n <= 2^b`.
+    """
+    return max(int(np.ceil(np.log2(max(n, 1)))), 1)
+
+
+def calibrate(
+    band: int, backends: List[str] = None, repeats: int = 2, seed: int = 0
+) -> Dict[str, float]:
+    """
+    Calibração
+    ----------
+    Mede o tempo de cada backend em uma matriz tridiagonal aleatória de ordem `2^band`, limitada a
+    `CALIBRATION_SIZE`, com semente `seed`. Cada backend é executado antes em uma matriz 2x2, para que a compilação
+    JIT não entre na medida, e o tempo registrado é o menor de `repeats` execuções.
+
+    Retorna
+    -------
+
+    timings :   Dict[str, float]
+        Tempo, em segundos, de cada backend calibrado.
+    """
+    n = min(2 ** band, CALIBRATION_SIZE)
+    rng = np.random.default_rng(seed)
+    alphas = rng.standard_normal(n)
+    betas = rng.standard_normal(n - 1)
+
+    timings = {}
+    for name in BACKENDS if backends is None else backends:
+        limit = CALIBRATION_LIMITS[name]
+        if limit is not None and n > limit:
+            continue
+
+        solver = BACKENDS[name]
+        solver(alphas[:2], betas[:1])
+
+        best = np.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            solver(alphas, betas)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    return timings
+
+
+def load_tuning(path: str = None) -> Dict[str, str]:
+    """
+    Leitura da Calibração
+    ---------------------
+    Retorna a tabela `{faixa: backend}` salva em `path` (por padrão, `TUNING_CACHE`), ou uma tabela vazia.
+    """
+    try:
+        with open(TUNING_CACHE if path is None else path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_tuning(table: Dict[str, str], path: str = None):
+    """
+    Gravação da Calibração
+    ----------------------
+    Salva a tabela `{faixa: backend}` em `path` (por padrão, `TUNING_CACHE`).
+    """
+    path = TUNING_CACHE if path is None else path
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(table, file, indent=2, sort_keys=True)
+
+
+def tuning_table(path: str = None) -> Dict[str, str]:
+    """
+    Tabela de Calibração
+    --------------------
+    Retorna a tabela `{faixa: backend}` de `path` (por padrão, `TUNING_CACHE`), lida do disco apenas na primeira
+    chamada e mantida em `TUNING`.
+    """
+    path = TUNING_CACHE if path is None else path
+    with TUNING_LOCK:
+        if path not in TUNING:
+            TUNING[path] = load_tuning(path)
+        return TUNING[path]
+
+
+def tune(bands: List[int] = None, path: str = None) -> Dict[str, str]:
+    """
+    Calibração dos Backends
+    -----------------------
+    Calibra as faixas `bands` (por padrão, todas até a de `CALIBRATION_SIZE`; as faixas maiores usam o resultado
+    desta), escolhe o backend mais rápido de cada uma e salva a tabela em `path` (por padrão, `TUNING_CACHE`). A
+    tabela em memória é atualizada sob `TUNING_LOCK`, de modo que chamadas concorrentes de `solve` não leem uma
+    tabela parcial.
+
+    Retorna
+    -------
+
+    table   :   Dict[str, str]
+        A tabela `{faixa: backend}` atualizada.
+    """
+    path = TUNING_CACHE if path is None else path
+    if bands is None:
+        bands = range(1, size_band(CALIBRATION_SIZE) + 1)
+
+    with TUNING_LOCK:
+        table = dict(TUNING[path]) if path in TUNING else load_tuning(path)
+        for band in bands:
+            timings = calibrate(band)
+            table[str(band)] = min(timings, key=timings.get)
+        save_tuning(table, path)
+        TUNING[path] = table
+
+    return table
+
+
+def tuned_backend(n: int, path: str = None) -> str:
+    """
+    Backend Calibrado
+    -----------------
+    Retorna o nome do backend mais rápido para matrizes de ordem `n`, segundo a tabela de `tune` (matrizes
+    maiores que `CALIBRATION_SIZE` usam a faixa deste). Se a faixa não foi calibrada, ou se o backend salvo não
+    está mais disponível, retorna o primeiro backend disponível de `PREFERENCE`, sem calibrar.
+    """
+    band = str(min(size_band(n), size_band(CALIBRATION_SIZE)))
+    name = tuning_table(path).get(band)
+    if name in BACKENDS:
+        return name
+
+    return next(name for name in PREFERENCE if name in BACKENDS)
+
+
+def solve(
+    alphas: np.array,
+    betas: np.array,
+    V0: np.array = None,
+    backend: str = "auto",
+    path: str = None,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Solução do Problema de Autovalores Tridiagonal
+    ----------------------------------------------
+    Calcula os autovalores e autovetores da matriz tridiagonal simétrica representada por `alphas` e `betas` com o
+    backend `backend`, ou com o backend calibrado para o tamanho da matriz se `backend = "auto"` (veja
+    `tuned_backend`).
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    V0  :   np.array
+        Matriz à qual os autovetores são aplicados (identidade, ou `H` da tridiagonalização).
+
+    backend :   str
+        Nome de um backend registrado em `BACKENDS`, ou `"auto"`.
+
+    path    :   str
+        Arquivo da calibração. Por padrão, `TUNING_CACHE`.
+
+    Retorna
+    -------
+
+    (alphas, betas, V, iterations)  :   Tuple[np.array, np.array, np.array, int]
+        Resultado no mesmo formato do `qr_algorithm`.
+    """
+    name = tuned_backend(len(alphas), path) if backend == "auto" else backend
+    return BACKENDS[name](alphas, betas, V0)
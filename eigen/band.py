@@ -0,0 +1,212 @@
+"""
+Matrizes de Banda
+=================
+Reordenação de Cuthill-McKee reversa, armazenamento em banda e redução de matrizes simétricas de banda à forma
+tridiagonal.
+
+Uma matriz simétrica de semi-largura de banda `b` (`A[i, j] = 0` para `|i - j| > b`) é guardada pelas suas
+diagonais inferiores, no formato de banda `'L'` do LAPACK: `AB[d, j] = A[j + d, j]`, com `n (b + 1)` entradas. A
+redução à forma tridiagonal custa O(n^2 b) operações, contra O(n^3) da redução densa, e usa O(n b) de memória
+(mais a matriz ortogonal, se acumulada).
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .qr import sgn
+
+
+def adjacency(A) -> Tuple[np.array, np.array]:
+    """
+    Retorna o grafo de adjacência de `A` (densa ou `scipy.sparse`) no formato CSR, `(indptr, J)`: os vizinhos do nó
+    `i` (os índices `j != i` com `A[i, j] != 0`) são `J[indptr[i] : indptr[i + 1]]`, em ordem crescente.
+    """
+    n = np.shape(A)[0]
+    (I, J) = A.nonzero()
+    off = I != J
+    order = np.lexsort((J[off], I[off]))
+    (I, J) = (I[off][order], J[off][order])
+    return (np.searchsorted(I, np.arange(n + 1)), J)
+
+
+def reverse_cuthill_mckee(A) -> np.array:
+    """
+    Cuthill-McKee Reverso
+    ---------------------
+    Retorna a permutação `perm` dos índices de `A` (densa ou `scipy.sparse`) que reduz a largura de banda de
+    `A[perm][:, perm]`. Cada componente conexa do grafo de adjacência de `A` é percorrida em largura a partir de um
+    nó de grau mínimo, visitando os vizinhos em ordem crescente de grau; a ordem final é a inversa da ordem de
+    visita.
+    """
+    n = np.shape(A)[0]
+    (indptr, J) = adjacency(A)
+    degree = np.diff(indptr)
+
+    visited = np.zeros(n, dtype=bool)
+    perm = []
+    for start in np.argsort(degree, kind="stable"):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            neighbours = J[indptr[node] : indptr[node + 1]]
+            neighbours = neighbours[~visited[neighbours]]
+            neighbours = neighbours[np.argsort(degree[neighbours], kind="stable")]
+            visited[neighbours] = True
+            queue.extend(neighbours)
+        perm.extend(queue)
+
+    return np.array(perm[::-1], dtype=int)
+
+
+def bandwidth(A) -> int:
+    """
+    Retorna a semi-largura de banda `b` da matriz `A` (densa ou `scipy.sparse`): o maior `|i - j|` com
+    `A[i, j] != 0`.
+    """
+    (I, J) = A.nonzero()
+    return int(np.max(np.abs(I - J), initial=0))
+
+
+def band_storage(A, b: int) -> np.array:
+    """
+    Retorna as `b + 1` diagonais inferiores de `A` (densa ou `scipy.sparse`) no formato de banda, `AB[d, j] =
+    A[j + d, j]`.
+    """
+    n = np.shape(A)[0]
+    AB = np.zeros((b + 1, n))
+    for d in range(min(b, n - 1) + 1):
+        AB[d, : n - d] = A.diagonal(-d)
+    return AB
+
+
+def band_window(work: np.array, w: int, lo: int, hi: int) -> np.array:
+    """
+    Retorna uma visão densa (sem cópia) do bloco `A[lo:hi, lo:hi]` da matriz guardada em `work`, no formato
+    `work[i - j + w, j] = A[i, j]` (as `2 w + 1` diagonais centrais): nesse formato, a entrada `A[i, j]` fica na
+    posição `w n + i n - j (n - 1)` do vetor `work.ravel()`, que é linear em `i` e `j`. Escritas na visão alteram
+    `work`. Todas as entradas do bloco devem estar a no máximo `w` posições da diagonal.
+    """
+    n = np.size(work, 1)
+    flat = work.reshape(-1)
+    return np.lib.stride_tricks.as_strided(
+        flat[w * n + lo :],
+        shape=(hi - lo, hi - lo),
+        strides=(n * flat.itemsize, -(n - 1) * flat.itemsize),
+    )
+
+
+def band_tridiagonalization(
+    AB: np.array, accumulate: bool = True
+) -> Tuple[np.array, np.array, np.array]:
+    """
+    Redução de Banda à Forma Tridiagonal
+    ------------------------------------
+    Dada uma matriz simétrica de banda no formato `AB` de `band_storage` (semi-largura `b`), reduz a matriz à
+    forma tridiagonal por transformações de Householder de comprimento `b`, com perseguição do bojo: para cada
+    coluna `j`, um refletor anula `A[j + 2 : j + b + 1, j]`; aplicado à direita, ele preenche o bloco `b x b`
+    abaixo da diagonal, cuja primeira coluna é anulada por um novo refletor `b` linhas abaixo, e assim por diante
+    até o fim da matriz. O restante de cada bojo é anulado pela varredura da coluna seguinte, de modo que a largura
+    de banda nunca passa de `2 b - 1`.
+
+    A matriz de trabalho guarda as `6 b + 1` diagonais centrais, e cada refletor é aplicado a uma janela de no
+    máximo `3 b` linhas e colunas, acessada como uma visão densa (veja `band_window`). Há cerca de `n^2 / (2 b)`
+    refletores: o custo total é O(n^2 b) e a memória, O(n b).
+
+    Parâmetros
+    ----------
+
+    AB  :   np.array
+        Matriz de banda, com as diagonais inferiores nas linhas.
+
+    accumulate  :   bool
+        Se True, acumula o produto dos refletores em uma matriz densa `Q`, com `A = Q T Q^T`, que pode ser passada
+        como `V0` ao `qr_algorithm`.
+
+    Retorna
+    -------
+
+    (alphas, betas, Q)   :   Tuple[np.array, np.array, np.array]
+        A diagonal principal e a sobrediagonal da matriz tridiagonal e a matriz `Q` (ou None).
+    """
+    (bands, n) = np.shape(AB)
+    b = max(bands - 1, 1)
+    w = 3 * b
+    work = np.zeros((2 * w + 1, n))
+    for d in range(min(bands - 1, n - 1) + 1):
+        work[w + d, : n - d] = AB[d, : n - d]
+        work[w - d, d:] = AB[d, : n - d]
+    Q = np.identity(n) if accumulate else None
+
+    for j in range(n - 2):
+        (c, s) = (j, j + 1)
+        while s < n - 1:
+            m = min(b, n - s)
+            (lo, hi) = (c, min(n, s + m + b))
+            W = band_window(work, w, lo, hi)
+
+            (r0, r1) = (s - lo, s - lo + m)
+            v = W[r0:r1, c - lo].copy()
+            norm = np.sqrt(np.dot(v[1:], v[1:]))
+            if norm > 0:
+                beta = -sgn(v[0]) * np.sqrt(v[0] ** 2 + norm ** 2)
+                v[0] -= beta
+                tau = 2 / np.dot(v, v)
+
+                W[:, r0:r1] -= tau * np.outer(np.matmul(W[:, r0:r1], v), v)
+                W[r0:r1, :] -= tau * np.outer(v, np.matmul(v, W[r0:r1, :]))
+                (W[r0, c - lo], W[c - lo, r0]) = (beta, beta)
+                (W[r0 + 1 : r1, c - lo], W[c - lo, r0 + 1 : r1]) = (0, 0)
+
+                if accumulate:
+                    Q[:, s : s + m] -= tau * np.outer(np.matmul(Q[:, s : s + m], v), v)
+
+            (c, s) = (s, s + b)
+
+    return (work[w].copy(), work[w + 1, : n - 1].copy(), Q)
+
+
+def band_reduction(
+    A, accumulate: bool = True
+) -> Tuple[np.array, np.array, np.array, np.array]:
+    """
+    Redução por Reordenação e Banda
+    -------------------------------
+    Reordena os índices de `A` (densa ou `scipy.sparse`) por `reverse_cuthill_mckee`, guarda `A[perm][:, perm]` em
+    banda e a reduz à forma tridiagonal por `band_tridiagonalization`. Se a reordenação não diminuir a largura de
+    banda, a ordem original é mantida.
+
+    As linhas da matriz ortogonal são devolvidas à ordem original, `A = Q T Q^T` na numeração original, de modo
+    que `qr_algorithm(alphas, betas, Q)` retorna os autovetores (modos) já na ordem original dos graus de
+    liberdade.
+
+    Parâmetros
+    ----------
+
+    A   :   np.array
+        Matriz real simétrica, em geral esparsa (por exemplo, a matriz de rigidez de uma treliça).
+
+    accumulate  :   bool
+        Se True, acumula a matriz ortogonal `Q`.
+
+    Retorna
+    -------
+
+    (alphas, betas, Q, perm)    :   Tuple[np.array, np.array, np.array, np.array]
+        A matriz tridiagonal, a matriz `Q` (ou None) e a permutação aplicada.
+    """
+    perm = reverse_cuthill_mckee(A)
+    B = A[perm][:, perm]
+    if bandwidth(B) >= bandwidth(A):
+        (perm, B) = (np.arange(np.shape(A)[0]), A)
+    b = max(bandwidth(B), 1)
+
+    (alphas, betas, Q) = band_tridiagonalization(band_storage(B, b), accumulate)
+    if Q is not None:
+        Q[perm] = Q.copy()
+
+    return (alphas, betas, Q, perm)
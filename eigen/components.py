@@ -0,0 +1,116 @@
+"""
+Decomposição em Componentes
+===========================
+Separação de uma matriz simétrica nos blocos desacoplados do seu grafo de esparsidade (por exemplo, sub-treliças
+sem barras em comum). Como `P A P^T` é bloco-diagonal, os autovalores e autovetores de `A` são a união dos de cada
+bloco: cada componente é resolvida de forma independente, e o custo cai de O(n^3) para a soma dos cubos das
+ordens das componentes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .backends import solve
+from .band import adjacency
+from .householder import tridiagonalization
+
+
+def connected_components(A) -> Tuple[int, np.array]:
+    """
+    Componentes Conexas
+    -------------------
+    Percorre em largura o grafo de adjacência de `A` (densa ou `scipy.sparse`), em que `i` e `j` são vizinhos se
+    `A[i, j] != 0`, e retorna o número de componentes conexas e o rótulo (de 0 ao número de componentes menos 1) de
+    cada índice, na ordem em que as componentes são encontradas.
+    """
+    n = np.shape(A)[0]
+    (indptr, J) = adjacency(A)
+    labels = np.full(n, -1)
+    count = 0
+
+    for start in range(n):
+        if labels[start] >= 0:
+            continue
+        labels[start] = count
+        queue = [start]
+        while len(queue) > 0:
+            neighbours = np.concatenate([J[indptr[i] : indptr[i + 1]] for i in queue])
+            queue = np.unique(neighbours[labels[neighbours] < 0])
+            labels[queue] = count
+        count += 1
+
+    return (count, labels)
+
+
+def dense_eigensystem(A: np.array, backend: str = "auto") -> Tuple[np.array, np.array]:
+    """
+    Retorna os autovalores e a matriz de autovetores da matriz simétrica densa `A`, por `tridiagonalization` e
+    `solve` com o backend `backend` (por padrão, a escolha automática de `solve`).
+    """
+    if len(A) == 1:
+        return (np.array([A[0, 0]], dtype=float), np.ones((1, 1)))
+    (alphas, betas, H) = tridiagonalization(A)
+    (Lambda, _, V, _) = solve(alphas, betas, H, backend=backend)
+    return (Lambda, V)
+
+
+def solve_components(
+    A,
+    workers: int = None,
+    solver: Callable[[np.array], Tuple[np.array, np.array]] = dense_eigensystem,
+) -> Tuple[np.array, np.array, np.array]:
+    """
+    Solução por Componentes
+    -----------------------
+    Calcula todos os autovalores e autovetores da matriz simétrica `A` (densa ou `scipy.sparse`) resolvendo cada
+    componente conexa do seu grafo de esparsidade separadamente, em `workers` threads, e junta os resultados.
+
+    Parâmetros
+    ----------
+
+    A   :   np.array
+        Matriz real simétrica.
+
+    workers :   int
+        Número de threads. Se None, utiliza o padrão de `ThreadPoolExecutor`.
+
+    solver  :   Callable[[np.array], Tuple[np.array, np.array]]
+        Função que recebe o bloco denso de uma componente e retorna `(Lambda, V)`.
+
+    Retorna
+    -------
+
+    (Lambda, V, labels)   :   Tuple[np.array, np.array, np.array]
+        Os autovalores, em ordem crescente, a matriz `n x n` com os autovetores correspondentes nas colunas (cada um
+        não nulo apenas nos índices da sua componente) e o rótulo da componente de cada índice.
+    """
+    n = np.shape(A)[0]
+    (count, labels) = connected_components(A)
+    blocks = [np.nonzero(labels == c)[0] for c in range(count)]
+
+    with ThreadPoolExecutor(workers) as pool:
+        tasks = [
+            pool.submit(
+                solver,
+                np.asarray(
+                    A[block][:, block].todense()
+                    if hasattr(A, "todense")
+                    else A[np.ix_(block, block)],
+                    dtype=float,
+                ),
+            )
+            for block in blocks
+        ]
+
+        Lambda = np.zeros(n)
+        V = np.zeros((n, n))
+        start = 0
+        for (block, task) in zip(blocks, tasks):
+            (Lambda_c, V_c) = task.result()
+            Lambda[start : start + len(block)] = Lambda_c
+            V[block, start : start + len(block)] = V_c
+            start += len(block)
+
+    order = np.argsort(Lambda, kind="stable")
+    return (Lambda[order], V[:, order], labels)
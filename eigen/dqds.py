@@ -0,0 +1,289 @@
+"""
+Algoritmo dqds
+==============
+Autovalores de matrizes tridiagonais simétricas com alta precisão relativa pelo algoritmo qd diferencial com
+deslocamentos.
+"""
+from typing import Tuple
+
+import numpy as np
+
+MAX_DOUBLINGS = 64
+
+
+def gershgorin_bounds(alphas: np.array, betas: np.array) -> Tuple[float, float]:
+    """
+    Intervalo de Gershgorin
+    -----------------------
+    Dada uma matriz tridiagonal simétrica, representada pelos vetores `alphas` e `betas`, retorna os extremos
+    `(inferior, superior)` do intervalo que contém todos os seus autovalores, segundo o Teorema de Gershgorin.
+    """
+    radii = np.abs(np.concatenate(([0], betas))) + np.abs(np.concatenate((betas, [0])))
+    return (float(np.min(alphas - radii)), float(np.max(alphas + radii)))
+
+
+def unit_scale(lower: float, upper: float) -> float:
+    """
+    Escala Unitária
+    ---------------
+    Retorna a menor potência de 2 maior que `max(|lower|, |upper|)`, a norma estimada pelo intervalo de Gershgorin
+    `[lower, upper]`, ou 1 para a matriz nula. Dividir a matriz por ela leva a sua norma ao intervalo `[1/2, 1)` sem
+    introduzir erros de arredondamento.
+    """
+    norm = max(abs(lower), abs(upper))
+    return float(np.ldexp(1.0, int(np.frexp(norm)[1]))) if norm > 0 else 1.0
+
+
+def qd_arrays(
+    alphas: np.array, betas: np.array, sigma: float = 0
+) -> Tuple[np.array, np.array]:
+    """
+    Representação qd
+    ----------------
+    Dada uma matriz tridiagonal simétrica, representada pelos vetores `alphas` e `betas`, calcula a fatoração
+    `A - sigma * I = L D L^T` e retorna os vetores `q` e `e` do algoritmo qd: `q_i = d_i` e `e_i = beta_i^2 / d_i`.
+    A matriz `A - sigma * I` é definida positiva se, e somente se, todas as entradas de `q` são positivas.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    sigma   :   float
+        Deslocamento espectral aplicado antes da fatoração.
+
+    Retorna
+    -------
+
+    (q, e)  :   Tuple[np.array, np.array]
+        Vetores da representação qd de `A - sigma * I`.
+    """
+    q = np.zeros(len(alphas))
+    e = np.zeros(len(betas))
+
+    q[0] = alphas[0] - sigma
+    for i in range(len(betas)):
+        e[i] = betas[i] ** 2 / q[i] if q[i] != 0 else np.inf
+        q[i + 1] = alphas[i + 1] - sigma - e[i]
+
+    return (q, e)
+
+
+def definite_shift(
+    alphas: np.array, betas: np.array, lower: float, margin: float
+) -> Tuple[float, np.array, np.array]:
+    """
+    Deslocamento Definido Positivo
+    ------------------------------
+    Retorna um deslocamento `sigma` que torna `A - sigma * I` definida positiva e a sua representação qd (veja
+    `qd_arrays`): 0, se A já é definida positiva, ou `lower - margin`, com a margem dobrada até que a fatoração
+    seja positiva, sendo `lower` o extremo inferior do intervalo de Gershgorin. A margem é dobrada no máximo
+    `MAX_DOUBLINGS` vezes; depois disso, um `ValueError` é levantado.
+
+    Retorna
+    -------
+
+    (sigma, q, e)   :   Tuple[float, np.array, np.array]
+        O deslocamento e a representação qd de `A - sigma * I`.
+    """
+    sigma = 0
+    (q, e) = qd_arrays(alphas, betas)
+    for _ in range(MAX_DOUBLINGS):
+        if np.all(q > 0):
+            return (sigma, q, e)
+        sigma = lower - margin
+        (q, e) = qd_arrays(alphas, betas, sigma)
+        margin *= 2
+
+    if np.all(q > 0):
+        return (sigma, q, e)
+    raise ValueError("Não foi possível tornar A - sigma * I definida positiva.")
+
+
+def dqds_step(q: np.array, e: np.array, tau: float) -> Tuple[np.array, np.array, float]:
+    """
+    Transformação dqds
+    ------------------
+    Aplica uma transformação qd diferencial com deslocamento `tau` (dqds) à representação `(q, e)`, o que subtrai
+    `tau` de todos os autovalores sem calcular nenhuma raiz quadrada. Se `tau` não for menor que o menor autovalor,
+    alguma entrada da nova representação é negativa e a transformação é rejeitada.
+
+    Parâmetros
+    ----------
+
+    (q, e)  :   Tuple[np.array, np.array]
+        Representação qd de uma matriz definida positiva.
+
+    tau :   float
+        Deslocamento espectral.
+
+    Retorna
+    -------
+
+    (q, e, dmin)    :   Tuple[np.array, np.array, float]
+        Nova representação e o menor valor de `d` encontrado, que é uma cota superior para o menor autovalor da
+        nova representação; ou `(None, None, dmin)` se a transformação for rejeitada.
+    """
+    q_k = np.zeros(len(q))
+    e_k = np.zeros(len(e))
+
+    d = q[0] - tau
+    dmin = d
+    for i in range(len(e)):
+        if d < 0:
+            return (None, None, dmin)
+        q_k[i] = d + e[i]
+        t = q[i + 1] / q_k[i]
+        e_k[i] = e[i] * t
+        d = d * t - tau
+        dmin = min(dmin, d)
+
+    if d < 0:
+        return (None, None, dmin)
+    q_k[-1] = d
+
+    return (q_k, e_k, dmin)
+
+
+def qd_pair(q1: float, e1: float, q2: float) -> Tuple[float, float]:
+    """
+    Autovalores de um bloco 2x2 na representação qd
+    -----------------------------------------------
+    Retorna os autovalores `(maior, menor)` do bloco `[[q1, sqrt(q1 e1)], [sqrt(q1 e1), q2 + e1]]`. O menor é
+    calculado como `det / maior`, o que evita o cancelamento e preserva a precisão relativa.
+    """
+    t = q1 + q2 + e1
+    big = (t + np.sqrt(max(t ** 2 - 4 * q1 * q2, 0))) / 2
+    return (big, q1 * q2 / big if big > 0 else 0)
+
+
+def dqds(
+    alphas: np.array,
+    betas: np.array,
+    shift: float = None,
+    epsilon: float = 100 * np.finfo(float).eps,
+    max_iterations: int = None,
+) -> Tuple[np.array, int]:
+    """
+    Algoritmo dqds
+    --------------
+    Dada uma matriz tridiagonal simétrica, representada pelos vetores `alphas` e `betas`, calcula apenas os seus
+    autovalores pelo algoritmo qd diferencial com deslocamentos (dqds), que não utiliza raízes quadradas nas
+    iterações e calcula com alta precisão relativa inclusive os autovalores muito pequenos.
+
+    O algoritmo opera sobre a representação qd (veja `qd_arrays`) de `A - shift * I`, que deve ser definida
+    positiva. Se `shift` não for fornecido, utiliza-se 0 quando A já é definida positiva (o caso das matrizes de
+    rigidez, em que os menores autovalores são os de interesse) e, caso contrário, o extremo inferior do intervalo
+    de Gershgorin, afastado até que a fatoração seja positiva.
+
+    Antes da fatoração, a matriz é dividida por uma potência de 2 próxima da sua norma (veja `unit_scale`), o que
+    não introduz erros de arredondamento e evita que `beta^2` e as tolerâncias sofram overflow ou underflow em
+    matrizes de escala muito grande ou muito pequena. Matrizes com entradas não finitas são rejeitadas com
+    `ValueError`.
+
+    A cada iteração, os autovalores isolados são desacoplados de forma agressiva: blocos 1x1 e 2x2 ao final da
+    representação, e divisões em subproblemas independentes sempre que alguma entrada interna de `e` se torna
+    desprezível.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    shift   :   float
+        Deslocamento que torna `A - shift * I` definida positiva.
+
+    epsilon :   float
+        Tolerância relativa para o desacoplamento.
+
+    max_iterations  :   int
+        Número máximo de transformações dqds. Por padrão, `30 n`.
+
+    Retorna
+    -------
+
+    Lambda  :   np.array
+        Autovalores da matriz A, em ordem crescente.
+
+    iterations  :   int
+        Número de transformações dqds executadas.
+    """
+    (alphas, betas) = (np.asarray(alphas, dtype=float), np.asarray(betas, dtype=float))
+    if not (np.all(np.isfinite(alphas)) and np.all(np.isfinite(betas))):
+        raise ValueError("A matriz deve ter apenas entradas finitas.")
+
+    n = len(alphas)
+    if max_iterations is None:
+        max_iterations = 30 * n
+
+    (lower, upper) = gershgorin_bounds(alphas, betas)
+    if lower == upper == 0:
+        return (np.zeros(n), 0)
+    scale = unit_scale(lower, upper)
+    (alphas, betas, lower) = (alphas / scale, betas / scale, lower / scale)
+
+    if shift is None:
+        (shift, q, e) = definite_shift(alphas, betas, lower, epsilon)
+    else:
+        shift = shift / scale
+        (q, e) = qd_arrays(alphas, betas, shift)
+        if not np.all(q > 0):
+            raise ValueError("A - shift * I não é definida positiva.")
+
+    tol2 = epsilon ** 2
+    tiny = np.finfo(float).tiny
+    Lambda = []
+    iterations = 0
+    segments = [(q, e, shift)]
+
+    while len(segments) > 0:
+        (q, e, sigma) = segments.pop()
+        dmin = np.inf
+
+        while len(q) > 0:
+            m = len(q) - 1
+            if m == 0:
+                Lambda.append(sigma + q[0])
+                break
+
+            if e[m - 1] <= max(tol2 * (sigma + q[m]), tiny):
+                Lambda.append(sigma + q[m])
+                (q, e) = (q[:m], e[: m - 1])
+                continue
+
+            if m == 1 or e[m - 2] <= max(tol2 * (sigma + q[m - 1]), tiny):
+                Lambda.extend(sigma + x for x in qd_pair(q[m - 1], e[m - 1], q[m]))
+                (q, e) = (q[: m - 1], e[: m - 2] if m > 1 else e[:0])
+                continue
+
+            splits = np.nonzero(e[:-1] <= np.maximum(tol2 * (sigma + q[1:-1]), tiny))[0]
+            if len(splits) > 0:
+                i = splits[-1] + 1
+                segments.append((q[:i], e[: i - 1], sigma))
+                (q, e) = (q[i:], e[i:])
+                dmin = np.inf
+                continue
+
+            if iterations >= max_iterations:
+                raise RuntimeError("O algoritmo dqds não convergiu.")
+
+            tau = 0.99 * min(qd_pair(q[m - 1], e[m - 1], q[m])[1], dmin)
+            while True:
+                (q_k, e_k, d) = dqds_step(q, e, tau)
+                if q_k is not None:
+                    break
+                tau = tau / 2 if tau > tiny * len(q) else 0
+
+            (q, e, dmin) = (q_k, e_k, d)
+            sigma += tau
+            iterations += 1
+
+    return (scale * np.sort(np.array(Lambda)), iterations)
@@ -0,0 +1,122 @@
+"""
+Problema Generalizado
+=====================
+Problema de autovalores simétrico-definido `K z = lambda M z`, com `K` simétrica e `M` simétrica definida positiva
+(por exemplo, as matrizes de rigidez e de massas de uma treliça), reduzido ao problema padrão por uma congruência:
+
+- se `M` é diagonal (massas concentradas), `K~ = M^-1/2 K M^-1/2` e `z = M^-1/2 y`, com produtos por vetores;
+- caso contrário, `M = L L^T` (Cholesky), `K~ = L^-1 K L^-T` e `z = L^-T y`, por soluções triangulares.
+
+Os autovetores `z` retornados são `M`-ortonormais, `Z^T M Z = I`.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .backends import solve
+from .band import band_reduction
+from .components import dense_eigensystem, solve_components
+from .lanczos import lanczos_eigsh
+
+try:
+    import scipy.linalg as scipy_linalg
+except ImportError:
+    scipy_linalg = None
+
+ENGINES = ("dense", "lanczos", "components", "band")
+
+
+def triangular_solve(L: np.array, B: np.array, lower: bool = True) -> np.array:
+    """
+    Resolve `L X = B` para uma matriz triangular `L`, com `scipy.linalg.solve_triangular` se disponível.
+    """
+    if scipy_linalg is not None:
+        return scipy_linalg.solve_triangular(L, B, lower=lower)
+    return np.linalg.solve(L, B)
+
+
+def mass_normalize(K, M) -> Tuple[np.array, np.array]:
+    """
+    Congruência pela Matriz de Massas
+    ---------------------------------
+    Retorna `(K~, S)`: a matriz `K~` do problema padrão equivalente a `K z = lambda M z` e o fator `S` que leva os
+    seus autovetores aos do problema generalizado. Se `M` é um vetor (ou uma matriz diagonal), `S` é o vetor
+    `M^-1/2` e `K~` é obtida por produtos elemento a elemento, preservando a esparsidade de `K`; caso contrário,
+    `S` é o fator de Cholesky `L` de `M`, e `K~` é densa.
+    """
+    if np.ndim(M) == 2:
+        (I, J) = M.nonzero()
+        if np.all(I == J):
+            M = M.diagonal()
+
+    if np.ndim(M) == 1:
+        S = 1.0 / np.sqrt(np.asarray(M, dtype=float))
+        if hasattr(K, "multiply"):
+            return (K.multiply(S[:, None]).multiply(S[None, :]).tocsr(), S)
+        return (S[:, None] * np.asarray(K, dtype=float) * S, S)
+
+    L = np.linalg.cholesky(M.toarray() if hasattr(M, "toarray") else M)
+    K = K.toarray() if hasattr(K, "toarray") else np.asarray(K, dtype=float)
+    Y = triangular_solve(L, K)
+    K = triangular_solve(L, Y.T)
+    return ((K + K.T) / 2, L)
+
+
+def solve_generalized(
+    K, M, k: int = None, engine: str = "auto"
+) -> Tuple[np.array, np.array]:
+    """
+    Problema de Autovalores Generalizado
+    ------------------------------------
+    Calcula os autovalores e autovetores de `K z = lambda M z` (veja `mass_normalize`), resolvendo o problema
+    padrão `K~ y = lambda y` com um dos algoritmos do núcleo:
+
+    - `"dense"`: `tridiagonalization` seguida de `solve`;
+    - `"lanczos"`: `lanczos_eigsh`, para os `k` menores autovalores, sem formar matrizes densas;
+    - `"components"`: `solve_components`, por blocos desacoplados;
+    - `"band"`: `band_reduction` seguida de `solve`.
+
+    Com `engine = "auto"`, usa-se `"lanczos"` se `k` for dado e `"dense"` caso contrário.
+
+    Parâmetros
+    ----------
+
+    K   :   np.array
+        Matriz real simétrica, densa ou `scipy.sparse`.
+
+    M   :   np.array
+        Matriz simétrica definida positiva: o vetor da sua diagonal, uma matriz diagonal ou uma matriz cheia.
+
+    k   :   int
+        Se dado, apenas os `k` menores autovalores (e seus autovetores) são retornados.
+
+    engine  :   str
+        Algoritmo aplicado ao problema padrão: um de `ENGINES`, ou `"auto"`.
+
+    Retorna
+    -------
+
+    (Lambda, Z)   :   Tuple[np.array, np.array]
+        Os autovalores, em ordem crescente, e a matriz com os autovetores `M`-ortonormais correspondentes.
+    """
+    if engine == "auto":
+        engine = "dense" if k is None else "lanczos"
+    (A, S) = mass_normalize(K, M)
+
+    if engine == "lanczos":
+        (Lambda, V, _) = lanczos_eigsh(A, k)
+    elif engine == "components":
+        (Lambda, V, _) = solve_components(A)
+    elif engine == "band":
+        (alphas, betas, Q, _) = band_reduction(A)
+        (Lambda, _, V, _) = solve(alphas, betas, Q)
+    elif engine == "dense":
+        (Lambda, V) = dense_eigensystem(A.toarray() if hasattr(A, "toarray") else A)
+    else:
+        raise ValueError(f"Algoritmo desconhecido: {engine}.")
+
+    order = np.argsort(Lambda, kind="stable")[:k]
+    (Lambda, V) = (Lambda[order], V[:, order])
+    Z = S[:, None] * V if np.ndim(S) == 1 else triangular_solve(S.T, V, lower=False)
+
+    return (Lambda, Z)
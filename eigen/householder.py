@@ -0,0 +1,174 @@
+"""
+Tridiagonalização
+=================
+Redução de matrizes reais simétricas à forma tridiagonal por transformações de Householder.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .packed import packed_offset, tridiagonalization_packed
+from .qr import sgn
+
+
+def tridiagonalization(
+    A: np.array, block_size: int = 32, compact: bool = False
+) -> Tuple[np.array, np.array, np.array]:
+    """
+    Tridiagonalização
+    --------------------------------------
+    Dada uma matriz real simétrica, `A`, efetua a sua tridiagonalização, através de
+    subsequentes transformações de Householder, e retorna a matriz tridiagonal resultante,
+    representada pelos vetores `alphas` e `betas`: sua diagonal principal e sua sobrediagonal, respectivamente;
+    e a matriz `Ht`, resultado do produtório das matrizes de transformação de Householder à direita da identidade.
+
+    As transformações são agrupadas em painéis de `block_size` colunas. Dentro de um painel, cada refletor
+    `P = I - tau v v^T` é gerado a partir da coluna atualizada implicitamente, e os seus efeitos são acumulados em
+    duas matrizes `V` e `W` tais que `P A P = A - v w^T - w v^T`; ao final do painel, o restante da matriz recebe a
+    atualização simétrica de posto `2 * block_size`, `A - V W^T - W V^T`, por produtos de matrizes. A matriz `Ht`
+    é atualizada uma vez por painel pela representação WY compacta `P_1 ... P_k = I - V T V^T` (veja
+    `wy_factor`). Os refletores são os mesmos da redução coluna a coluna, de modo que o resultado coincide com ela
+    a menos de erros de arredondamento.
+
+    Com `compact = True`, `Ht` não é formada: os vetores de Householder são guardados na parte estritamente
+    inferior da própria cópia de `A` (o vetor `v_k` na coluna `k`, a partir da subdiagonal: `Y[k + 1:, k]`), e `Ht`
+    é substituída pelo par `(Y, taus)`, que `back_transform` aplica apenas aos autovetores de interesse.
+
+    Parâmetros
+    ----------
+
+    A  :   np.array
+        Matriz real simétrica qualquer, ou o vetor com o seu triângulo inferior compactado (veja `eigen.packed`),
+        caso em que a redução é feita por `tridiagonalization_packed`, sem formar a matriz densa.
+
+    block_size  :   int
+        Número de refletores por painel.
+
+    compact :   bool
+        Se True, retorna os refletores na forma compacta `(Y, taus)` em vez de `Ht`.
+
+    Retorna
+    -------
+
+    (alphas, betas, Ht)   :   Tuple[np.array, np.array, np.array]
+        Tupla que retorna os vetores `alphas` e `betas`, que representam a matriz
+        tridiagonal simétrica resultante, através de sua diagonal principal e sua sobrediagonal;
+        e `Ht`, a matriz resultante do produtório sucessivo das matrizes de transformação
+        de Householder à direita da matriz identidade; ou, com `compact = True`, o par `(Y, taus)`.
+
+    """
+    if np.ndim(A) == 1:
+        return tridiagonalization_packed(A, compact=compact)
+
+    A = np.array(A, dtype=float)
+    n = np.size(A, 0)
+    alphas = np.zeros(n)
+    betas = np.zeros(n - 1)
+
+    H = None if compact else np.identity(n)
+    reflectors = np.zeros(max(n - 2, 0))
+
+    for k in range(0, n - 2, block_size):
+        nb = min(block_size, n - 2 - k)
+        B = A[k:, k:]
+        V = np.zeros((n - k, nb))
+        W = np.zeros((n - k, nb))
+        taus = np.zeros(nb)
+
+        for j in range(nb):
+            B[j:, j] -= np.matmul(V[j:, :j], W[j, :j]) + np.matmul(W[j:, :j], V[j, :j])
+            alphas[k + j] = B[j, j]
+
+            v = B[j + 1 :, j].copy()
+            betas[k + j] = -sgn(v[0]) * np.sqrt(np.dot(v, v))
+            v[0] -= betas[k + j]
+            v2 = np.dot(v, v)
+            taus[j] = 2 / v2 if v2 > 0 else 0
+
+            y = (
+                np.matmul(B[j + 1 :, j + 1 :], v)
+                - np.matmul(V[j + 1 :, :j], np.matmul(v, W[j + 1 :, :j]))
+                - np.matmul(W[j + 1 :, :j], np.matmul(v, V[j + 1 :, :j]))
+            ) * taus[j]
+            W[j + 1 :, j] = y - taus[j] / 2 * np.dot(y, v) * v
+            V[j + 1 :, j] = v
+            B[j + 1 :, j] = v
+
+        B[nb:, nb:] -= np.matmul(V[nb:], W[nb:].T) + np.matmul(W[nb:], V[nb:].T)
+
+        reflectors[k : k + nb] = taus
+        if not compact:
+            H[:, k:] -= np.matmul(
+                np.matmul(np.matmul(H[:, k:], V), wy_factor(V, taus)), V.T
+            )
+
+    alphas[n - 2 :] = np.diag(A)[n - 2 :]
+    betas[n - 2] = A[n - 1, n - 2]
+
+    return (alphas, betas, (A, reflectors) if compact else H)
+
+
+def back_transform(
+    reflectors: Tuple[np.array, np.array], Z: np.array, block_size: int = 32
+) -> np.array:
+    """
+    Retrotransformação
+    ------------------
+    Dados os refletores de Householder na forma compacta `(Y, taus)` retornada por `tridiagonalization` (ou por
+    `tridiagonalization_packed`) com `compact = True` e os autovetores `Z` da matriz tridiagonal, retorna
+    `Ht Z`, os autovetores da matriz original, sem formar `Ht`. Os refletores são aplicados do último para o
+    primeiro, em blocos de `block_size` pela representação WY compacta, de modo que o custo é proporcional ao
+    número de colunas de `Z`.
+
+    Parâmetros
+    ----------
+
+    reflectors  :   Tuple[np.array, np.array]
+        Par `(Y, taus)`: os vetores de Householder (em uma matriz densa ou compactada) e seus coeficientes.
+
+    Z   :   np.array
+        Matriz cujas colunas são autovetores da matriz tridiagonal (ou um único vetor).
+
+    block_size  :   int
+        Número de refletores aplicados por vez.
+
+    Retorna
+    -------
+
+    V   :   np.array
+        Matriz `Ht Z`.
+    """
+    (Y, taus) = reflectors
+    V = np.array(Z, dtype=float)
+    n = np.size(V, 0)
+
+    for k0 in reversed(range(0, len(taus), block_size)):
+        k1 = min(k0 + block_size, len(taus))
+        Vk = np.zeros((n - k0, k1 - k0))
+        for k in range(k0, k1):
+            Vk[k - k0 + 1 :, k - k0] = (
+                Y[packed_offset(n, k) + 1 : packed_offset(n, k + 1)]
+                if np.ndim(Y) == 1
+                else Y[k + 1 :, k]
+            )
+        V[k0:] -= np.matmul(
+            np.matmul(Vk, wy_factor(Vk, taus[k0:k1])), np.matmul(Vk.T, V[k0:])
+        )
+
+    return V
+
+
+def wy_factor(V: np.array, taus: np.array) -> np.array:
+    """
+    Representação WY Compacta
+    -------------------------
+    Dados os refletores de Householder `P_j = I - taus[j] v_j v_j^T`, com os vetores `v_j` nas colunas de `V`,
+    retorna a matriz triangular superior `T` tal que `P_1 P_2 ... P_k = I - V T V^T`.
+    """
+    k = len(taus)
+    T = np.zeros((k, k))
+    for j in range(k):
+        T[:j, j] = -taus[j] * np.matmul(T[:j, :j], np.matmul(V[:, j], V[:, :j]))
+        T[j, j] = taus[j]
+
+    return T
@@ -0,0 +1,115 @@
+"""
+Algoritmo de Jacobi
+===================
+Autovalores e autovetores de matrizes reais simétricas densas por rotações de Jacobi em ordem de torneio.
+"""
+import warnings
+from typing import List, Tuple
+
+import numpy as np
+
+
+def round_robin(n: int) -> List[Tuple[np.array, np.array]]:
+    """
+    Ordenação em Torneio
+    --------------------
+    Retorna as rodadas de um torneio em que cada um dos `n` índices enfrenta todos os demais exatamente uma vez
+    (método do círculo). Cada rodada é um par de vetores `(P, Q)` com até `n/2` pares `(P[k], Q[k])` disjuntos,
+    de modo que as rotações de Jacobi de uma mesma rodada comutam e podem ser aplicadas simultaneamente.
+    """
+    m = n + n % 2
+    players = np.arange(m)
+    rounds = []
+    for _ in range(m - 1):
+        (P, Q) = (players[: m // 2], players[m // 2 :][::-1])
+        keep = (P < n) & (Q < n)
+        rounds.append((P[keep], Q[keep]))
+        players = np.concatenate(([players[0], players[-1]], players[1:-1]))
+
+    return rounds
+
+
+def jacobi(
+    A: np.array,
+    V0: np.array = None,
+    epsilon: float = 1e-7,
+    max_sweeps: int = 50,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Algoritmo de Jacobi Cíclico Paralelo
+    ------------------------------------
+    Dada uma matriz real simétrica densa `A`, calcula seus autovalores e autovetores diretamente, sem
+    tridiagonalização, por rotações de Jacobi. Cada varredura percorre todos os pares `(p, q)` na ordem de torneio
+    de `round_robin`: as `n/2` rotações de cada rodada atuam em linhas e colunas disjuntas e são aplicadas de uma
+    só vez, como operações vetorizadas sobre as linhas e colunas selecionadas.
+
+    Antes de cada varredura, o maior elemento fora da diagonal é comparado a `epsilon`; se a matriz já é
+    praticamente diagonal, como ao recalcular matrizes levemente perturbadas, o algoritmo termina sem varreduras.
+
+    Parâmetros
+    ----------
+
+    A   :   np.array
+        Matriz real simétrica.
+
+    V0  :   np.array
+        Matriz à qual as rotações são acumuladas. Se None, utiliza-se a identidade.
+
+    epsilon :   float
+        Valor máximo, em módulo, dos elementos fora da diagonal ao final do algoritmo.
+
+    max_sweeps  :   int
+        Número máximo de varreduras. Se a matriz não convergir nesse número, um `RuntimeWarning` é emitido e o
+        resultado parcial é retornado.
+
+    Retorna
+    -------
+
+    (alphas, betas)   :   Tuple[np.array, np.array]
+        Autovalores e a sobrediagonal nula, no mesmo formato do `qr_algorithm`.
+
+    V : np.array
+        Matriz com os auto-vetores da matriz A.
+
+    sweeps : int
+        Número de varreduras executadas.
+    """
+    A = np.array(A, dtype=float)
+    n = np.size(A, 0)
+    V = np.identity(n) if V0 is None else np.array(V0, dtype=float)
+    rounds = round_robin(n)
+
+    sweeps = 0
+    while True:
+        off_diagonal = np.max(np.abs(A - np.diag(np.diag(A))), initial=0)
+        if off_diagonal < epsilon:
+            break
+        if sweeps == max_sweeps:
+            warnings.warn(
+                f"O método de Jacobi não convergiu em {max_sweeps} varreduras "
+                f"(maior elemento fora da diagonal: {off_diagonal:.1e}).",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            break
+
+        for (P, Q) in rounds:
+            a_pq = A[P, Q]
+            rotate = a_pq != 0
+            tau = (A[Q, Q] - A[P, P]) / (2 * np.where(rotate, a_pq, 1))
+            t = np.where(tau >= 0, 1.0, -1.0) / (np.abs(tau) + np.hypot(1, tau))
+            t = np.where(rotate, t, 0)
+            c = 1 / np.sqrt(1 + t ** 2)
+            s = t * c
+
+            (c_col, s_col) = (c[:, None], s[:, None])
+            (A_p, A_q) = (A[P], A[Q])
+            (A[P], A[Q]) = (c_col * A_p - s_col * A_q, s_col * A_p + c_col * A_q)
+            (A_p, A_q) = (A[:, P], A[:, Q])
+            (A[:, P], A[:, Q]) = (c * A_p - s * A_q, s * A_p + c * A_q)
+            (V_p, V_q) = (V[:, P], V[:, Q])
+            (V[:, P], V[:, Q]) = (c * V_p - s * V_q, s * V_p + c * V_q)
+
+        sweeps += 1
+
+    return (np.diag(A).copy(), np.zeros(max(n - 1, 0)), V, sweeps)
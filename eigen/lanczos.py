@@ -0,0 +1,242 @@
+"""
+Método de Lanczos
+=================
+Autovalores extremos de matrizes simétricas grandes e esparsas pelo método de Lanczos, com reortogonalização
+seletiva e transformação espectral de deslocamento e inversão, para os autovalores mais próximos de um `sigma`
+(em particular, as menores frequências de uma treliça, com `sigma = 0`).
+
+A matriz só é acessada por produtos matriz-vetor (ou, no modo de inversão, por soluções de sistemas lineares com a
+matriz fatorada uma única vez), e o problema tridiagonal resultante, pequeno, é resolvido pelo `qr_algorithm`.
+A fatoração esparsa usa o SciPy, se disponível; sem ele, a inversa é densa.
+"""
+import warnings
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .backends import BACKENDS
+from .qr import qr_algorithm
+
+try:
+    import scipy.sparse as sparse
+    import scipy.sparse.linalg as sparse_linalg
+except ImportError:
+    sparse = None
+
+RITZ_BACKEND = "scipy" if "scipy" in BACKENDS else "mrrr"
+
+
+def shift_invert(A, sigma: float = 0.0) -> Callable[[np.array], np.array]:
+    """
+    Deslocamento e Inversão
+    -----------------------
+    Fatora `A - sigma I` uma única vez e retorna a função `v -> (A - sigma I)^-1 v`. Com o SciPy, `A` pode ser
+    uma matriz esparsa (ou densa, convertida para o formato CSC) e a fatoração é a LU esparsa de `splu`, cujo
+    custo, para matrizes de treliças, cresce aproximadamente de forma linear com o número de nós. Sem o SciPy, a
+    inversa densa é calculada.
+
+    Parâmetros
+    ----------
+
+    A   :   np.array
+        Matriz real simétrica, densa ou esparsa.
+
+    sigma   :   float
+        Deslocamento: os autovalores de `A` mais próximos de `sigma` tornam-se os maiores do operador.
+
+    Retorna
+    -------
+
+    operator    :   Callable[[np.array], np.array]
+        Função que aplica `(A - sigma I)^-1` a um vetor.
+    """
+    n = np.shape(A)[0]
+
+    if sparse is not None:
+        B = sparse.csc_matrix(A) - sigma * sparse.identity(n, format="csc")
+        return sparse_linalg.splu(sparse.csc_matrix(B)).solve
+
+    B = np.asarray(A.todense() if hasattr(A, "todense") else A, dtype=float)
+    inverse = np.linalg.inv(B - sigma * np.identity(n))
+    return lambda v: np.matmul(inverse, v)
+
+
+def ritz_pairs(
+    alphas: np.array, betas: np.array, final: bool = False
+) -> Tuple[np.array, np.array]:
+    """
+    Retorna os valores de Ritz, em ordem decrescente de módulo, e os autovetores da matriz tridiagonal de Lanczos. A
+    matriz é normalizada antes da solução, para que o critério absoluto de convergência do Algoritmo QR seja relativo
+    à sua norma. Durante as iterações, usa-se o backend fixo `RITZ_BACKEND` (o LAPACK, se o SciPy estiver
+    disponível, ou o `mrrr`), sem passar pela escolha automática de `solve`; com `final = True`, o `qr_algorithm`.
+    """
+    scale = max(
+        np.max(np.abs(alphas)), np.max(np.abs(betas), initial=0), np.finfo(float).tiny
+    )
+    if final:
+        (theta, _, S, _) = qr_algorithm(alphas / scale, betas / scale, epsilon=1e-13)
+    else:
+        (theta, _, S, _) = BACKENDS[RITZ_BACKEND](alphas / scale, betas / scale)
+    order = np.argsort(np.abs(theta))[::-1]
+    return (theta[order] * scale, S[:, order])
+
+
+def lanczos(
+    operator: Callable[[np.array], np.array],
+    v0: np.array,
+    max_steps: int,
+    k: int = None,
+    tolerance: float = 1e-10,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Método de Lanczos com Reortogonalização Seletiva
+    ------------------------------------------------
+    Constrói, a partir de `v0`, a base ortonormal `Q` do subespaço de Krylov do operador simétrico `operator` e a
+    matriz tridiagonal `T = Q^T A Q`, representada por `alphas` e `betas`.
+
+    Em aritmética de ponto flutuante, os vetores de Lanczos perdem a ortogonalidade justamente na direção dos
+    vetores de Ritz que convergiram. Após cada passo, os valores de Ritz de `T` são calculados; aqueles cuja
+    estimativa de erro `|beta_j s_ji|` é menor que `sqrt(eps) ||T||` têm seus vetores de Ritz `y_i = Q s_i`
+    formados, e o novo vetor é ortogonalizado contra eles (reortogonalização seletiva de Parlett e Scott). Os demais
+    vetores de Lanczos não são revisitados.
+
+    Parâmetros
+    ----------
+
+    operator    :   Callable[[np.array], np.array]
+        Função que aplica o operador simétrico a um vetor.
+
+    v0  :   np.array
+        Vetor inicial (não nulo).
+
+    max_steps   :   int
+        Número máximo de passos (dimensão máxima do subespaço).
+
+    k   :   int
+        Se dado, o processo termina quando os `k` valores de Ritz de maior módulo convergem, com erro relativo
+        estimado menor que `tolerance`; se `max_steps` passos não bastarem, emite um `RuntimeWarning`.
+
+    tolerance   :   float
+        Tolerância relativa de convergência dos valores de Ritz.
+
+    Retorna
+    -------
+
+    (alphas, betas, Q, reorthogonalizations)  :   Tuple[np.array, np.array, np.array, int]
+        A matriz tridiagonal, a base `Q` (uma coluna por passo) e o número de reortogonalizações contra vetores de
+        Ritz efetuadas.
+    """
+    n = len(v0)
+    max_steps = min(max_steps, n)
+    Q = np.zeros((n, max_steps))
+    alphas = np.zeros(max_steps)
+    betas = np.zeros(max_steps)
+    threshold = np.sqrt(np.finfo(float).eps)
+    reorthogonalizations = 0
+
+    q = np.asarray(v0, dtype=float) / np.linalg.norm(v0)
+    q_prev = np.zeros(n)
+    beta = 0.0
+
+    for j in range(max_steps):
+        Q[:, j] = q
+        r = operator(q) - beta * q_prev
+        alphas[j] = np.dot(q, r)
+        r -= alphas[j] * q
+        beta = np.linalg.norm(r)
+
+        (theta, S) = ritz_pairs(alphas[: j + 1], betas[:j])
+        norm = np.max(np.abs(theta))
+        errors = beta * np.abs(S[-1])
+
+        good = errors <= threshold * norm
+        if np.any(good):
+            Y = np.matmul(Q[:, : j + 1], S[:, good])
+            r -= np.matmul(Y, np.matmul(r, Y))
+            beta = np.linalg.norm(r)
+            reorthogonalizations += int(np.sum(good))
+
+        converged = (
+            k is not None
+            and j + 1 >= k
+            and np.all(errors[:k] <= tolerance * np.abs(theta[:k]))
+        )
+        invariant = beta <= np.finfo(float).eps * norm
+        if converged or invariant or j + 1 == max_steps:
+            if k is not None and not (converged or invariant):
+                error = np.max(
+                    errors[:k] / np.maximum(np.abs(theta[:k]), np.finfo(float).tiny)
+                )
+                warnings.warn(
+                    f"O método de Lanczos não convergiu em {max_steps} passos "
+                    f"(maior erro relativo estimado: {error:.1e}).",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            return (alphas[: j + 1], betas[:j], Q[:, : j + 1], reorthogonalizations)
+
+        betas[j] = beta
+        (q_prev, q) = (q, r / beta)
+
+
+def lanczos_eigsh(
+    A,
+    k: int,
+    sigma: float = 0.0,
+    v0: np.array = None,
+    max_steps: int = None,
+    tolerance: float = 1e-10,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, int]:
+    """
+    Autovalores Próximos de `sigma`
+    -------------------------------
+    Calcula os `k` autovalores da matriz simétrica `A` mais próximos de `sigma`, e seus autovetores, pelo método de
+    Lanczos aplicado a `(A - sigma I)^-1` (veja `shift_invert` e `lanczos`): os autovalores `theta` do operador
+    correspondem a `lambda = sigma + 1 / theta`, e os procurados tornam-se os maiores e mais bem separados, de modo
+    que poucos passos bastam. O problema tridiagonal de Lanczos é resolvido pelo `qr_algorithm`.
+
+    Parâmetros
+    ----------
+
+    A   :   np.array
+        Matriz real simétrica, densa ou esparsa (`scipy.sparse`).
+
+    k   :   int
+        Número de autovalores desejados.
+
+    sigma   :   float
+        Deslocamento em torno do qual os autovalores são procurados.
+
+    v0  :   np.array
+        Vetor inicial. Se None, um vetor aleatório gerado com a semente `seed`.
+
+    max_steps   :   int
+        Número máximo de passos de Lanczos. Se None, `max(4 k, 40)`.
+
+    tolerance   :   float
+        Tolerância relativa de convergência dos valores de Ritz.
+
+    seed    :   int
+        Semente do vetor inicial aleatório.
+
+    Retorna
+    -------
+
+    (Lambda, V, steps)  :   Tuple[np.array, np.array, int]
+        Os autovalores, em ordem crescente, a matriz com os autovetores correspondentes nas colunas e o número de
+        passos de Lanczos executados.
+    """
+    n = np.shape(A)[0]
+    if v0 is None:
+        v0 = np.random.default_rng(seed).standard_normal(n)
+    if max_steps is None:
+        max_steps = max(4 * k, 40)
+
+    (alphas, betas, Q, _) = lanczos(shift_invert(A, sigma), v0, max_steps, k, tolerance)
+    (theta, S) = ritz_pairs(alphas, betas, final=True)
+    Lambda = sigma + 1 / theta[:k]
+    V = np.matmul(Q, S[:, :k])
+
+    order = np.argsort(Lambda)
+    return (Lambda[order], V[:, order], len(alphas))
@@ -0,0 +1,191 @@
+"""
+LOBPCG
+======
+Método do Gradiente Conjugado Pré-condicionado Localmente Ótimo em Blocos (LOBPCG, de Knyazev) para os menores
+autovalores do problema generalizado `K x = lambda M x`, trabalhando diretamente sobre o par `(K, M)`: cada
+iteração faz apenas alguns produtos de `K` e `M` por blocos de vetores e um pequeno passo de Rayleigh-Ritz denso.
+"""
+import warnings
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .components import dense_eigensystem
+from .generalized import triangular_solve
+from .lanczos import RITZ_BACKEND
+
+DROP_TOLERANCE = 1e-10
+
+
+def apply(A, X: np.array) -> np.array:
+    """
+    Retorna `A X` para uma matriz `A` densa ou `scipy.sparse`, ou para uma matriz diagonal dada pelo vetor da sua
+    diagonal.
+    """
+    if np.ndim(A) == 1:
+        return A[:, None] * X
+    return A @ X
+
+
+def m_orthonormalize(S: np.array, MS: np.array) -> Tuple[np.array, np.array]:
+    """
+    Torna as colunas de `S` `M`-ortonormais pelo método de Cholesky-QR, `S^T M S = L L^T` e `S <- S L^-T`, e
+    atualiza `MS = M S` da mesma forma, sem novos produtos por `M`. Se `S^T M S` não for numericamente definida
+    positiva, ou se alguma coluna tiver, relativamente à sua norma, uma componente `M`-ortogonal às anteriores
+    menor que `sqrt(DROP_TOLERANCE)` (colunas quase dependentes), levanta `np.linalg.LinAlgError`.
+    """
+    G = np.matmul(S.T, MS)
+    L = np.linalg.cholesky((G + G.T) / 2)
+    if np.any(np.diag(L) ** 2 <= DROP_TOLERANCE * np.diag(G)):
+        raise np.linalg.LinAlgError("Colunas numericamente dependentes.")
+    return (triangular_solve(L, S.T).T, triangular_solve(L, MS.T).T)
+
+
+def m_complement(
+    X: np.array,
+    MX: np.array,
+    S: np.array,
+    MS: np.array,
+    tolerance: float = DROP_TOLERANCE,
+) -> Tuple[np.array, np.array]:
+    """
+    Torna as colunas de `S` `M`-ortogonais às de `X` (já `M`-ortonormais) e `M`-ortonormais entre si, descartando
+    as direções numericamente dependentes, e atualiza `MS = M S` da mesma forma. As colunas são normalizadas e
+    projetadas duas vezes no complemento de `X`; a matriz de Gram `G = S^T M S` resultante é diagonalizada,
+    `G = U diag(s) U^T`, e apenas as direções com `s > tolerance` são mantidas, `S <- S U diag(s)^-1/2`. Ao
+    contrário de `m_orthonormalize`, nunca falha: no pior caso, retorna zero colunas.
+    """
+    norms = np.sqrt(np.maximum(np.sum(S * MS, axis=0), 0))
+    (S, MS) = (S[:, norms > 0] / norms[norms > 0], MS[:, norms > 0] / norms[norms > 0])
+    for _ in range(2):
+        C = np.matmul(MX.T, S)
+        (S, MS) = (S - np.matmul(X, C), MS - np.matmul(MX, C))
+    if np.size(S, 1) == 0:
+        return (S, MS)
+
+    G = np.matmul(S.T, MS)
+    (s, U) = dense_eigensystem((G + G.T) / 2, RITZ_BACKEND)
+    keep = s > tolerance
+    U = U[:, keep] / np.sqrt(s[keep])
+    return (np.matmul(S, U), np.matmul(MS, U))
+
+
+def lobpcg(
+    K,
+    M,
+    k: int = None,
+    X0: np.array = None,
+    preconditioner: Callable[[np.array], np.array] = None,
+    tolerance: float = 1e-8,
+    max_iterations: int = 200,
+    seed: int = 0,
+) -> Tuple[np.array, np.array, int]:
+    """
+    Método LOBPCG
+    -------------
+    Calcula os `k` menores autovalores de `K x = lambda M x` e seus autovetores. A cada iteração, com o bloco
+    atual `X` de aproximações `M`-ortonormais e os valores de Ritz `theta`:
+
+    - os resíduos `R = K X - M X theta` das colunas ainda não convergidas são pré-condicionados, `W = T(R)`;
+    - a base `S = [X, W, P]`, em que `P` é a direção da iteração anterior, é `M`-ortonormalizada
+      (veja `m_orthonormalize`); se ficar numericamente dependente, `[W, P]` é ortonormalizada no complemento de
+      `X` e as suas direções dependentes são descartadas (veja `m_complement`);
+    - o passo de Rayleigh-Ritz resolve o pequeno problema denso `S^T K S c = theta c` por `tridiagonalization` e
+      pelo backend fixo `RITZ_BACKEND` (veja `dense_eigensystem`), sem passar pela escolha automática de `solve`,
+      e os `m` menores pares dão o novo `X = S C` e `P = [W, P] C_WP`.
+
+    Uma coluna converge quando `||K x - theta M x|| <= tolerance |theta| ||M x||`; colunas convergidas continuam no
+    bloco, mas deixam de gerar direções novas. O custo de cada iteração é dominado por um produto de `K` e um de
+    `M` pelo bloco `S`, de no máximo `3 m` colunas. Se os `k` primeiros pares não convergirem em `max_iterations`
+    iterações, emite um `RuntimeWarning` e retorna as melhores aproximações obtidas.
+
+    Parâmetros
+    ----------
+
+    K   :   np.array
+        Matriz real simétrica, densa ou `scipy.sparse`.
+
+    M   :   np.array
+        Matriz simétrica definida positiva, densa, `scipy.sparse` ou o vetor da sua diagonal.
+
+    k   :   int
+        Número de autovalores desejados. Se None, o número de colunas de `X0`.
+
+    X0  :   np.array
+        Aproximações iniciais (por exemplo, os modos de uma análise anterior), `n x m` com `m >= k`. Se None, `k`
+        vetores aleatórios gerados com a semente `seed`.
+
+    preconditioner  :   Callable[[np.array], np.array]
+        Função que aplica um pré-condicionador simétrico definido positivo, aproximação de `K^-1`, a um bloco de
+        vetores (por exemplo, `shift_invert(K)`, ou a divisão pela diagonal de `K`). Se None, a identidade.
+
+    tolerance   :   float
+        Tolerância relativa dos resíduos.
+
+    max_iterations  :   int
+        Número máximo de iterações.
+
+    seed    :   int
+        Semente das aproximações iniciais aleatórias.
+
+    Retorna
+    -------
+
+    (Lambda, X, iterations)  :   Tuple[np.array, np.array, int]
+        Os `k` menores autovalores, em ordem crescente, a matriz com os autovetores `M`-ortonormais
+        correspondentes e o número de iterações executadas.
+    """
+    n = np.shape(K)[0]
+    if X0 is None:
+        X0 = np.random.default_rng(seed).standard_normal((n, k))
+    X = np.array(X0, dtype=float).reshape(n, -1)
+    k = np.size(X, 1) if k is None else k
+    m = np.size(X, 1)
+
+    (X, MX) = m_orthonormalize(X, apply(M, X))
+    KX = apply(K, X)
+    (theta, C) = dense_eigensystem(np.matmul(X.T, KX), RITZ_BACKEND)
+    order = np.argsort(theta, kind="stable")
+    (theta, C) = (theta[order], C[:, order])
+    (X, KX, MX) = (np.matmul(X, C), np.matmul(KX, C), np.matmul(MX, C))
+    P = np.zeros((n, 0))
+    iteration = 0
+
+    for iteration in range(1, max_iterations + 2):
+        R = KX - MX * theta
+        residuals = np.linalg.norm(R, axis=0)
+        active = residuals > tolerance * np.abs(theta) * np.linalg.norm(MX, axis=0)
+        if not np.any(active[:k]):
+            break
+        if iteration > max_iterations:
+            iteration = max_iterations
+            error = np.max(
+                residuals[:k] / (np.abs(theta[:k]) * np.linalg.norm(MX[:, :k], axis=0))
+            )
+            warnings.warn(
+                f"O método LOBPCG não convergiu em {max_iterations} iterações "
+                f"(maior resíduo relativo: {error:.1e}).",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            break
+
+        W = R[:, active] if preconditioner is None else preconditioner(R[:, active])
+        W = W - np.matmul(X, np.matmul(MX.T, W))
+        try:
+            S = np.hstack((X, W, P))
+            (S, MS) = m_orthonormalize(S, apply(M, S))
+        except np.linalg.LinAlgError:
+            WP = np.hstack((W, P))
+            (WP, MWP) = m_complement(X, MX, WP, apply(M, WP))
+            (S, MS) = (np.hstack((X, WP)), np.hstack((MX, MWP)))
+        KS = apply(K, S)
+
+        (theta, C) = dense_eigensystem(np.matmul(S.T, KS), RITZ_BACKEND)
+        order = np.argsort(theta, kind="stable")[:m]
+        (theta, C) = (theta[order], C[:, order])
+
+        (X, KX, MX) = (np.matmul(S, C), np.matmul(KS, C), np.matmul(MS, C))
+        P = np.matmul(S[:, m:], C[m:][:, active])
+
+    return (theta[:k], X[:, :k], iteration)
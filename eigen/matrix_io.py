@@ -0,0 +1,153 @@
+"""
+Leitura e Escrita de Matrizes
+=============================
+Leitura vetorizada de matrizes em texto (o formato dos arquivos _input-a_ e _input-b_: a ordem `n` seguida das
+`n^2` entradas, separadas por espaços ou quebras de linha) e um formato binário com cabeçalho que pode ser aberto
+sem cópia, por mapeamento em memória (`numpy.memmap`).
+
+O arquivo binário começa com um cabeçalho de `HEADER_SIZE` bytes: a assinatura `MAGIC`, a ordem `n` (inteiro de
+64 bits, little-endian), o tipo dos elementos (`dtype.str` do NumPy, completado com bytes nulos até 8 bytes) e um
+campo de indicadores (`SYMMETRIC`, `PACKED`). Em seguida vêm as entradas, em ordem C: a matriz `n x n` ou, se
+`PACKED`, o vetor compactado de `eigen.packed`.
+"""
+import struct
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from .packed import pack_rows, packed_order
+
+MAGIC = b"EIGENMAT"
+HEADER = struct.Struct("<8sQ8sQ")
+HEADER_SIZE = HEADER.size
+SYMMETRIC = 1
+PACKED = 2
+
+
+def text_rows(file, n: int) -> Iterator[np.array]:
+    """
+    Lê as próximas `n` linhas de uma matriz `n x n` do arquivo de texto aberto `file`, uma de cada vez.
+    """
+    for _ in range(n):
+        row = np.fromfile(file, sep=" ", count=n)
+        if len(row) < n:
+            raise ValueError("O arquivo não contém as n^2 entradas da matriz.")
+        yield row
+
+
+def read_text(filename: str, packed: bool = False) -> np.array:
+    """
+    Leitura de matriz em texto
+    --------------------------
+    Lê o arquivo `filename` com `numpy.fromfile` e retorna a matriz nele descrita, sem montar listas do Python
+    para as linhas: a matriz densa é lida de uma só vez e, se `packed`, as linhas são lidas uma a uma e copiadas
+    diretamente para o vetor compactado (veja `pack_rows`), sem montar a matriz densa.
+
+    Parâmetros
+    ----------
+
+    filename  :   str
+        Nome do arquivo, com a ordem `n` seguida das entradas da matriz, linha a linha.
+
+    packed  :   bool
+        Se True, retorna apenas o triângulo inferior da matriz simétrica, no formato compactado de `eigen.packed`.
+
+    Retorna
+    -------
+
+    matrix   :   np.array
+        Matriz `n x n` (ou seu vetor compactado).
+    """
+    with open(filename, encoding="utf-8") as file:
+        n = int(np.fromfile(file, sep=" ", count=1)[0])
+        if packed:
+            return pack_rows(text_rows(file, n), n)
+
+        values = np.fromfile(file, sep=" ", count=n * n)
+    if len(values) < n * n:
+        raise ValueError("O arquivo não contém as n^2 entradas da matriz.")
+    return values.reshape(n, n)
+
+
+def read_header(filename: str) -> Tuple[int, np.dtype, bool, bool]:
+    """
+    Lê apenas o cabeçalho do arquivo binário `filename`, sem tocar nas entradas, e retorna a tupla
+    `(n, dtype, symmetric, packed)`.
+    """
+    with open(filename, "rb") as file:
+        data = file.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE or data[: len(MAGIC)] != MAGIC:
+        raise ValueError("O arquivo não está no formato binário de matrizes.")
+
+    (_, n, dtype, flags) = HEADER.unpack(data)
+    return (
+        n,
+        np.dtype(dtype.rstrip(b"\0").decode("ascii")),
+        bool(flags & SYMMETRIC),
+        bool(flags & PACKED),
+    )
+
+
+def is_binary(filename: str) -> bool:
+    """
+    Retorna True se o arquivo `filename` começa com a assinatura do formato binário.
+    """
+    with open(filename, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_binary(filename: str, matrix: np.array, symmetric: bool = True):
+    """
+    Escrita de matriz em binário
+    ----------------------------
+    Escreve a matriz `matrix` (ou, se for um vetor, a matriz simétrica compactada que ele representa) em
+    `filename`, no formato binário deste módulo.
+
+    Parâmetros
+    ----------
+
+    filename  :   str
+        Nome do arquivo de saída.
+
+    matrix  :   np.array
+        Matriz `n x n`, ou vetor compactado de `eigen.packed`.
+
+    symmetric   :   bool
+        Indica, no cabeçalho, se a matriz densa é simétrica. Vetores compactados são sempre simétricos.
+    """
+    matrix = np.ascontiguousarray(matrix)
+    packed = np.ndim(matrix) == 1
+    n = packed_order(matrix) if packed else np.size(matrix, 0)
+    flags = (SYMMETRIC if symmetric or packed else 0) | (PACKED if packed else 0)
+
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, n, matrix.dtype.str.encode("ascii"), flags))
+        matrix.tofile(file)
+
+
+def open_binary(filename: str, mode: str = "r") -> np.array:
+    """
+    Abertura de matriz em binário
+    -----------------------------
+    Mapeia em memória as entradas do arquivo binário `filename`, sem lê-las nem copiá-las: retorna um
+    `numpy.memmap` de formato `(n, n)` ou, para matrizes compactadas, `(n (n + 1) / 2,)`, que pode ser passado
+    diretamente a `tridiagonalization` ou a `tridiagonalization_ooc`.
+
+    Parâmetros
+    ----------
+
+    filename  :   str
+        Nome do arquivo binário.
+
+    mode    :   str
+        Modo de abertura do `numpy.memmap` (`"r"`, `"r+"` ou `"c"`).
+
+    Retorna
+    -------
+
+    matrix   :   np.memmap
+        As entradas da matriz, mapeadas do arquivo.
+    """
+    (n, dtype, _, packed) = read_header(filename)
+    shape = (n * (n + 1) // 2,) if packed else (n, n)
+    return np.memmap(filename, dtype=dtype, mode=mode, offset=HEADER_SIZE, shape=shape)
@@ -0,0 +1,181 @@
+"""
+Superposição Modal
+==================
+Resposta livre de sistemas `x'' + A x = 0` (por exemplo, cadeias massa-mola) pela superposição dos modos de
+vibração: com `A = V diag(Lambda) V^T` e `omega = sqrt(Lambda)`,
+
+    X(t) = V (Y0 * cos(omega t) + Y0' * sin(omega t) / omega),   Y0 = V^T X(0),   Y0' = V^T X'(0).
+
+Nos modos de corpo rígido (`omega = 0`, como em cadeias de extremidades livres), o último termo é o seu limite,
+`Y0' t`, e autovalores levemente negativos, resultado de arredondamento, são tratados como nulos.
+
+A resposta é avaliada em uma grade de instantes por produtos de matrizes, para vários conjuntos de condições
+iniciais de uma vez, em blocos de instantes cujo tamanho é limitado por um orçamento de memória.
+
+A matriz `A` de uma cadeia de massas e molas é tridiagonal e é montada diretamente na forma `(alphas, betas)`
+usada pelos algoritmos do núcleo, com O(n) de memória (veja `spring_chain`).
+"""
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from .outofcore import MEMORY, panels
+
+
+def spring_chain(
+    k: np.array, m: np.array = 2.0, fixed_left: bool = True, fixed_right: bool = True
+) -> Tuple[np.array, np.array]:
+    """
+    Cadeia Massa-Mola
+    -----------------
+    Monta a matriz tridiagonal simétrica `A = M^-1/2 K M^-1/2` de uma cadeia de `n` massas ligadas por molas, em
+    que a mola `k_i` liga a massa `i` à seguinte e as extremidades podem estar presas a paredes (por uma mola a
+    mais em cada extremidade fixa) ou livres. A diagonal é `(k_esq + k_dir) / m_i` e a sobrediagonal,
+    `-k / sqrt(m_i m_(i+1))`; nenhuma matriz densa é formada, de modo que cadeias com milhões de massas cabem em
+    memória e podem ser passadas diretamente a `solve`, `dqds` ou `mrrr`.
+
+    Parâmetros
+    ----------
+
+    k   :   np.array
+        As constantes elásticas das molas, da esquerda para a direita: `n - 1` molas entre as massas, mais uma
+        para cada extremidade fixa.
+
+    m   :   np.array
+        As massas (um vetor de `n` valores, ou um único valor para todas).
+
+    fixed_left  :   bool
+        Se True, a primeira massa está presa à parede esquerda pela mola `k[0]`.
+
+    fixed_right :   bool
+        Se True, a última massa está presa à parede direita pela mola `k[-1]`.
+
+    Retorna
+    -------
+
+    (alphas, betas)  :   Tuple[np.array, np.array]
+        A diagonal principal e a sobrediagonal de `A`.
+    """
+    k = np.asarray(k, dtype=float)
+    n = len(k) + 1 - int(fixed_left) - int(fixed_right)
+    if n < 1:
+        raise ValueError("A cadeia deve ter pelo menos uma massa.")
+    m = np.broadcast_to(np.asarray(m, dtype=float), (n,))
+    inner = k[int(fixed_left) : len(k) - int(fixed_right)]
+
+    stiffness = np.zeros(n)
+    stiffness[:-1] += inner
+    stiffness[1:] += inner
+    if fixed_left:
+        stiffness[0] += k[0]
+    if fixed_right:
+        stiffness[-1] += k[-1]
+
+    return (stiffness / m, -inner / np.sqrt(m[:-1] * m[1:]))
+
+
+def modal_chunks(
+    Lambda: np.array,
+    V: np.array,
+    X0: np.array,
+    time: np.array,
+    memory: int = MEMORY,
+    velocity: np.array = None,
+) -> Iterator[Tuple[int, int, np.array]]:
+    """
+    Resposta Modal em Blocos
+    ------------------------
+    Percorre a grade `time` em blocos de instantes consecutivos e retorna, para cada bloco `[t0, t1)`, a tupla
+    `(t0, t1, X)` com a resposta nesses instantes. O bloco é escolhido para que `X` e as matrizes auxiliares
+    ocupem no máximo `memory` bytes, independentemente do número total de instantes.
+
+    Parâmetros
+    ----------
+
+    Lambda  :   np.array
+        Os autovalores de `A` (os quadrados das frequências naturais).
+
+    V   :   np.array
+        A matriz `n x m` com os modos de vibração nas colunas (todos os `m = n` modos, ou apenas alguns, para uma
+        resposta truncada).
+
+    X0  :   np.array
+        Condição inicial (vetor de `n` posições) ou várias condições iniciais, nas colunas de uma matriz `n x b`.
+
+    time    :   np.array
+        Os instantes em que a resposta é avaliada.
+
+    memory  :   int
+        Orçamento de memória de cada bloco, em bytes.
+
+    velocity    :   np.array
+        Velocidade inicial, no mesmo formato de `X0`. Se None, a velocidade inicial é nula.
+
+    Retorna
+    -------
+
+    (t0, t1, X)  :   Iterator[Tuple[int, int, np.array]]
+        Os índices do bloco na grade e a resposta `n x (t1 - t0)` (ou `b x n x (t1 - t0)`, para várias condições
+        iniciais).
+    """
+    time = np.asarray(time, dtype=float).reshape(-1)
+    X0 = np.asarray(X0, dtype=float)
+    batch = X0.reshape(len(X0), -1)
+    (n, m, b) = (np.size(V, 0), np.size(V, 1), np.size(batch, 1))
+
+    omega = np.sqrt(np.maximum(np.asarray(Lambda, dtype=float)[:m], 0.0))
+    Y0 = np.matmul(V.T, batch).T[:, :, None]
+    if velocity is not None:
+        velocity = np.asarray(velocity, dtype=float).reshape(n, -1)
+        dY0 = np.matmul(V.T, velocity).T[:, :, None]
+    terms = 1 if velocity is None else 2
+    rows = max(1, int(memory // (8 * terms * (m + b * (m + n)))))
+
+    for (t0, t1) in panels(0, len(time), rows):
+        phase = np.multiply.outer(omega, time[t0:t1])
+        Y = Y0 * np.cos(phase)
+        if velocity is not None:
+            Y += dY0 * (time[t0:t1] * np.sinc(phase / np.pi))
+        X = np.matmul(V, Y)
+        yield (t0, t1, X if X0.ndim > 1 else X[0])
+
+
+def modal_response(
+    Lambda: np.array,
+    V: np.array,
+    X0: np.array,
+    time: np.array,
+    out: np.array = None,
+    memory: int = MEMORY,
+    velocity: np.array = None,
+) -> np.array:
+    """
+    Resposta Modal
+    --------------
+    Calcula a resposta `X(t)` nos instantes `time` (veja `modal_chunks`) e a guarda em `out`, um bloco de cada
+    vez: para horizontes longos, `out` pode ser um `numpy.memmap`, e apenas um bloco fica em memória.
+
+    Parâmetros
+    ----------
+
+    Lambda, V, X0, time, memory, velocity
+        Como em `modal_chunks`.
+
+    out :   np.array
+        Matriz de saída, `n x T` (ou `b x n x T`). Se None, é alocada em memória.
+
+    Retorna
+    -------
+
+    out  :   np.array
+        A resposta, com uma linha por grau de liberdade e uma coluna por instante.
+    """
+    time = np.asarray(time, dtype=float).reshape(-1)
+    shape = np.shape(X0)[1:][::-1] + (np.size(V, 0), len(time))
+    if out is None:
+        out = np.zeros(shape)
+
+    for (t0, t1, X) in modal_chunks(Lambda, V, X0, time, memory, velocity):
+        out[..., t0:t1] = X
+
+    return out
@@ -0,0 +1,570 @@
+"""
+Algoritmo MRRR
+==============
+Autovalores e autovetores de matrizes tridiagonais simétricas em O(n^2) pelo método das Múltiplas Representações
+Relativamente Robustas.
+
+As recorrências de uma representação `L D L^T` (contagens de Sturm, deslocamentos e fatorações torcidas) percorrem
+a matriz uma única vez e são vetorizadas sobre os autovalores: `d` e `l` podem ser vetores, com uma representação
+comum a todos os autovalores, ou matrizes `n x k`, com uma representação por coluna. Assim, todos os aglomerados
+de um mesmo nível da árvore de representações são processados juntos, e o número de passos interpretados pelo
+Python não depende do número de aglomerados.
+
+Pivôs menores que `PIVMIN` em módulo são substituídos por `-PIVMIN` nessas recorrências. O valor é absoluto, e
+por isso `mrrr` divide cada bloco não reduzido por uma potência de 2 próxima da sua norma (veja `unit_scale`)
+antes de construir as representações: `PIVMIN` passa a ser relativo à norma do bloco, e matrizes de escala muito
+grande ou muito pequena são tratadas como as de norma 1.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .dqds import definite_shift, gershgorin_bounds, unit_scale
+from .jacobi import jacobi
+
+GROWTH = (64, 1024)
+
+MAX_DEPTH = 10
+
+PIVMIN = np.sqrt(np.finfo(float).tiny)
+
+
+def ldl_shift(d: np.array, l: np.array, tau: np.array) -> Tuple[np.array, np.array]:
+    """
+    Deslocamento de uma representação LDL^T
+    ---------------------------------------
+    Dada a representação `L D L^T` de uma matriz tridiagonal simétrica, pela diagonal `d` de D e pela subdiagonal `l`
+    de L, calcula `L D L^T - tau * I = L+ D+ L+^T` pela transformação qd diferencial estacionária (dstqds), que
+    preserva a precisão relativa das entradas. O cálculo é vetorizado sobre `tau` (e sobre as colunas de `d` e `l`,
+    se forem matrizes).
+
+    Retorna
+    -------
+
+    (d+, l+)    :   Tuple[np.array, np.array]
+        Diagonal de D+ e subdiagonal de L+, com uma coluna por deslocamento.
+    """
+    tau = np.asarray(tau, dtype=float)
+    shape = np.broadcast(d[0], tau).shape
+    d_k = np.zeros((len(d),) + shape)
+    l_k = np.zeros((len(l),) + shape)
+
+    s = -tau
+    for i in range(len(l)):
+        d_plus = d[i] + s
+        d_k[i] = np.where(np.abs(d_plus) < PIVMIN, -PIVMIN, d_plus)
+        l_k[i] = d[i] * l[i] / d_k[i]
+        s = l_k[i] * l[i] * s - tau
+    d_k[-1] = d[-1] + s
+
+    return (d_k, l_k)
+
+
+def ldl_negcount(d: np.array, l: np.array, x: np.array) -> np.array:
+    """
+    Contagem de Sturm de uma representação LDL^T
+    --------------------------------------------
+    Para cada entrada de `x`, retorna o número de autovalores de `L D L^T` menores que ela, que é o número de
+    pivôs negativos de `L D L^T - x I`. O cálculo é vetorizado sobre `x` (e sobre as colunas de `d` e `l`).
+    """
+    count = np.zeros(np.broadcast(d[0], x).shape, dtype=int)
+    dl2 = d[:-1] * l ** 2
+
+    s = -x
+    for i in range(len(l)):
+        d_k = d[i] + s
+        d_k = np.where(np.abs(d_k) < PIVMIN, -PIVMIN, d_k)
+        count += d_k < 0
+        s = dl2[i] * s / d_k - x
+    count += d[-1] + s < 0
+
+    return count
+
+
+def ldl_bisection(
+    d: np.array,
+    l: np.array,
+    indices: np.array,
+    lower: np.array,
+    upper: np.array,
+    rtol: float = 4 * np.finfo(float).eps,
+) -> Tuple[np.array, int]:
+    """
+    Bissecção de uma representação LDL^T
+    ------------------------------------
+    Calcula, com alta precisão relativa, os autovalores de `L D L^T` cujos índices (em ordem crescente, a partir de
+    0) estão em `indices`, sabendo que cada um pertence ao intervalo `[lower, upper]` correspondente (números ou
+    vetores). Todas as bissecções avançam juntas, de modo que cada passo é uma única contagem de Sturm vetorizada.
+
+    Retorna
+    -------
+
+    (mus, steps)    :   Tuple[np.array, int]
+        Autovalores calculados e número de passos de bissecção executados.
+    """
+    lo = np.array(np.broadcast_to(lower, np.shape(indices)), dtype=float)
+    hi = np.array(np.broadcast_to(upper, np.shape(indices)), dtype=float)
+    tiny = np.finfo(float).tiny
+
+    steps = 0
+    while steps < 200:
+        active = hi - lo > rtol * np.maximum(np.abs(lo), np.abs(hi)) + tiny
+        if not np.any(active):
+            break
+        mid = (lo + hi) / 2
+        below = ldl_negcount(d, l, mid) > indices
+        hi = np.where(active & below, mid, hi)
+        lo = np.where(active & ~below, mid, lo)
+        steps += 1
+
+    return ((lo + hi) / 2, steps)
+
+
+def twisted_vectors(d: np.array, l: np.array, lams: np.array) -> np.array:
+    """
+    Autovetores por Fatoração Torcida
+    ---------------------------------
+    Dada a representação `L D L^T` e autovalores `lams` calculados com alta precisão relativa, calcula os
+    autovetores correspondentes em O(n) cada. Para cada autovalor, as fatorações estacionária
+    (`L+ D+ L+^T`) e progressiva (`U- D- U-^T`) de `L D L^T - lam I` são combinadas na fatoração torcida cujo
+    índice `r` minimiza `|gamma_r|`, e o autovetor é obtido resolvendo `N_r z = gamma_r e_r` com `z_r = 1`.
+    O cálculo é vetorizado sobre `lams` (e sobre as colunas de `d` e `l`).
+
+    Retorna
+    -------
+
+    Z   :   np.array
+        Matriz cujas colunas são os autovetores normalizados.
+    """
+    n = len(d)
+    k = len(lams)
+
+    S = np.zeros((n, k))
+    L_plus = np.zeros((n - 1, k))
+    s = -lams
+    for i in range(n - 1):
+        S[i] = s
+        d_plus = d[i] + s
+        d_plus = np.where(np.abs(d_plus) < PIVMIN, -PIVMIN, d_plus)
+        L_plus[i] = d[i] * l[i] / d_plus
+        s = L_plus[i] * l[i] * s - lams
+    S[n - 1] = s
+
+    P = np.zeros((n, k))
+    U_minus = np.zeros((n - 1, k))
+    p = d[n - 1] - lams
+    for i in reversed(range(n - 1)):
+        P[i + 1] = p
+        d_minus = d[i] * l[i] ** 2 + p
+        d_minus = np.where(np.abs(d_minus) < PIVMIN, -PIVMIN, d_minus)
+        t = d[i] / d_minus
+        U_minus[i] = l[i] * t
+        p = p * t - lams
+    P[0] = p
+
+    r = np.argmin(np.abs(S + P + lams), axis=0)
+
+    Z = np.zeros((n, k))
+    Z[r, np.arange(k)] = 1
+    for i in reversed(range(n - 1)):
+        Z[i] = np.where(i < r, -L_plus[i] * Z[i + 1], Z[i])
+    for i in range(n - 1):
+        Z[i + 1] = np.where(i >= r, -U_minus[i] * Z[i], Z[i + 1])
+
+    return Z / np.linalg.norm(Z, axis=0)
+
+
+def tridiagonal_solve(
+    alphas: np.array, betas: np.array, shifts: np.array, B: np.array
+) -> np.array:
+    """
+    Sistemas Tridiagonais Deslocados
+    --------------------------------
+    Resolve `(A - shifts[j] I) x_j = B[:, j]` para cada coluna `j`, em que `A` é a matriz tridiagonal simétrica
+    representada por `alphas` e `betas`, por eliminação gaussiana com pivotamento parcial (como em `dgtsv`),
+    vetorizada sobre as colunas. Pivôs praticamente nulos, que aparecem quando `shifts[j]` é um autovalor, são
+    substituídos por `eps * ||A||`, como na iteração inversa.
+    """
+    n = len(alphas)
+    k = len(shifts)
+    norm = np.max(np.abs(alphas)) + 2 * np.max(np.abs(betas), initial=0)
+    pivmin = np.finfo(float).eps * max(norm, np.finfo(float).tiny)
+
+    d = alphas[:, None] - shifts
+    du = np.repeat(betas[:, None], k, axis=1)
+    du2 = np.zeros((max(n - 2, 0), k))
+    b = np.array(B, dtype=float)
+
+    for i in range(n - 1):
+        (d_i, dl_i, du_i, d_next) = (
+            d[i].copy(),
+            betas[i],
+            du[i].copy(),
+            d[i + 1].copy(),
+        )
+        swap = np.abs(d_i) < np.abs(dl_i)
+        pivot = np.where(swap, dl_i, d_i)
+        pivot = np.where(
+            np.abs(pivot) < pivmin, np.where(pivot < 0, -pivmin, pivmin), pivot
+        )
+        fact = np.where(swap, d_i, dl_i) / pivot
+
+        d[i] = pivot
+        d[i + 1] = np.where(swap, du_i - fact * d_next, d_next - fact * du_i)
+        du[i] = np.where(swap, d_next, du_i)
+        if i < n - 2:
+            du2[i] = np.where(swap, du[i + 1], 0)
+            du[i + 1] = np.where(swap, -fact * du[i + 1], du[i + 1])
+        (b_i, b_next) = (b[i].copy(), b[i + 1].copy())
+        b[i] = np.where(swap, b_next, b_i)
+        b[i + 1] = np.where(swap, b_i - fact * b_next, b_next - fact * b_i)
+
+    d[n - 1] = np.where(
+        np.abs(d[n - 1]) < pivmin, np.where(d[n - 1] < 0, -pivmin, pivmin), d[n - 1]
+    )
+    b[n - 1] /= d[n - 1]
+    if n > 1:
+        b[n - 2] = (b[n - 2] - du[n - 2] * b[n - 1]) / d[n - 2]
+    for i in reversed(range(n - 2)):
+        b[i] = (b[i] - du[i] * b[i + 1] - du2[i] * b[i + 2]) / d[i]
+
+    return b
+
+
+def cluster_vectors(
+    alphas: np.array, betas: np.array, lams: np.array, iterations: int = 3
+) -> np.array:
+    """
+    Autovetores de um Aglomerado por Iteração Inversa
+    -------------------------------------------------
+    Calcula autovetores ortonormais da matriz tridiagonal `A` (`alphas`, `betas`) associados aos autovalores
+    próximos `lams` quando nenhuma representação relativamente robusta os separa (por exemplo, autovalores
+    numericamente múltiplos). Um bloco de vetores aleatórios passa por `iterations` passos de iteração inversa,
+    cada coluna deslocada pelo seu autovalor e o bloco reortogonalizado a cada passo, o que converge para o
+    subespaço invariante do aglomerado; os autovetores dentro do subespaço são obtidos por Rayleigh-Ritz, com o
+    algoritmo de Jacobi.
+    """
+    (n, m) = (len(alphas), len(lams))
+    X = np.random.default_rng(0).standard_normal((n, m))
+    for _ in range(iterations):
+        X = tridiagonal_solve(alphas, betas, lams, X)
+        (X, _) = np.linalg.qr(X)
+
+    AX = alphas[:, None] * X
+    AX[:-1] += betas[:, None] * X[1:]
+    AX[1:] += betas[:, None] * X[:-1]
+    H = np.matmul(X.T, AX)
+    H = (H + H.T) / 2
+
+    (theta, _, S, _) = jacobi(H, epsilon=np.finfo(float).eps * np.max(np.abs(H)))
+    return np.matmul(X, S[:, np.argsort(theta, kind="stable")])
+
+
+def mrrr_cluster(
+    alphas: np.array,
+    betas: np.array,
+    d: np.array,
+    l: np.array,
+    sigma: float,
+    mus: np.array,
+    wanted: np.array = None,
+    gaptol: float = 1e-3,
+    chunk: int = 512,
+) -> Tuple[np.array, int]:
+    """
+    Árvore de Representações (MRRR)
+    -------------------------------
+    Calcula os autovetores de um bloco não reduzido `A` (`alphas`, `betas`), dada a representação raiz
+    `L D L^T = A - sigma I` e os seus autovalores `mus`, em ordem crescente.
+
+    Os autovalores de cada representação são separados pelos gaps relativos: os que têm gap relativo maior que
+    `gaptol` em relação aos vizinhos são resolvidos diretamente por `twisted_vectors`. Para cada aglomerado de
+    autovalores próximos, uma nova representação é construída deslocando a atual para perto de uma das
+    extremidades do aglomerado, onde os gaps relativos aumentam: são tentados deslocamentos cada vez mais
+    afastados, alternando as extremidades, e aceito o primeiro cujo crescimento dos elementos de `D` seja limitado
+    por `GROWTH[0]` vezes o diâmetro espectral do bloco (ou, se nenhum for, por `GROWTH[1]` vezes). Os autovalores
+    do aglomerado são refinados por bissecção na nova representação e o processo se repete.
+
+    Se nenhum deslocamento for aceito, ou após `MAX_DEPTH` níveis, os autovetores de todo o aglomerado da
+    representação raiz que contém o aglomerado são recalculados por `cluster_vectors`, de modo que permaneçam
+    ortogonais entre si mesmo quando parte deles foi resolvida por outras representações.
+
+    Todos os autovalores de um nível são tratados juntos, em lotes de até `chunk` autovalores, cada um com a sua
+    representação em uma coluna de `D` e `L`; cada lote é resolvido até o fim antes do próximo, de modo que a
+    memória auxiliar é O(n chunk) por nível.
+
+    Parâmetros
+    ----------
+
+    alphas, betas   :   np.array
+        Diagonal e sobrediagonal do bloco.
+
+    d, l, sigma
+        A representação raiz `L D L^T = A - sigma I`.
+
+    mus :   np.array
+        Os autovalores de `L D L^T`, em ordem crescente.
+
+    wanted  :   np.array
+        Máscara dos autovetores desejados. Se None, todos.
+
+    gaptol  :   float
+        Gap relativo mínimo para que um autovalor seja tratado isoladamente.
+
+    chunk   :   int
+        Número máximo de autovalores processados juntos.
+
+    Retorna
+    -------
+
+    (Z, steps)  :   Tuple[np.array, int]
+        Matriz com os autovetores desejados, na ordem crescente dos autovalores, e número de passos de bissecção
+        executados.
+    """
+    eps = np.finfo(float).eps
+    m = len(mus)
+    wanted = (
+        np.ones(m, dtype=bool) if wanted is None else np.asarray(wanted, dtype=bool)
+    )
+    target = np.cumsum(wanted) - 1
+    Z = np.zeros((m, int(np.sum(wanted))))
+    (lower, upper) = gershgorin_bounds(alphas, betas)
+    spdiam = upper - lower
+
+    def resolve(D, L, rep, pos, mu, depth):
+        steps = 0
+        relgap = np.diff(mu) / np.maximum(
+            np.maximum(np.abs(mu[:-1]), np.abs(mu[1:])), np.finfo(float).tiny
+        )
+        split = (rep[1:] != rep[:-1]) | (relgap >= gaptol)
+        group = np.concatenate(([0], np.cumsum(split)))
+        size = np.bincount(group)[group]
+        needed = (np.bincount(group, weights=wanted[pos]) > 0)[group]
+
+        single = np.nonzero(needed & (size == 1) & wanted[pos])[0]
+        for c0 in range(0, len(single), chunk):
+            e = single[c0 : c0 + chunk]
+            Z[:, target[pos[e]]] = twisted_vectors(D[:, rep[e]], L[:, rep[e]], mu[e])
+
+        first = np.nonzero(needed & (size > 1) & np.concatenate(([True], split)))[0]
+        count = size[first]
+        batches = np.concatenate(
+            ([0], np.nonzero(np.diff(np.cumsum(count) // chunk))[0] + 1)
+        )
+        for (b0, b1) in zip(batches, np.append(batches[1:], len(first))):
+            steps += resolve_clusters(
+                D,
+                L,
+                rep[first[b0:b1]],
+                pos,
+                mu,
+                first[b0:b1],
+                count[b0:b1],
+                depth,
+            )
+
+        return steps
+
+    def resolve_clusters(D, L, rep, pos, mu, first, count, depth):
+        last = first + count - 1
+        (lo, hi) = (mu[first], mu[last])
+        spread = hi - lo
+        delta0 = np.maximum(
+            1e-3 * spread, 16 * eps * np.maximum(np.abs(lo), np.abs(hi))
+        )
+
+        C = len(first)
+        accepted = np.zeros(C, dtype=bool)
+        (tau, delta) = (np.zeros(C), np.zeros(C))
+        (D_c, L_c) = (np.zeros((m, C)), np.zeros((m - 1, C)))
+        trials = [
+            (growth * spdiam, t, side)
+            for growth in GROWTH
+            for t in range(4)
+            for side in (-1, 1)
+        ]
+        for (bound, t, side) in trials if depth < MAX_DEPTH else []:
+            todo = np.nonzero(~accepted)[0]
+            if len(todo) == 0:
+                break
+            trial_delta = delta0[todo] * 8 ** t
+            trial = lo[todo] - trial_delta if side < 0 else hi[todo] + trial_delta
+            with np.errstate(over="ignore", invalid="ignore"):
+                (d_c, l_c) = ldl_shift(D[:, rep[todo]], L[:, rep[todo]], trial)
+                ok = np.all(np.isfinite(d_c), axis=0) & (
+                    np.max(np.abs(d_c), axis=0) <= bound
+                )
+            c = todo[ok]
+            (D_c[:, c], L_c[:, c]) = (d_c[:, ok], l_c[:, ok])
+            (tau[c], delta[c]) = (trial[ok], trial_delta[ok])
+            accepted[c] = True
+
+        for c in np.nonzero(~accepted)[0]:
+            failed[pos[first[c] : last[c] + 1]] = True
+
+        c = np.nonzero(accepted)[0]
+        if len(c) == 0:
+            return 0
+        owner = np.repeat(np.arange(len(c)), count[c])
+        e = (
+            first[c][owner]
+            + np.arange(len(owner))
+            - np.repeat(np.cumsum(count[c]) - count[c], count[c])
+        )
+        (D_c, L_c) = (D_c[:, c], L_c[:, c])
+        (D_e, L_e, tau_e) = (D_c[:, owner], L_c[:, owner], tau[c][owner])
+
+        guess = mu[e] - tau_e
+        width = 64 * eps * (np.abs(mu[e]) + np.abs(tau_e))
+        (lower, upper) = (guess - width, guess + width)
+        outside = (ldl_negcount(D_e, L_e, lower) > pos[e]) | (
+            ldl_negcount(D_e, L_e, upper) <= pos[e]
+        )
+        width = (spread + 2 * delta + 8 * eps * (np.abs(hi) + np.abs(tau)))[c][owner]
+        lower = np.where(outside, lo[c][owner] - tau_e - width, lower)
+        upper = np.where(outside, hi[c][owner] - tau_e + width, upper)
+        (mu_c, steps) = ldl_bisection(D_e, L_e, pos[e], lower, upper)
+
+        return steps + resolve(D_c, L_c, owner, pos[e], mu_c, depth + 1)
+
+    failed = np.zeros(m, dtype=bool)
+    steps = resolve(
+        d[:, None],
+        l[:, None],
+        np.zeros(m, dtype=int),
+        np.arange(m),
+        mus,
+        0,
+    )
+
+    relgap = np.diff(mus) / np.maximum(mus[:-1], mus[1:])
+    bounds = np.concatenate(([0], np.nonzero(relgap >= gaptol)[0] + 1, [m]))
+    for (a, b) in zip(bounds[:-1], bounds[1:]):
+        if np.any(failed[a:b]):
+            keep = wanted[a:b]
+            V = cluster_vectors(alphas, betas, sigma + mus[a:b])
+            Z[:, target[a:b][keep]] = V[:, keep]
+
+    return (Z, steps)
+
+
+def mrrr(
+    alphas: np.array,
+    betas: np.array,
+    V0: np.array = None,
+    chunk: int = 512,
+    gaptol: float = 1e-3,
+    indices: np.array = None,
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Algoritmo MRRR
+    --------------
+    Dada uma matriz tridiagonal simétrica, representada pelos vetores `alphas` e `betas`, calcula todos os seus
+    autovalores e autovetores pelo método das Múltiplas Representações Relativamente Robustas (MRRR), em O(n^2).
+
+    A matriz é dividida nos blocos não reduzidos; cada bloco é normalizado (veja `unit_scale`) e uma representação
+    `L D L^T` definida positiva de `A - sigma I` (veja `definite_shift`) fornece, por bissecção vetorizada sobre
+    todos os autovalores, os autovalores com alta precisão relativa. Cada autovetor é então calculado, em O(n), por
+    `twisted_vectors`; aglomerados de autovalores próximos recebem novas representações (veja `mrrr_cluster`).
+
+    O resultado tem o mesmo formato do `qr_algorithm`, de modo que a matriz `H` da tridiagonalização pode ser
+    passada como `V0` para obter os autovetores da matriz original.
+
+    Se `indices` for dado, apenas os autovalores nessas posições da ordem crescente (e seus autovetores) são
+    retornados; todos os autovalores continuam sendo calculados por bissecção, mas só os aglomerados que contêm
+    algum dos índices pedidos têm seus autovetores calculados, com custo proporcional a `len(indices)`.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    V0  :   np.array
+        Matriz aplicada à esquerda dos autovetores (identidade, ou `H` da tridiagonalização). Se None, utiliza-se
+        a identidade.
+
+    chunk   :   int
+        Número máximo de autovalores cujas representações e autovetores são calculados juntos, em uma única
+        passagem vetorizada; limita a memória auxiliar a O(n chunk).
+
+    gaptol  :   float
+        Gap relativo mínimo para que um autovalor seja tratado isoladamente.
+
+    indices :   np.array
+        Posições, na ordem crescente, dos autovalores desejados. Se None, todos.
+
+    Retorna
+    -------
+
+    (alphas, betas)   :   Tuple[np.array, np.array]
+        Autovalores (os selecionados, na ordem de `indices`, ou todos em ordem crescente) e a sobrediagonal nula.
+
+    V : np.array
+        Matriz com os auto-vetores da matriz A.
+
+    iterations : int
+        Número de passos de bissecção executados.
+    """
+    (alphas, betas) = (np.asarray(alphas, dtype=float), np.asarray(betas, dtype=float))
+    if not (np.all(np.isfinite(alphas)) and np.all(np.isfinite(betas))):
+        raise ValueError("A matriz deve ter apenas entradas finitas.")
+    eps = np.finfo(float).eps
+    n = len(alphas)
+
+    splits = np.nonzero(
+        np.abs(betas) <= eps * (np.abs(alphas[:-1]) + np.abs(alphas[1:]))
+    )[0]
+    bounds = np.concatenate(([0], splits + 1, [n]))
+
+    Lambda = np.zeros(n)
+    blocks = []
+    iterations = 0
+
+    for (a, b) in zip(bounds[:-1], bounds[1:]):
+        if b - a == 1:
+            Lambda[a] = alphas[a]
+            continue
+
+        (alphas_b, betas_b) = (alphas[a:b], betas[a : b - 1])
+        scale = unit_scale(*gershgorin_bounds(alphas_b, betas_b))
+        (alphas_b, betas_b) = (alphas_b / scale, betas_b / scale)
+        (lower, upper) = gershgorin_bounds(alphas_b, betas_b)
+        (sigma, d, _) = definite_shift(alphas_b, betas_b, lower, eps)
+        l = betas_b / d[:-1]
+
+        (mus, steps) = ldl_bisection(
+            d, l, np.arange(b - a), 0, (upper - sigma) * (1 + eps)
+        )
+        iterations += steps
+        Lambda[a:b] = (mus + sigma) * scale
+        blocks.append((a, b, alphas_b, betas_b, d, l, sigma, mus))
+
+    order = np.argsort(Lambda, kind="stable")
+    wanted = order if indices is None else order[np.asarray(indices, dtype=int)]
+    (unique, inverse) = np.unique(wanted, return_inverse=True)
+    column = np.full(n, -1)
+    column[unique] = np.arange(len(unique))
+
+    Z = np.zeros((n, len(unique)))
+    for a in bounds[:-1][np.diff(bounds) == 1]:
+        if column[a] >= 0:
+            Z[a, column[a]] = 1
+
+    for (a, b, alphas_b, betas_b, d, l, sigma, mus) in blocks:
+        selected = column[a:b] >= 0
+        if not np.any(selected):
+            continue
+        (Z_b, steps) = mrrr_cluster(
+            alphas_b, betas_b, d, l, sigma, mus, selected, gaptol, chunk
+        )
+        iterations += steps
+        Z[a:b, column[a:b][selected]] = Z_b
+
+    Z = Z[:, inverse]
+    V = Z if V0 is None else np.matmul(V0, Z)
+
+    return (Lambda[wanted], np.zeros(n - 1), V, iterations)
@@ -0,0 +1,188 @@
+"""
+Redução Fora da Memória
+=======================
+Tridiagonalização e retrotransformação de matrizes grandes guardadas em disco (`numpy.memmap`), processadas em
+painéis cujo tamanho é limitado por um orçamento de memória.
+
+Como a matriz é simétrica, o painel de colunas `A[:, c0:c1]` é a transposta do painel de linhas `A[c0:c1, :]`,
+que ocupa um trecho contíguo do arquivo (ordem C); todos os acessos ao disco são feitos por painéis de linhas,
+em ordem crescente, de modo que a leitura e a escrita são sequenciais.
+"""
+import tempfile
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from .householder import back_transform
+from .qr import sgn
+
+MEMORY = 2 ** 27
+
+
+def panel_rows(n: int, memory: int = MEMORY, itemsize: int = 8) -> int:
+    """
+    Dados a ordem `n` da matriz e o orçamento `memory`, em bytes, retorna o número de linhas (ou colunas) de
+    cada painel lido do disco, de modo que um painel ocupe no máximo `memory` bytes (e pelo menos uma linha).
+    """
+    return max(1, int(memory // (itemsize * max(n, 1))))
+
+
+def panels(start: int, stop: int, rows: int) -> Iterator[Tuple[int, int]]:
+    """
+    Percorre o intervalo de linhas `[start, stop)` em painéis de `rows` linhas, retornando os pares `(r0, r1)`.
+    """
+    for r0 in range(start, stop, rows):
+        yield (r0, min(r0 + rows, stop))
+
+
+def tridiagonalization_ooc(
+    A: np.array, out: np.array = None, memory: int = MEMORY, block_size: int = 32
+) -> Tuple[np.array, np.array, Tuple[np.array, np.array]]:
+    """
+    Tridiagonalização Fora da Memória
+    ---------------------------------
+    Efetua a mesma redução em painéis de `tridiagonalization`, com `compact = True`, sobre uma matriz guardada em
+    disco. A matriz de trabalho `out` (um `numpy.memmap`, ou a própria `A`, para reduzir no lugar) só é acessada
+    por painéis de linhas de até `memory` bytes: o produto `B v` de cada refletor e a atualização de posto
+    `2 * block_size` ao final de cada painel percorrem a submatriz restante sequencialmente. Em memória ficam
+    apenas o painel corrente e as matrizes `V` e `W`, com `n * block_size` elementos cada, de modo que o uso de
+    memória não depende de `n^2`.
+
+    O vetor de Householder `v_k` é guardado na linha `k` de `out`, à direita da sobrediagonal, que não é mais lida
+    pela redução; a transposta de `out` tem, portanto, o formato esperado por `back_transform`.
+
+    Parâmetros
+    ----------
+
+    A  :   np.array
+        Matriz real simétrica `n x n`, em geral um `numpy.memmap`.
+
+    out :   np.array
+        Matriz `n x n` onde a redução é feita. Se None, uma cópia de `A` é feita em um arquivo temporário
+        anônimo, fechado aqui mesmo: o espaço em disco pertence ao memmap e é liberado quando ele deixa de ser
+        usado.
+
+    memory  :   int
+        Orçamento de memória, em bytes, para cada painel lido do disco.
+
+    block_size  :   int
+        Número de refletores por painel.
+
+    Retorna
+    -------
+
+    (alphas, betas, (Y, taus))   :   Tuple[np.array, np.array, Tuple[np.array, np.array]]
+        Diagonal principal e sobrediagonal da matriz tridiagonal e os refletores na forma compacta, para
+        `back_transform` ou `back_transform_ooc`.
+    """
+    n = np.size(A, 0)
+    rows = panel_rows(n, memory)
+
+    if out is None:
+        with tempfile.TemporaryFile() as file:
+            out = np.memmap(file, dtype=float, mode="w+", shape=(n, n))
+    if out is not A:
+        for (r0, r1) in panels(0, n, rows):
+            out[r0:r1] = A[r0:r1]
+
+    alphas = np.zeros(n)
+    betas = np.zeros(n - 1)
+    reflectors = np.zeros(max(n - 2, 0))
+
+    for k in range(0, n - 2, block_size):
+        nb = min(block_size, n - 2 - k)
+        P = np.array(out[k : k + nb, k:]).T
+        V = np.zeros((n - k, nb))
+        W = np.zeros((n - k, nb))
+        taus = np.zeros(nb)
+
+        for j in range(nb):
+            P[j:, j] -= np.matmul(V[j:, :j], W[j, :j]) + np.matmul(W[j:, :j], V[j, :j])
+            alphas[k + j] = P[j, j]
+
+            v = P[j + 1 :, j].copy()
+            betas[k + j] = -sgn(v[0]) * np.sqrt(np.dot(v, v))
+            v[0] -= betas[k + j]
+            v2 = np.dot(v, v)
+            taus[j] = 2 / v2 if v2 > 0 else 0
+
+            y = np.zeros(n - k - j - 1)
+            for (r0, r1) in panels(k + j + 1, n, rows):
+                y[r0 - k - j - 1 : r1 - k - j - 1] = np.matmul(
+                    out[r0:r1, k + j + 1 :], v
+                )
+            y = (
+                y
+                - np.matmul(V[j + 1 :, :j], np.matmul(v, W[j + 1 :, :j]))
+                - np.matmul(W[j + 1 :, :j], np.matmul(v, V[j + 1 :, :j]))
+            ) * taus[j]
+            W[j + 1 :, j] = y - taus[j] / 2 * np.dot(y, v) * v
+            V[j + 1 :, j] = v
+            out[k + j, k + j + 1 :] = v
+
+        for (r0, r1) in panels(k + nb, n, rows):
+            out[r0:r1, k + nb :] -= np.matmul(V[r0 - k : r1 - k], W[nb:].T) + np.matmul(
+                W[r0 - k : r1 - k], V[nb:].T
+            )
+
+        reflectors[k : k + nb] = taus
+
+    if n >= 2:
+        alphas[n - 2 :] = (out[n - 2, n - 2], out[n - 1, n - 1])
+        betas[n - 2] = out[n - 1, n - 2]
+    elif n == 1:
+        alphas[0] = out[0, 0]
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return (alphas, betas, (out.T, reflectors))
+
+
+def back_transform_ooc(
+    reflectors: Tuple[np.array, np.array],
+    Z: np.array,
+    out: np.array = None,
+    memory: int = MEMORY,
+    block_size: int = 32,
+) -> np.array:
+    """
+    Retrotransformação Fora da Memória
+    ----------------------------------
+    Calcula `Ht Z`, como `back_transform`, para matrizes `Z` (e resultados) grandes demais para a memória: as
+    colunas de `Z` são processadas em grupos de até `memory` bytes, e cada grupo é escrito em `out` assim que
+    termina. Os refletores são lidos do disco em blocos de `block_size`, uma vez por grupo.
+
+    Parâmetros
+    ----------
+
+    reflectors  :   Tuple[np.array, np.array]
+        Refletores na forma compacta, como retornados por `tridiagonalization_ooc`.
+
+    Z   :   np.array
+        Matriz `n x m` com autovetores da matriz tridiagonal, possivelmente um `numpy.memmap`.
+
+    out :   np.array
+        Matriz `n x m` (ou `numpy.memmap`) onde o resultado é escrito. Se None, é alocada em memória.
+
+    memory  :   int
+        Orçamento de memória, em bytes, para cada grupo de colunas.
+
+    block_size  :   int
+        Número de refletores aplicados por vez.
+
+    Retorna
+    -------
+
+    V   :   np.array
+        A matriz `out`, com `Ht Z`.
+    """
+    (n, m) = np.shape(Z)
+    if out is None:
+        out = np.zeros((n, m))
+
+    for (c0, c1) in panels(0, m, panel_rows(n, memory)):
+        out[:, c0:c1] = back_transform(reflectors, Z[:, c0:c1], block_size)
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return out
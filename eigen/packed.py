@@ -0,0 +1,182 @@
+"""
+Armazenamento Simétrico Compactado
+==================================
+Matrizes simétricas armazenadas apenas pelo triângulo inferior, coluna a coluna, em um único vetor de
+`n (n + 1) / 2` entradas (o formato compactado `'L'` do LAPACK): a coluna `j` ocupa as posições
+`packed_offset(n, j)` a `packed_offset(n, j + 1) - 1` e contém `A[j:, j]`. Como `A` é simétrica, essa coluna é
+igual a `A[j, j:]`, de modo que a matriz pode ser lida linha a linha sem nunca montar o triângulo superior.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .qr import sgn
+
+
+def packed_offset(n: int, j):
+    """
+    Retorna a posição, no vetor compactado de uma matriz de ordem `n`, do elemento diagonal `A[j, j]`.
+    """
+    return j * n - j * (j - 1) // 2
+
+
+def packed_order(P: np.array) -> int:
+    """
+    Retorna a ordem `n` da matriz simétrica armazenada no vetor compactado `P`.
+    """
+    n = int((np.sqrt(8 * len(P) + 1) - 1) / 2)
+    if n * (n + 1) // 2 != len(P):
+        raise ValueError("O tamanho do vetor não corresponde a uma matriz compactada.")
+    return n
+
+
+def pack(A: np.array) -> np.array:
+    """
+    Retorna o triângulo inferior da matriz simétrica `A` no formato compactado.
+    """
+    n = np.size(A, 0)
+    return np.concatenate([A[j:, j] for j in range(n)]).astype(float)
+
+
+def pack_rows(rows, n: int) -> np.array:
+    """
+    Monta o vetor compactado da matriz simétrica de ordem `n` a partir das suas linhas, fornecidas uma de cada vez
+    por `rows` (um gerador que lê um arquivo aos poucos, ou as linhas de um `numpy.memmap`): da linha `i`, apenas
+    `A[i, i:]` é guardada, de modo que a matriz densa nunca é montada.
+    """
+    P = np.zeros(n * (n + 1) // 2)
+    for (i, row) in enumerate(rows):
+        P[packed_offset(n, i) : packed_offset(n, i + 1)] = row[i:]
+    return P
+
+
+def unpack(P: np.array) -> np.array:
+    """
+    Retorna a matriz simétrica densa armazenada no vetor compactado `P`.
+    """
+    n = packed_order(P)
+    A = np.zeros((n, n))
+    (rows, cols) = np.tril_indices(n)
+    order = np.lexsort((rows, cols))
+    A[rows[order], cols[order]] = P
+    A[cols[order], rows[order]] = P
+    return A
+
+
+def packed_chunks(m: int, chunk: int):
+    """
+    Percorre as colunas de uma matriz compactada de ordem `m` em grupos de aproximadamente `chunk` entradas,
+    gerando `(inicio, fim, I, J)`: o intervalo das entradas do grupo no vetor compactado e os índices de linha e
+    coluna de cada uma delas.
+    """
+    cols = np.arange(m)
+    offsets = packed_offset(m, np.arange(m + 1))
+    bounds = np.unique(
+        np.concatenate(
+            (np.searchsorted(offsets, np.arange(0, offsets[-1], chunk)), [m])
+        )
+    )
+    for (c0, c1) in zip(bounds[:-1], bounds[1:]):
+        lengths = m - cols[c0:c1]
+        J = np.repeat(cols[c0:c1], lengths)
+        I = np.arange(offsets[c1] - offsets[c0]) - np.repeat(
+            offsets[c0:c1] - offsets[c0] - cols[c0:c1], lengths
+        )
+        yield (offsets[c0], offsets[c1], I, J)
+
+
+def packed_matvec(P: np.array, v: np.array, chunk: int = 2 ** 20) -> np.array:
+    """
+    Produto Matriz-Vetor Simétrico Compactado
+    -----------------------------------------
+    Retorna `A v`, com `A` armazenada no vetor compactado `P`, processando `chunk` entradas de cada vez.
+    """
+    m = len(v)
+    y = np.zeros(m)
+    for (start, end, I, J) in packed_chunks(m, chunk):
+        values = P[start:end]
+        off = values * (I != J)
+        y += np.bincount(I, values * v[J], minlength=m)
+        y += np.bincount(J, off * v[I], minlength=m)
+
+    return y
+
+
+def packed_rank2_update(P: np.array, v: np.array, w: np.array, chunk: int = 2 ** 20):
+    """
+    Atualização Simétrica de Posto 2 Compactada
+    -------------------------------------------
+    Substitui, no próprio lugar, a matriz armazenada no vetor compactado `P` por `A - v w^T - w v^T`, processando
+    `chunk` entradas de cada vez.
+    """
+    for (start, end, I, J) in packed_chunks(len(v), chunk):
+        P[start:end] -= v[I] * w[J] + w[I] * v[J]
+
+
+def tridiagonalization_packed(
+    P: np.array, accumulate: bool = True, chunk: int = 2 ** 20, compact: bool = False
+) -> Tuple[np.array, np.array, np.array]:
+    """
+    Tridiagonalização Compactada
+    ----------------------------
+    Tridiagonaliza a matriz real simétrica armazenada no vetor compactado `P` (veja `pack`), com as mesmas
+    transformações de Householder de `tridiagonalization`, mas sem nunca formar a matriz densa: a atualização
+    `P A P = A - v w^T - w v^T` de cada passo é calculada por `packed_matvec` e `packed_rank2_update` sobre o
+    triângulo inferior da submatriz restante, que é um sufixo contíguo de `P`. A memória ocupada pela matriz é
+    metade da ocupada pela redução densa.
+
+    Parâmetros
+    ----------
+
+    P   :   np.array
+        Triângulo inferior compactado da matriz. Não é modificado.
+
+    accumulate  :   bool
+        Se False, a matriz `Ht` não é calculada (e `None` é retornado em seu lugar), o que basta quando apenas os
+        autovalores são de interesse.
+
+    chunk   :   int
+        Número de entradas da matriz processadas de cada vez nas operações compactadas.
+
+    compact :   bool
+        Se True, cada vetor de Householder `v_k` é guardado na coluna `k` da cópia compactada, abaixo da diagonal,
+        e `Ht` é substituída pelo par `(Y, taus)` (veja `eigen.householder.back_transform`), sem memória adicional.
+
+    Retorna
+    -------
+
+    (alphas, betas, Ht)   :   Tuple[np.array, np.array, np.array]
+        Diagonal principal e sobrediagonal da matriz tridiagonal resultante, e a matriz `Ht` do produtório das
+        transformações de Householder (ou None); ou, com `compact = True`, o par `(Y, taus)`.
+    """
+    P = np.array(P, dtype=float)
+    n = packed_order(P)
+    alphas = np.zeros(n)
+    betas = np.zeros(n - 1)
+    H = np.identity(n) if accumulate and not compact else None
+    taus = np.zeros(max(n - 2, 0))
+
+    for k in range(n - 2):
+        start = packed_offset(n, k)
+        trailing = packed_offset(n, k + 1)
+        alphas[k] = P[start]
+
+        v = P[start + 1 : trailing].copy()
+        betas[k] = -sgn(v[0]) * np.sqrt(np.dot(v, v))
+        v[0] -= betas[k]
+        v2 = np.dot(v, v)
+        tau = 2 / v2 if v2 > 0 else 0
+        (P[start + 1 : trailing], taus[k]) = (v, tau)
+
+        Q = P[trailing:]
+        y = tau * packed_matvec(Q, v, chunk)
+        w = y - tau / 2 * np.dot(y, v) * v
+        packed_rank2_update(Q, v, w, chunk)
+
+        if H is not None:
+            H[:, k + 1 :] -= np.outer(tau * np.matmul(H[:, k + 1 :], v), v)
+
+    alphas[n - 2 :] = P[[packed_offset(n, n - 2), packed_offset(n, n - 1)]]
+    betas[n - 2] = P[packed_offset(n, n - 2) + 1]
+
+    return (alphas, betas, (P, taus) if compact else H)
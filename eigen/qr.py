@@ -0,0 +1,545 @@
+"""
+Algoritmo QR
+============
+Fatoração QR por rotações de Givens de matrizes tridiagonais simétricas, estratégias de deslocamento espectral e as
+variantes do Algoritmo QR construídas sobre elas.
+"""
+import time
+from math import copysign
+from typing import List, Tuple
+
+import numpy as np
+
+
+def sgn(x):
+    """
+    Função Sinal
+    ------------
+
+    `sgn(x)` retorna 1 se x >= 0, -1 caso contrário.
+    """
+    return copysign(1, x)
+
+
+def qr_factorization(
+    alphas: np.array, betas: np.array
+) -> Tuple[np.array, np.array, np.array, np.array]:
+    """
+    Fatoração QR
+    ------------
+    Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
+    sua diagonal principal e sua sobrediagonal, retorna sua fatoração QR utilizando rotações de Givens.
+
+    A matriz Q é retornada por meio de dois vetores `c_ks` e `s_ks` que recebem os cossenos e senos utilizados em cada etapa da
+    fatoração. A matriz R, triangular superior, é retornada em dois vetores que armazenam sua diagonal principal e a
+    sobrediagonal. A diagonal extra que é adicionada pela aplicação das rotações de Givens não foi calculada pois não
+    será necessárias para a implementação do algoritmo QR.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor que armazena as entradas da diagonal principal da matriz.
+
+    betas   :   np.array
+        Vetor que armazena as entradas da sobrediagonal da matriz.
+
+    Retorna
+    -------
+    (c_ks, s_ks, alphas, betas) : Tuple[np.array, np.array, np.array, np.array]
+        Quadra que retorna os vetores `c_ks` e `s_ks`, que são os cossenos e senos utilizados nas rotações de Givens,
+        e `alphas` e `betas`, que retornam a representação da matriz R.
+    """
+    c_ks, s_ks = [], []
+    (alphas, betas) = (alphas.copy(), betas.copy())
+
+    for k in range(len(alphas) - 1):
+        if abs(alphas[k]) > abs(betas[k]):
+            tau_k = -betas[k] / alphas[k]
+            c_ks.append(1 / np.sqrt(1 + tau_k ** 2))
+            s_ks.append(tau_k * c_ks[k])
+        else:
+            tau_k = -alphas[k] / betas[k]
+            s_ks.append(1 / np.sqrt(1 + tau_k ** 2))
+            c_ks.append(tau_k * s_ks[k])
+
+        alphas[k] = c_ks[k] * alphas[k] - s_ks[k] * betas[k]
+        betas[k] *= c_ks[k - 1] if k > 0 else 1
+        (alphas[k + 1], betas[k]) = (
+            s_ks[k] * betas[k] + c_ks[k] * alphas[k + 1],
+            c_ks[k] * betas[k] - s_ks[k] * alphas[k + 1],
+        )
+
+    return (np.array(c_ks), np.array(s_ks), alphas, betas)
+
+
+def update_matrix(
+    c_ks: np.array, s_ks: np.array, alphas: np.array, betas: np.array
+) -> Tuple[np.array, np.array]:
+    """
+    Atualização da matriz
+    ------------
+    Dada uma matriz triangular superior, representada por dois vetores `alphas` e `betas`, que armazenam
+    sua diagonal principal e sua sobrediagonal, e as matrizes de rotação de Givens, representadas por dois
+    vetores com senos e cossenos utilizados a cada rotação, retorna uma nova matriz tridiagonal simétrica.
+
+    Os valores fora das diagonais mencionadas, mas pertencentes ao triângulo superior da matriz não são
+    utilizados para o cálculo dos valores na nova matriz.
+
+    A matriz é retornada por meio de dois vetores, `alphas` e `betas`, que recebem sua diagonal principal
+    e sua sobrediagonal, respectivamente.
+
+    Parâmetros
+    ----------
+
+    c_ks    :   np.array
+        Vetor que armazena os cossenos utilizados nas rotações de Givens.
+
+    s_ks    :   np.array
+        Vetor que armazena os senos utilizados nas rotações de Givens.
+
+    alphas  :   np.array
+        Vetor que armazena as entradas da diagonal principal da matriz.
+
+    betas   :   np.array
+        Vetor que armazena as entradas da sobrediagonal da matriz.
+
+    Retorna
+    -------
+    (alphas, betas) : Tuple[np.array, np.array]
+        Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
+        tridiagonal simétrica, através de sua diagonal principal e sua sobrediagonal.
+    """
+    (alphas, betas) = (alphas.copy(), betas.copy())
+
+    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
+        (alphas[i], betas[i], alphas[i + 1]) = (
+            c * alphas[i] - s * betas[i],
+            -s * alphas[i + 1],
+            c * alphas[i + 1],
+        )
+
+    return (alphas, betas)
+
+
+def update_eigenvectors(V: np.array, c_ks: np.array, s_ks: np.array) -> np.array:
+    """
+    Atualização dos Autovetores da Matriz
+    -------------------------------------
+    Dada uma matriz V, que armazena os autovetores encontrados até a `(k-1)-ésima` iteração do algoritmo QR, atualiza-os
+    por meio das rotações inversas de Givens, que são construídas a partir de operações nas colunas com os cossenos e
+    senos obtidos anteriormente pela fatoração QR.
+
+    Parâmetros
+    ----------
+
+    V   :   np.array
+        Matriz cujas colunas são os autovetores encontrados até a `(k-1)ésima` iteração do algoritmo QR.
+
+    c_ks    :   np.array
+        Vetor que armazena os cossenos utilizados nas rotações de Givens.
+
+    s_ks    :   np.array
+        Vetor que armazena os senos utilizados nas rotações de Givens.
+
+    Retorna
+    -------
+
+    V_k :   np.array
+        Matriz cujas colunas são os autovetores atualizados até a `k=ésima` iteração do algoritmo QR.
+    """
+    V_k = V.copy()
+    for i, (c, s) in enumerate(zip(c_ks, s_ks)):
+        (V_k[:, i], V_k[:, i + 1]) = (
+            c * V_k[:, i] - s * V_k[:, i + 1],
+            s * V_k[:, i] + c * V_k[:, i + 1],
+        )
+    return V_k
+
+
+def wilkinson_h(alphas: np.array, betas: np.array, stall: int = 0) -> float:
+    """
+    Coeficientes de Deslocamento Espectral
+    --------------------------------------
+    Dada a matriz A, representada por seus valores da diagonal principal e sobrediagonal com os vetores `alphas` e `betas`,
+    calcula o valor do coeficiente de deslocamento espectral da `k-ésima` iteração por meio da heurística de Wilkinson.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    stall   :   int
+        Número de iterações já executadas sem deflação no bloco atual. Não é utilizado pela heurística de
+        Wilkinson, mas faz parte da assinatura comum às estratégias de deslocamento.
+
+    Retorna
+    -------
+
+    mu_k   :   float
+        Valor do coeficiente de deslocamento espectral para a `k-ésima` iteração.
+    """
+    d_k = (alphas[len(alphas) - 2] - alphas[len(alphas) - 1]) / 2
+    return (
+        alphas[len(alphas) - 1]
+        + d_k
+        - sgn(d_k) * np.sqrt(d_k ** 2 + betas[len(alphas) - 2] ** 2)
+    )
+
+
+def rayleigh_h(alphas: np.array, betas: np.array, stall: int = 0) -> float:
+    """
+    Deslocamento pelo Quociente de Rayleigh
+    ---------------------------------------
+    Dada a matriz A, representada pelos vetores `alphas` e `betas`, retorna o último elemento da diagonal
+    principal do bloco ativo, que é o quociente de Rayleigh de A no último vetor canônico. Converge
+    cubicamente perto da solução, mas pode estagnar quando o bloco final tem autovalores simétricos em torno dele;
+    nesses casos, combine-o com `exceptional_h`.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    stall   :   int
+        Número de iterações já executadas sem deflação no bloco atual (não utilizado).
+
+    Retorna
+    -------
+
+    mu_k   :   float
+        Valor do coeficiente de deslocamento espectral para a `k-ésima` iteração.
+    """
+    return alphas[len(alphas) - 1]
+
+
+def zero_h(alphas: np.array, betas: np.array, stall: int = 0) -> float:
+    """
+    Sem Deslocamento Espectral
+    --------------------------
+    Estratégia nula: retorna sempre 0, o que equivale ao Algoritmo QR sem deslocamento espectral.
+    """
+    return 0
+
+
+def exceptional_h(strategy=wilkinson_h, stall_limit: int = 10, factor: float = 0.75):
+    """
+    Deslocamento Excepcional
+    ------------------------
+    Constrói uma estratégia de deslocamento que delega a `strategy`, exceto quando o bloco ativo acumula
+    `stall_limit` iterações sem deflação (e a cada `stall_limit` iterações seguintes). Nesses casos, utiliza o
+    deslocamento excepcional `alpha_m + factor * |beta_(m-1)|`, que quebra ciclos em que a estratégia base
+    estagna, como em matrizes com autovalores agrupados.
+
+    Parâmetros
+    ----------
+
+    strategy    :   Callable[[np.array, np.array, int], float]
+        Estratégia base, com a mesma assinatura de `wilkinson_h`.
+
+    stall_limit :   int
+        Número de iterações sem deflação a partir do qual o deslocamento excepcional é aplicado.
+
+    factor  :   float
+        Fator que multiplica o último elemento da sobrediagonal do bloco no deslocamento excepcional.
+
+    Retorna
+    -------
+
+    shift   :   Callable[[np.array, np.array, int], float]
+        Estratégia combinada, com a mesma assinatura de `wilkinson_h`.
+    """
+
+    def shift(alphas: np.array, betas: np.array, stall: int = 0) -> float:
+        if stall > 0 and stall % stall_limit == 0:
+            return alphas[len(alphas) - 1] + factor * abs(betas[len(alphas) - 2])
+        return strategy(alphas, betas, stall)
+
+    return shift
+
+
+def shifted_qr(
+    alphas: np.array,
+    betas: np.array,
+    V0: np.array = None,
+    shift=wilkinson_h,
+    epsilon: float = 1e-7,
+    direction: str = "auto",
+    stop=None,
+) -> Tuple[np.array, np.array, np.array, List[Tuple[int, int, str]]]:
+    """
+    Algoritmo QR com Estratégia de Deslocamento
+    -------------------------------------------
+    Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, efetua o Algoritmo QR
+    utilizando a estratégia de deslocamento espectral `shift` e contabiliza o número de iterações necessárias
+    para cada deflação.
+
+    Uma estratégia de deslocamento é qualquer função `shift(alphas, betas, stall)` que recebe a diagonal principal e a
+    sobrediagonal do bloco ativo e o número de iterações já executadas nele sem deflação, e retorna o coeficiente
+    de deslocamento da próxima iteração. Estão disponíveis `wilkinson_h`, `rayleigh_h`, `zero_h` e as estratégias
+    combinadas construídas por `exceptional_h`.
+
+    Cada iteração pode ser uma varredura QR, que desacopla autovalores pelo fim do bloco ativo, ou uma varredura QL,
+    que os desacopla pelo início. A varredura QL é a varredura QR aplicada ao bloco com a ordem das linhas e colunas
+    invertida, de modo que as estratégias de deslocamento enxergam sempre a extremidade que está sendo desacoplada
+    como o fim do bloco. Com `direction = "auto"`, antes de cada deflação o bloco ativo é percorrido em busca de
+    entradas desprezíveis (menores que `epsilon`) da sobrediagonal, que o dividem em blocos não reduzidos
+    resolvidos separadamente, e a direção é escolhida para cada bloco, desacoplando pela extremidade de menor
+    módulo na diagonal principal, como nas matrizes graduadas.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    V0  :   np.array
+        Matriz à qual as rotações de Givens são acumuladas (identidade, ou `H` da tridiagonalização). Se None,
+        utiliza-se a identidade.
+
+    shift   :   Callable[[np.array, np.array, int], float]
+        Estratégia de deslocamento espectral.
+
+    epsilon : float
+        Valor utilizado para determinar convergência dos valores calculados.
+
+    direction : str
+        `"qr"`, `"ql"` ou `"auto"`: direção das varreduras.
+
+    stop    :   Callable[[], bool]
+        Função consultada antes de cada iteração. Se retornar True, o algoritmo é interrompido e retorna o estado
+        atual, cujas deflações registradas são apenas as já concluídas.
+
+    Retorna
+    -------
+
+    (alphas, betas)   :   Tuple[np.array, np.array]
+        Diagonal principal e sobrediagonal da matriz ao final do algoritmo.
+
+    V : np.array
+        Matriz com os auto-vetores da matriz A.
+
+    deflations : List[Tuple[int, int, str]]
+        Lista de triplas `(m, iterações, direção)`, na ordem em que as deflações ocorreram, com o índice do
+        autovalor desacoplado, o número de iterações gastas no bloco até desacoplá-lo e a direção (`"qr"` ou `"ql"`)
+        das varreduras utilizadas. As divisões em blocos de `direction = "auto"` não são registradas.
+    """
+    alphas_k = np.array(alphas, dtype=float)
+    betas_k = np.array(betas, dtype=float)
+    V = np.identity(len(alphas_k)) if V0 is None else np.array(V0, dtype=float)
+    deflations = []
+    blocks = [(0, len(alphas) - 1)]
+    while len(blocks) > 0:
+        (l, r) = blocks.pop()
+        mu = 0
+        ql = False
+        while l < r:
+            if direction == "auto":
+                negligible = np.nonzero(np.abs(betas_k[l:r]) < epsilon)[0]
+                if len(negligible) > 0:
+                    split = l + negligible[-1]
+                    blocks.append((l, split))
+                    (l, mu) = (split + 1, 0)
+                    continue
+
+            was_ql = ql
+            ql = direction == "ql" or (
+                direction == "auto" and abs(alphas_k[l]) < abs(alphas_k[r])
+            )
+            if ql != was_ql:
+                mu = 0
+
+            (rows, subs) = (np.arange(l, r + 1), np.arange(l, r))
+            if ql:
+                (rows, subs) = (rows[::-1], subs[::-1])
+
+            end = l if ql else r - 1
+            stall = 0
+            while abs(betas_k[end]) >= epsilon:
+                if stop is not None and stop():
+                    return (alphas_k, betas_k, V, deflations)
+
+                (c_ks, s_ks, alphas_sub, betas_sub) = qr_factorization(
+                    alphas_k[rows] - mu * np.ones(len(rows)), betas_k[subs]
+                )
+                (alphas_k[rows], betas_k[subs]) = update_matrix(
+                    c_ks, s_ks, alphas_sub, betas_sub
+                )
+
+                alphas_k[rows] += mu * np.ones(len(rows))
+
+                V[:, rows] = update_eigenvectors(V[:, rows], c_ks, s_ks)
+
+                stall += 1
+
+                mu = shift(alphas_k[rows], betas_k[subs], stall)
+
+            if ql:
+                deflations.append((l, stall, "ql"))
+                l += 1
+            else:
+                deflations.append((r, stall, "qr"))
+                r -= 1
+
+    return (alphas_k, betas_k, V, deflations)
+
+
+def qr_algorithm(
+    alphas: np.array,
+    betas: np.array,
+    V0: np.array = None,
+    spectralShift: bool = True,
+    epsilon: float = 1e-7,
+    shift=None,
+    direction: str = "qr",
+) -> Tuple[np.array, np.array, np.array, int]:
+    """
+    Algoritmo QR
+    --------------------------------------
+    Dada uma matriz tridiagonal simétrica, representada por dois vetores `alphas` e `betas`, que armazenam
+    sua diagonal principal e sua sobrediagonal, efetua o Algoritmo QR, com ou sem deslocamento espectral, até
+    atingir um determinado erro epsilon, e retorna a matriz com os auto-valores calculados, a matriz com os
+    auto-vetores e o número total de iterações executadas pelo algoritmo
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    V0  :   np.array
+        Matriz à qual as rotações de Givens são acumuladas: a matriz `H` da tridiagonalização, para obter os
+        auto-vetores da matriz original. Se None, utiliza-se a identidade.
+
+    spectralShift : bool
+        Se for True, a função executa o algoritmo com deslocamento espectral. Se for False, executa o algoritmo
+        sem deslocamento espectral.
+
+    epsilon : float
+        Valor utilizado para determinar convergência dos valores calculados. Quanto menor for, menor será o erro
+        do valor final calculado em relação ao ideal.
+
+    shift : Callable[[np.array, np.array, int], float]
+        Estratégia de deslocamento espectral (veja `shifted_qr`). Se fornecida, tem precedência sobre
+        `spectralShift`.
+
+    direction : str
+        Direção das varreduras: `"qr"` (padrão, desacopla pelo fim), `"ql"` (desacopla pelo início) ou `"auto"`,
+        que escolhe a direção para cada bloco (veja `shifted_qr`).
+
+    Retorna
+    -------
+
+    (alphas, betas)   :   Tuple[np.array, np.array]
+        Dupla que retorna os vetores `alphas` e `betas`, que retornam a representação da matriz
+        tridiagonal simétrica dos auto-valores, através de sua diagonal principal e sua sobrediagonal.
+
+    V : np.array
+        Matriz com os auto-vetores da matriz A.
+
+    iterations : int
+        Número de iterações executadas pelo algoritmo.
+    """
+    if shift is None:
+        shift = wilkinson_h if spectralShift else zero_h
+
+    (alphas_k, betas_k, V, deflations) = shifted_qr(
+        alphas, betas, V0, shift, epsilon, direction
+    )
+
+    return (alphas_k, betas_k, V, sum(iterations for (_, iterations, _) in deflations))
+
+
+def anytime_qr(
+    alphas: np.array,
+    betas: np.array,
+    V0: np.array = None,
+    deadline: float = None,
+    cancel=None,
+    shift=wilkinson_h,
+    epsilon: float = 1e-7,
+    direction: str = "auto",
+) -> Tuple[np.array, np.array, np.array, np.array]:
+    """
+    Algoritmo QR com Prazo
+    ----------------------
+    Efetua o Algoritmo QR (veja `shifted_qr`) até a convergência, até o instante `deadline` ou até que `cancel` seja
+    sinalizado, o que ocorrer primeiro. Em caso de interrupção, retorna os autovalores já desacoplados e as
+    estimativas atuais dos demais, isto é, a diagonal principal da matriz tridiagonal corrente.
+
+    Cada estimativa acompanha uma cota de erro do tipo Gershgorin, `|beta_(i-1)| + |beta_i|`, calculada com a
+    sobrediagonal corrente. Como a matriz corrente é ortogonalmente semelhante à original, a união dos discos
+    centrados nas estimativas contém todos os autovalores; para os autovalores já desacoplados a cota é da ordem
+    de `epsilon`.
+
+    Parâmetros
+    ----------
+
+    alphas  :   np.array
+        Vetor da diagonal principal da matriz A.
+
+    betas   :   np.array
+        Vetor da sobrediagonal da matriz A.
+
+    V0  :   np.array
+        Matriz à qual as rotações de Givens são acumuladas. Se None, utiliza-se a identidade.
+
+    deadline    :   float
+        Instante limite, no relógio de `time.monotonic()`. Se None, não há prazo.
+
+    cancel  :   threading.Event
+        Sinal de cancelamento cooperativo: qualquer objeto com método `is_set()`. Se None, o cálculo não pode ser
+        cancelado.
+
+    shift, epsilon, direction
+        Repassados a `shifted_qr`.
+
+    Retorna
+    -------
+
+    Lambda  :   np.array
+        Autovalores desacoplados e estimativas dos demais.
+
+    bounds  :   np.array
+        Cotas de erro de cada entrada de `Lambda`.
+
+    V   :   np.array
+        Matriz com os auto-vetores (ou suas aproximações) da matriz A.
+
+    converged   :   np.array
+        Vetor booleano que indica quais entradas de `Lambda` já foram desacopladas, isto é, estão isoladas por
+        entradas desprezíveis (menores que `epsilon`) da sobrediagonal dos dois lados.
+    """
+
+    def stop() -> bool:
+        return (deadline is not None and time.monotonic() >= deadline) or (
+            cancel is not None and cancel.is_set()
+        )
+
+    (Lambda, betas_k, V, deflations) = shifted_qr(
+        alphas, betas, V0, shift, epsilon, direction, stop
+    )
+
+    negligible = np.abs(betas_k) < epsilon
+    converged = np.concatenate(([True], negligible)) & np.concatenate(
+        (negligible, [True])
+    )
+
+    radii = np.abs(betas_k)
+    bounds = np.concatenate(([0], radii)) + np.concatenate((radii, [0]))
+
+    return (Lambda, bounds, V, converged)
@@ -0,0 +1,19 @@
+"""
+Renderização
+============
+Exportação das animações dos Exercícios-Programa para imagens, GIF ou MP4, sem janela e em paralelo.
+
+Como o núcleo `eigen`, a pasta `render` deve estar no diretório pai de `EP1` e `EP2`.
+"""
+from .export import (
+    EXPORT,
+    FORMATS,
+    FRAME_PATTERN,
+    SHARED,
+    export_animation,
+    export_path,
+    open_frames,
+    render_frames,
+    render_range,
+    share,
+)
@@ -0,0 +1,238 @@
+"""
+Exportação de Animações
+=======================
+Renderização das animações dos Exercícios-Programa sem janela (servidores sem tela, relatórios automáticos): os
+quadros são desenhados pelo backend não interativo Agg, em paralelo por um conjunto de processos, e gravados como
+uma sequência de imagens PNG, um GIF ou um MP4.
+
+Uma animação é descrita por uma trajetória pré-calculada (qualquer objeto serializável, em geral uma tupla de
+`np.array`, indexada pelo número do quadro) e por uma função `setup(fig, trajectory)` que cria os artistas na
+figura `fig` e retorna `update(index)`, que os leva ao quadro `index`: a mesma função serve ao `FuncAnimation`
+interativo e à exportação. A trajetória é enviada uma única vez a cada processo, que renderiza um intervalo
+contíguo de quadros.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+EXPORT = os.environ.get("ANIMATION_EXPORT")
+
+FORMATS = ("png", "gif", "mp4")
+
+FRAME_PATTERN = "frame_%05d.png"
+
+SHARED = {}
+
+
+def export_path(target: str, name: str) -> str:
+    """
+    Retorna o caminho de exportação da animação `name` a partir do destino `target`: dentro da pasta `target`, se
+    ele não tiver extensão, ou `target` com `_name` antes da extensão (por exemplo, `out/modos.gif` e `modo1` dão
+    `out/modos_modo1.gif`).
+    """
+    (root, extension) = os.path.splitext(target)
+    if not extension:
+        return os.path.join(target, name)
+    return f"{root}_{name}{extension}"
+
+
+def share(setup: Callable, trajectory, size: tuple, dpi: int) -> None:
+    """
+    Inicializador dos processos de renderização: guarda a função `setup`, a trajetória e o tamanho da figura em
+    `SHARED`, uma única vez por processo.
+    """
+    SHARED.update(setup=setup, trajectory=trajectory, size=size, dpi=dpi)
+
+
+def render_range(start: int, stop: int, pattern: str) -> int:
+    """
+    Renderiza os quadros `start` a `stop - 1` da animação guardada em `SHARED` (veja `share`) com o backend Agg,
+    sem `pyplot`, gravando o quadro `index` em `pattern % index`. A figura e os artistas são criados uma vez e
+    apenas atualizados a cada quadro. Retorna o número de quadros gravados.
+    """
+    fig = Figure(figsize=SHARED["size"], dpi=SHARED["dpi"])
+    FigureCanvasAgg(fig)
+    update = SHARED["setup"](fig, SHARED["trajectory"])
+
+    for index in range(start, stop):
+        update(index)
+        fig.savefig(pattern % index)
+
+    return stop - start
+
+
+def open_frames(paths: List[str]):
+    """
+    Abre as imagens de `paths` uma de cada vez, fechando cada uma antes de abrir a seguinte, para que a montagem do
+    GIF não mantenha todos os quadros abertos.
+    """
+    for path in paths:
+        with Image.open(path) as image:
+            yield image
+
+
+def render_frames(
+    setup: Callable,
+    trajectory,
+    frames: int,
+    directory: str,
+    workers: int = None,
+    size: tuple = (18.5, 10.5),
+    dpi: int = 50,
+) -> List[str]:
+    """
+    Renderização em Paralelo
+    ------------------------
+    Divide os `frames` quadros em intervalos contíguos, um por processo, e grava cada quadro como uma imagem PNG
+    em `directory` (veja `render_range`).
+
+    Parâmetros
+    ----------
+
+    setup   :   Callable
+        Função `setup(fig, trajectory)` que cria os artistas da animação e retorna `update(index)`. Deve poder ser
+        serializada (uma função definida no nível do módulo, ou um `functools.partial` de uma).
+
+    trajectory  :   object
+        Trajetória pré-calculada, compartilhada por todos os quadros.
+
+    frames  :   int
+        Número de quadros.
+
+    directory   :   str
+        Pasta em que as imagens são gravadas (criada, se necessário).
+
+    workers :   int
+        Número de processos. Se None, o número de processadores.
+
+    size    :   tuple
+        Tamanho da figura, em polegadas.
+
+    dpi :   int
+        Resolução, em pontos por polegada.
+
+    Retorna
+    -------
+
+    paths   :   List[str]
+        Os caminhos das imagens, na ordem dos quadros.
+    """
+    os.makedirs(directory, exist_ok=True)
+    pattern = os.path.join(directory, FRAME_PATTERN)
+    workers = min(workers or os.cpu_count() or 1, frames)
+    bounds = np.linspace(0, frames, workers + 1).astype(int)
+
+    with ProcessPoolExecutor(
+        workers, initializer=share, initargs=(setup, trajectory, size, dpi)
+    ) as pool:
+        tasks = [
+            pool.submit(render_range, start, stop, pattern)
+            for (start, stop) in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        for task in tasks:
+            task.result()
+
+    return [pattern % index for index in range(frames)]
+
+
+def export_animation(
+    setup: Callable,
+    trajectory,
+    frames: int,
+    output: str,
+    fps: int = 40,
+    workers: int = None,
+    size: tuple = (18.5, 10.5),
+    dpi: int = 50,
+) -> str:
+    """
+    Exportação de Animação
+    ----------------------
+    Renderiza a animação em paralelo (veja `render_frames`) e a grava em `output`, de acordo com a extensão:
+
+    - `.gif`: GIF animado, montado pelo Pillow;
+    - `.mp4`: vídeo H.264, codificado pelo `ffmpeg`, que deve estar no `PATH`;
+    - sem extensão (ou `.png`): sequência de imagens `frame_00000.png`, ... na pasta `output`.
+
+    Parâmetros
+    ----------
+
+    setup, trajectory, frames, workers, size, dpi
+        Como em `render_frames`.
+
+    output  :   str
+        Arquivo ou pasta de destino.
+
+    fps :   int
+        Quadros por segundo do GIF ou do vídeo.
+
+    Retorna
+    -------
+
+    output  :   str
+        O caminho gravado.
+    """
+    (root, extension) = os.path.splitext(output)
+    extension = extension.lower().lstrip(".")
+    if extension not in FORMATS + ("",):
+        raise ValueError(f"Formato desconhecido: {extension}.")
+
+    if extension in ("", "png"):
+        render_frames(setup, trajectory, frames, root, workers, size, dpi)
+        return root
+
+    if extension == "gif" and Image is None:
+        raise RuntimeError("A exportação em GIF requer o Pillow.")
+    if extension == "mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("A exportação em MP4 requer o ffmpeg no PATH.")
+
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=directory) as frames_directory:
+        paths = render_frames(
+            setup, trajectory, frames, frames_directory, workers, size, dpi
+        )
+
+        if extension == "gif":
+            with Image.open(paths[0]) as first:
+                first.save(
+                    output,
+                    save_all=True,
+                    append_images=open_frames(paths[1:]),
+                    duration=1000 / fps,
+                    loop=0,
+                )
+        else:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-loglevel",
+                    "error",
+                    "-framerate",
+                    str(fps),
+                    "-i",
+                    os.path.join(frames_directory, FRAME_PATTERN),
+                    "-vf",
+                    "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                    "-pix_fmt",
+                    "yuv420p",
+                    output,
+                ],
+                check=True,
+            )
+
+    return output
@@ -0,0 +1,39 @@
+"""
+Configuração dos testes: o núcleo `eigen` é importado a partir da raiz do repositório e a tabela de calibração
+dos backends é gravada em uma pasta temporária, sem alterar a do usuário. Os `main.py` dos Exercícios-Programa
+são importados como módulos, com o backend não interativo do Matplotlib.
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ.setdefault(
+    "EIGEN_TUNING_CACHE", os.path.join(tempfile.mkdtemp(), "eigen_backends.json")
+)
+
+
+def load_main(folder: str):
+    """
+    Importa o `main.py` da pasta `folder` (`EP1` ou `EP2`) como um módulo, sem executar o menu.
+    """
+    path = os.path.join(ROOT, folder, "main.py")
+    spec = importlib.util.spec_from_file_location(f"{folder.lower()}_main", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def ep2():
+    return load_main("EP2")
+
+
+@pytest.fixture(scope="session")
+def ep1():
+    return load_main("EP1")
@@ -0,0 +1,87 @@
+"""
+Testes do registro de backends: precisão de cada backend, comparada a `numpy.linalg.eigh`, e calibração
+explícita e limitada.
+"""
+import sys
+
+import numpy as np
+import pytest
+
+from eigen import (
+    BACKENDS,
+    PREFERENCE,
+    implicit_ql,
+    solve,
+    tune,
+    tuned_backend,
+    vectorized_ql,
+)
+
+backends = sys.modules["eigen.backends"]
+
+EPS = np.finfo(float).eps
+
+
+def random_tridiagonal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(n), rng.standard_normal(n - 1))
+
+
+@pytest.mark.parametrize("name", sorted(BACKENDS))
+def test_backend_accuracy(name):
+    (alphas, betas) = random_tridiagonal(60)
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    (Lambda, _, V, _) = solve(alphas, betas, backend=name)
+    norm = np.max(np.abs(np.linalg.eigvalsh(T)))
+    assert np.allclose(
+        np.sort(Lambda), np.linalg.eigvalsh(T), rtol=0, atol=1e3 * EPS * norm
+    )
+    assert np.max(np.abs(T @ V - V * Lambda)) <= 1e3 * EPS * norm
+    assert np.max(np.abs(V.T @ V - np.identity(60))) <= 1e3 * EPS * 60
+
+
+def test_vectorized_ql_matches_implicit_ql():
+    (alphas, betas) = random_tridiagonal(30, seed=1)
+    results = []
+    for ql in (implicit_ql, vectorized_ql):
+        (d, e, Z) = (alphas.copy(), np.append(betas, 0.0), np.identity(30))
+        iterations = ql(d, e, Z, EPS)
+        results.append((d, Z, iterations))
+    assert np.allclose(results[0][0], results[1][0], rtol=0, atol=1e3 * EPS)
+    assert np.allclose(results[0][1], results[1][1], rtol=0, atol=1e3 * EPS)
+    assert results[0][2] == results[1][2] > 0
+
+
+def test_auto_does_not_calibrate(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("calibração implícita")
+
+    monkeypatch.setattr(backends, "calibrate", fail)
+    path = str(tmp_path / "tuning.json")
+    (alphas, betas) = random_tridiagonal(20)
+    solve(alphas, betas, path=path)
+    assert tuned_backend(20, path) == next(p for p in PREFERENCE if p in BACKENDS)
+
+
+def test_calibration_size_is_capped(monkeypatch):
+    sizes = []
+
+    def fake(alphas, betas, V0=None):
+        sizes.append(len(alphas))
+        return (alphas, betas, V0, 0)
+
+    monkeypatch.setitem(backends.BACKENDS, "fake", fake)
+    monkeypatch.setitem(backends.CALIBRATION_LIMITS, "fake", None)
+    assert list(backends.calibrate(20, backends=["fake"], repeats=1)) == ["fake"]
+    assert max(sizes) == backends.CALIBRATION_SIZE
+
+
+def test_tune_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(backends, "calibrate", lambda band: {"mrrr": 1.0})
+    path = str(tmp_path / "tuning.json")
+    table = tune(path=path)
+    assert set(table.values()) == {"mrrr"}
+    assert len(table) == backends.size_band(backends.CALIBRATION_SIZE)
+
+    monkeypatch.setattr(backends, "load_tuning", lambda path: {})
+    assert tuned_backend(10 ** 6, path) == "mrrr"
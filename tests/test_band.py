@@ -0,0 +1,51 @@
+"""
+Testes da reordenação RCM e da redução de banda à forma tridiagonal, comparadas a `numpy.linalg.eigh`.
+"""
+import numpy as np
+import pytest
+import scipy.sparse
+
+from eigen import (
+    band_reduction,
+    band_storage,
+    band_tridiagonalization,
+    bandwidth,
+    qr_algorithm,
+    reverse_cuthill_mckee,
+)
+
+
+def banded(n, b, seed=0):
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    A = np.triu(np.tril(A + A.T, b), -b)
+    return A
+
+
+def scrambled(n, b, seed=0):
+    A = banded(n, b, seed)
+    perm = np.random.default_rng(seed + 1).permutation(n)
+    return A[perm][:, perm]
+
+
+@pytest.mark.parametrize("b", [1, 2, 5])
+def test_band_tridiagonalization(b):
+    A = banded(50, b)
+    (alphas, betas, Q) = band_tridiagonalization(band_storage(A, bandwidth(A)))
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    assert np.allclose(Q @ T @ Q.T, A)
+    assert np.allclose(np.linalg.eigvalsh(T), np.linalg.eigvalsh(A))
+
+
+def test_reverse_cuthill_mckee_narrows_band():
+    A = scrambled(80, 3)
+    perm = reverse_cuthill_mckee(scipy.sparse.csr_array(A))
+    assert np.array_equal(np.sort(perm), np.arange(80))
+    assert bandwidth(A[perm][:, perm]) < bandwidth(A)
+
+
+def test_band_reduction_modes_in_original_order():
+    A = scrambled(60, 2, seed=3)
+    (alphas, betas, Q, _) = band_reduction(scipy.sparse.csr_array(A))
+    (Lambda, _, V, _) = qr_algorithm(alphas, betas, Q, epsilon=1e-13)
+    assert np.allclose(np.sort(Lambda), np.linalg.eigvalsh(A), atol=1e-10)
+    assert np.allclose(A @ V, V * Lambda, atol=1e-9)
@@ -0,0 +1,37 @@
+"""
+Testes da solução por componentes conexas, comparada a `numpy.linalg.eigh`.
+"""
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+
+from eigen import connected_components, solve_components
+
+
+def decoupled(sizes, seed=0):
+    rng = np.random.default_rng(seed)
+    blocks = [rng.standard_normal((m, m)) for m in sizes]
+    A = scipy.linalg.block_diag(*[B + B.T for B in blocks])
+    perm = rng.permutation(len(A))
+    return A[perm][:, perm]
+
+
+def test_connected_components():
+    A = decoupled([4, 1, 6], seed=1)
+    (count, labels) = connected_components(scipy.sparse.csr_array(A))
+    assert count == 3
+    assert sorted(np.bincount(labels)) == [1, 4, 6]
+    for c in range(count):
+        outside = labels != c
+        assert np.all(A[np.ix_(labels == c, outside)] == 0)
+
+
+def test_solve_components_matches_eigh():
+    A = decoupled([5, 12, 1, 30], seed=2)
+    for matrix in (A, scipy.sparse.csr_array(A)):
+        (Lambda, V, labels) = solve_components(matrix, workers=2)
+        assert np.allclose(Lambda, np.linalg.eigvalsh(A), atol=1e-10)
+        assert np.allclose(A @ V, V * Lambda, atol=1e-9)
+        assert np.allclose(V.T @ V, np.identity(len(A)), atol=1e-10)
+        for column in V.T:
+            assert len(np.unique(labels[np.abs(column) > 1e-12])) == 1
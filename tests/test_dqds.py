@@ -0,0 +1,45 @@
+"""
+Testes do algoritmo dqds, comparado a `numpy.linalg.eigvalsh` e aos autovalores exatos do laplaciano discreto.
+"""
+import numpy as np
+import pytest
+
+from eigen import dqds, qd_arrays
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 50, 300])
+def test_dqds_random(n):
+    rng = np.random.default_rng(n)
+    (alphas, betas) = (rng.standard_normal(n), rng.standard_normal(n - 1))
+    A = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    (Lambda, _) = dqds(alphas, betas)
+    assert np.allclose(Lambda, np.linalg.eigvalsh(A), atol=1e-12 * np.abs(A).max())
+
+
+def test_dqds_small_eigenvalues_relative_accuracy():
+    n = 400
+    k = np.arange(1, n + 1)
+    exact = 4 * np.sin(k * np.pi / (2 * (n + 1))) ** 2
+    (Lambda, _) = dqds(2 * np.ones(n), -np.ones(n - 1))
+    assert np.all(qd_arrays(2 * np.ones(n), -np.ones(n - 1))[0] > 0)
+    assert np.allclose(Lambda, exact, rtol=1e-12, atol=0)
+
+
+def test_dqds_rejects_indefinite_shift():
+    with pytest.raises(ValueError):
+        dqds(np.array([1.0, -1.0]), np.array([0.5]), shift=0.0)
+
+
+@pytest.mark.parametrize("scale", [1e-200, 1e160, 1e300])
+def test_dqds_extreme_scales(scale):
+    (alphas, betas) = (np.array([1.0, -2.0, 3.0]), np.array([1.0, 1.0]))
+    A = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    (Lambda, _) = dqds(scale * alphas, scale * betas)
+    assert np.allclose(Lambda / scale, np.linalg.eigvalsh(A), rtol=1e-13, atol=0)
+    assert np.array_equal(dqds(np.zeros(3), np.zeros(2))[0], np.zeros(3))
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_dqds_rejects_non_finite(bad):
+    with pytest.raises(ValueError):
+        dqds(np.array([1.0, bad, 3.0]), np.array([1.0, 1.0]))
@@ -0,0 +1,50 @@
+"""
+Testes do problema de autovalores generalizado, comparado a `scipy.linalg.eigh`.
+"""
+import numpy as np
+import pytest
+import scipy.linalg
+import scipy.sparse
+
+from eigen import ENGINES, mass_normalize, solve_generalized
+
+
+def stiffness(n):
+    return 2 * np.identity(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_lumped_mass_engines(engine):
+    n = 40
+    K = scipy.sparse.csr_array(stiffness(n))
+    M = np.random.default_rng(0).uniform(1.0, 3.0, n)
+    k = 5 if engine == "lanczos" else None
+    (Lambda, Z) = solve_generalized(K, M, k=k, engine=engine)
+
+    expected = scipy.linalg.eigh(stiffness(n), np.diag(M), eigvals_only=True)[:k]
+    assert np.allclose(Lambda, expected, rtol=1e-8, atol=1e-12)
+    assert np.allclose(Z.T @ (M[:, None] * Z), np.identity(len(Lambda)), atol=1e-8)
+    assert np.allclose(K @ Z, (M[:, None] * Z) * Lambda, atol=1e-8)
+
+
+def test_full_mass_matrix():
+    n = 25
+    B = np.random.default_rng(1).standard_normal((n, n))
+    M = B @ B.T + n * np.identity(n)
+    K = stiffness(n)
+    (Lambda, Z) = solve_generalized(K, M)
+    assert np.allclose(Lambda, scipy.linalg.eigh(K, M, eigvals_only=True))
+    assert np.allclose(Z.T @ M @ Z, np.identity(n), atol=1e-10)
+    assert np.allclose(K @ Z, M @ Z * Lambda, atol=1e-10)
+
+
+def test_mass_normalize_keeps_sparsity():
+    K = scipy.sparse.csr_array(stiffness(10))
+    (K_tilde, S) = mass_normalize(K, scipy.sparse.diags_array(np.arange(1.0, 11.0)))
+    assert scipy.sparse.issparse(K_tilde) and K_tilde.nnz == K.nnz
+    assert np.allclose(S, 1 / np.sqrt(np.arange(1.0, 11.0)))
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        solve_generalized(stiffness(4), np.ones(4), engine="qz")
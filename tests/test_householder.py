@@ -0,0 +1,62 @@
+"""
+Testes da tridiagonalização de Householder, comparada a `numpy.linalg.eigh`.
+"""
+import numpy as np
+import pytest
+
+from eigen import back_transform, tridiagonalization, wy_factor
+
+
+def symmetric(n, seed=0):
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    return A + A.T
+
+
+def test_tridiagonalization_similarity():
+    A = symmetric(70)
+    (alphas, betas, H) = tridiagonalization(A, block_size=8)
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    assert np.allclose(H @ T @ H.T, A)
+    assert np.allclose(np.linalg.eigvalsh(T), np.linalg.eigvalsh(A))
+
+
+def test_compact_reflectors_start_at_subdiagonal():
+    n = 12
+    A = symmetric(n, 1)
+    (_, _, H) = tridiagonalization(A)
+    (_, _, (Y, taus)) = tridiagonalization(A, compact=True)
+
+    P = np.identity(n)
+    for (k, tau) in enumerate(taus):
+        v = np.zeros(n)
+        v[k + 1 :] = Y[k + 1 :, k]
+        P = P @ (np.identity(n) - tau * np.outer(v, v))
+    assert np.allclose(P, H)
+    assert np.allclose(back_transform((Y, taus), np.identity(n)), H)
+
+
+@pytest.mark.parametrize("block_size", [2, 5, 32])
+def test_blocked_matches_column_reduction(block_size):
+    A = symmetric(45, 2)
+    (alphas, betas, H) = tridiagonalization(A, block_size=1)
+    (alphas_b, betas_b, H_b) = tridiagonalization(A, block_size=block_size)
+    assert np.allclose(alphas_b, alphas) and np.allclose(betas_b, betas)
+    assert np.allclose(H_b, H)
+
+
+def test_wy_factor():
+    rng = np.random.default_rng(3)
+    (V, taus) = (rng.standard_normal((10, 4)), rng.uniform(0.1, 1.0, 4))
+    product = np.identity(10)
+    for (v, tau) in zip(V.T, taus):
+        product = product @ (np.identity(10) - tau * np.outer(v, v))
+    assert np.allclose(np.identity(10) - V @ wy_factor(V, taus) @ V.T, product)
+
+
+def test_zero_columns():
+    A = np.diag([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    A[4, 5] = A[5, 4] = 1.0
+    (alphas, betas, H) = tridiagonalization(A, block_size=2)
+    assert np.all(np.isfinite(H))
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    assert np.allclose(H @ T @ H.T, A)
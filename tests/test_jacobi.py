@@ -0,0 +1,44 @@
+"""
+Testes do Algoritmo de Jacobi em ordem de torneio, comparado a `numpy.linalg.eigh`.
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from eigen import jacobi, round_robin
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 8])
+def test_round_robin_pairs_each_index_once(n):
+    pairs = []
+    for (P, Q) in round_robin(n):
+        assert len(set(P) | set(Q)) == 2 * len(P)
+        pairs += [tuple(sorted(pair)) for pair in zip(P, Q)]
+    assert sorted(pairs) == list(itertools.combinations(range(n), 2))
+
+
+@pytest.mark.parametrize("n", [1, 2, 9, 40])
+def test_jacobi_matches_eigh(n):
+    B = np.random.default_rng(n).standard_normal((n, n))
+    A = B + B.T
+    (Lambda, betas, V, _) = jacobi(A, epsilon=1e-14)
+    assert np.allclose(np.sort(Lambda), np.linalg.eigvalsh(A), atol=1e-12)
+    assert np.allclose(A @ V, V * Lambda, atol=1e-11)
+    assert np.allclose(V.T @ V, np.identity(n), atol=1e-12)
+    assert np.all(betas == 0) and len(betas) == max(n - 1, 0)
+
+
+def test_jacobi_skips_sweeps_on_diagonal_matrix():
+    A = np.diag([3.0, 1.0, 2.0]) + 1e-10 * np.ones((3, 3))
+    (Lambda, _, V, sweeps) = jacobi(A)
+    assert sweeps == 0
+    assert np.array_equal(Lambda, np.diag(A)) and np.array_equal(V, np.identity(3))
+
+
+def test_jacobi_warns_when_sweeps_run_out():
+    B = np.random.default_rng(3).standard_normal((12, 12))
+    with pytest.warns(RuntimeWarning, match="Jacobi"):
+        (_, _, V, sweeps) = jacobi(B + B.T, epsilon=1e-14, max_sweeps=1)
+    assert sweeps == 1
+    assert np.allclose(V.T @ V, np.identity(12), atol=1e-12)
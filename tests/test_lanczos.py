@@ -0,0 +1,36 @@
+"""
+Testes do método de Lanczos, comparado a `numpy.linalg.eigh`.
+"""
+import sys
+
+import numpy as np
+import pytest
+
+from eigen import lanczos, lanczos_eigsh
+
+
+def laplacian(n):
+    return 2 * np.identity(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def test_lanczos_eigsh_smallest():
+    A = laplacian(150)
+    (Lambda, V, _) = lanczos_eigsh(A, 5)
+    assert np.allclose(Lambda, np.linalg.eigvalsh(A)[:5], rtol=1e-8, atol=0)
+    assert np.allclose(A @ V, V * Lambda, atol=1e-8)
+
+
+def test_ritz_pairs_do_not_use_auto_backend(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("escolha automática de backend")
+
+    monkeypatch.setattr(sys.modules["eigen.backends"], "tuned_backend", fail)
+    lanczos_eigsh(laplacian(60), 3)
+
+
+def test_lanczos_warns_without_convergence():
+    A = np.diag(np.arange(1.0, 101.0))
+    v0 = np.ones(100)
+    with pytest.warns(RuntimeWarning, match="não convergiu"):
+        (alphas, _, _, _) = lanczos(lambda v: A @ v, v0, max_steps=4, k=3)
+    assert len(alphas) == 4
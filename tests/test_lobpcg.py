@@ -0,0 +1,63 @@
+"""
+Testes do método LOBPCG, comparado a `scipy.linalg.eigh` no problema generalizado.
+"""
+import sys
+
+import numpy as np
+import pytest
+import scipy.linalg
+
+from eigen import lobpcg, m_complement
+
+
+def pencil(n, seed=0):
+    K = 2 * np.identity(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    M = np.random.default_rng(seed).uniform(1.0, 2.0, n)
+    return (K, M)
+
+
+def test_lobpcg_generalized_smallest():
+    (K, M) = pencil(120)
+    (Lambda, X, _) = lobpcg(K, M, k=4, tolerance=1e-9, max_iterations=500)
+    reference = scipy.linalg.eigh(K, np.diag(M), eigvals_only=True)[:4]
+    assert np.allclose(Lambda, reference, rtol=1e-7, atol=0)
+    assert np.allclose(X.T @ (M[:, None] * X), np.identity(4), atol=1e-10)
+    assert np.allclose(K @ X, (M[:, None] * X) * Lambda, atol=1e-7)
+
+
+def test_lobpcg_does_not_use_auto_backend(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("escolha automática de backend")
+
+    monkeypatch.setattr(sys.modules["eigen.backends"], "tuned_backend", fail)
+    (K, M) = pencil(40)
+    lobpcg(K, M, k=2)
+
+
+def test_lobpcg_warns_without_convergence():
+    (K, M) = pencil(200)
+    with pytest.warns(RuntimeWarning, match="não convergiu"):
+        (Lambda, X, iterations) = lobpcg(K, M, k=3, max_iterations=3)
+    assert iterations == 3
+    assert np.shape(X) == (200, 3)
+
+
+def test_m_complement_drops_dependent_columns():
+    rng = np.random.default_rng(1)
+    (n, M) = (30, rng.uniform(1.0, 2.0, 30))
+    X = np.linalg.qr(rng.standard_normal((n, 3)))[0] / np.sqrt(M)[:, None]
+    X = X @ np.linalg.inv(np.linalg.cholesky(X.T @ (M[:, None] * X)).T)
+    Y = rng.standard_normal((n, 2))
+    S = np.hstack((Y, Y @ [[1.0], [2.0]], X[:, :1] + 1e-14 * Y[:, :1]))
+    (S, MS) = m_complement(X, M[:, None] * X, S, M[:, None] * S)
+    assert np.size(S, 1) == 2
+    assert np.allclose(S.T @ MS, np.identity(2), atol=1e-12)
+    assert np.allclose(X.T @ MS, 0, atol=1e-12)
+
+
+def test_lobpcg_with_dependent_directions():
+    (K, M) = pencil(60)
+    duplicate = lambda R: R[:, [0] * np.size(R, 1)]
+    (Lambda, _, _) = lobpcg(K, M, k=2, preconditioner=duplicate, max_iterations=500)
+    reference = scipy.linalg.eigh(K, np.diag(M), eigvals_only=True)[:2]
+    assert np.allclose(Lambda, reference, rtol=1e-7, atol=0)
@@ -0,0 +1,100 @@
+"""
+Testes da leitura e escrita de matrizes, em texto e em binário.
+"""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from eigen import (
+    is_binary,
+    open_binary,
+    pack,
+    read_header,
+    read_text,
+    tridiagonalization,
+    write_binary,
+)
+
+
+def symmetric(n, seed=0):
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    return A + A.T
+
+
+def write_text(path, A):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"{len(A)}\n")
+        np.savetxt(file, A)
+
+
+def test_read_text(tmp_path):
+    A = symmetric(7)
+    write_text(tmp_path / "input", A)
+    assert np.allclose(read_text(str(tmp_path / "input")), A)
+    assert np.allclose(read_text(str(tmp_path / "input"), packed=True), pack(A))
+
+
+def test_read_text_packed_streams_rows(tmp_path):
+    n = 400
+    write_text(tmp_path / "input", symmetric(n))
+    tracemalloc.start()
+    P = read_text(str(tmp_path / "input"), packed=True)
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(P) == n * (n + 1) // 2
+    assert peak < 8 * n * n
+
+
+def test_read_text_incomplete(tmp_path):
+    with open(tmp_path / "input", "w", encoding="utf-8") as file:
+        file.write("3\n1 2 3\n4 5\n")
+    with pytest.raises(ValueError):
+        read_text(str(tmp_path / "input"))
+    with pytest.raises(ValueError):
+        read_text(str(tmp_path / "input"), packed=True)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_binary_round_trip(tmp_path, packed):
+    A = symmetric(9)
+    path = str(tmp_path / "matrix.bin")
+    write_binary(path, pack(A) if packed else A)
+    assert np.array_equal(open_binary(path), pack(A) if packed else A)
+
+
+def test_binary_header_and_memmap(tmp_path):
+    A = symmetric(20, 1)
+    path = str(tmp_path / "matrix.bin")
+    write_binary(path, A)
+    write_text(tmp_path / "input", A)
+
+    assert is_binary(path) and not is_binary(str(tmp_path / "input"))
+    assert read_header(path) == (20, np.dtype(float), True, False)
+    M = open_binary(path)
+    assert isinstance(M, np.memmap)
+    (alphas, betas, _) = tridiagonalization(M)
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    assert np.allclose(np.linalg.eigvalsh(T), np.linalg.eigvalsh(A))
+
+
+def test_matrix_from_file_text(tmp_path, ep2):
+    A = symmetric(6, 2)
+    write_text(tmp_path / "input", A)
+    assert np.allclose(ep2.matrix_from_file(str(tmp_path / "input")), A)
+
+
+@pytest.mark.parametrize("stored_packed", [False, True])
+def test_matrix_from_file_binary(tmp_path, ep2, stored_packed):
+    n = 300
+    A = symmetric(n)
+    path = str(tmp_path / "matrix.bin")
+    write_binary(path, pack(A) if stored_packed else A)
+
+    assert np.allclose(ep2.matrix_from_file(path), A)
+    tracemalloc.start()
+    P = ep2.matrix_from_file(path, packed=True)
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert np.array_equal(P, pack(A))
+    assert peak < 8 * n * n
@@ -0,0 +1,87 @@
+"""
+Testes da superposição modal, comparada à avaliação direta modo a modo e à equação `x'' + A x = 0`.
+"""
+import numpy as np
+
+from eigen import modal_chunks, modal_response, solve, spring_chain
+
+
+def modes(n):
+    (alphas, betas) = spring_chain(np.linspace(1.0, 2.0, n + 1))
+    A = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    (Lambda, V) = np.linalg.eigh(A)
+    return (A, Lambda, V)
+
+
+def test_modal_response_matches_direct_sum():
+    (A, Lambda, V) = modes(6)
+    X0 = np.random.default_rng(0).standard_normal(6)
+    time = np.linspace(0, 5, 41)
+    X = modal_response(Lambda, V, X0, time)
+
+    Y0 = V.T @ X0
+    for (i, t) in [(0, 0.0), (13, time[13]), (40, 5.0)]:
+        expected = sum(
+            V[:, j] * Y0[j] * np.cos(np.sqrt(Lambda[j]) * t) for j in range(6)
+        )
+        assert np.allclose(X[:, i], expected)
+    assert np.allclose(X[:, 0], X0)
+
+    h = time[1] - time[0]
+    acceleration = (X[:, 2:] - 2 * X[:, 1:-1] + X[:, :-2]) / h ** 2
+    assert np.allclose(acceleration, -A @ X[:, 1:-1], atol=1e-2 * np.abs(A @ X).max())
+
+
+def test_modal_chunks_batch_and_memmap(tmp_path):
+    (_, Lambda, V) = modes(8)
+    X0 = np.random.default_rng(1).standard_normal((8, 3))
+    time = np.linspace(0, 10, 500)
+    expected = modal_response(Lambda, V, X0, time)
+    assert expected.shape == (3, 8, 500)
+
+    chunks = list(modal_chunks(Lambda, V, X0, time, memory=8 * 200))
+    assert len(chunks) > 1 and chunks[-1][1] == 500
+    out = np.memmap(tmp_path / "X.bin", dtype=float, mode="w+", shape=(3, 8, 500))
+    modal_response(Lambda, V, X0, time, out=out, memory=8 * 200)
+    assert np.allclose(out, expected)
+    for b in range(3):
+        assert np.allclose(modal_response(Lambda, V, X0[:, b], time), expected[b])
+
+
+def test_spring_chain_matches_baseline_ep1():
+    k = [40 + 2 * i for i in range(1, 7)]
+    (alphas, betas) = spring_chain(k)
+    assert np.allclose(alphas, [(a + b) / 2 for (a, b) in zip(k, k[1:])])
+    assert np.allclose(betas, [-b / 2 for b in k[1:-1]])
+
+
+def test_spring_chain_boundaries_and_masses():
+    rng = np.random.default_rng(2)
+    (n, m) = (7, rng.uniform(1.0, 3.0, 7))
+    for (left, right) in [(True, True), (True, False), (False, False)]:
+        k = rng.uniform(1.0, 5.0, n - 1 + left + right)
+        K = np.zeros((n + 2, n + 2))
+        for (i, spring) in enumerate(k, start=1 - left):
+            K[i : i + 2, i : i + 2] += spring * np.array([[1, -1], [-1, 1]])
+        K = K[1:-1, 1:-1]
+        expected = np.linalg.eigvalsh(K / np.sqrt(np.outer(m, m)))
+
+        (alphas, betas) = spring_chain(k, m, left, right)
+        A = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+        assert np.allclose(np.linalg.eigvalsh(A), expected)
+
+
+def test_modal_response_free_free_chain():
+    (alphas, betas) = spring_chain(
+        [3.0, 5.0, 7.0, 2.0], m=1.0, fixed_left=False, fixed_right=False
+    )
+    (Lambda, _, V, _) = solve(alphas, betas, backend="scipy")
+    time = np.linspace(0, 4, 9)
+    X0 = np.array([0.1, -0.2, 0.0, 0.3, 0.05])
+    X = modal_response(Lambda, V, X0, time)
+    assert np.all(np.isfinite(X))
+    assert np.allclose(X.mean(axis=0), X0.mean())
+
+    velocity = np.full(5, 0.5)
+    X = modal_response(Lambda, V, np.zeros(5), time, velocity=velocity)
+    assert np.allclose(X, np.outer(velocity, time))
@@ -0,0 +1,90 @@
+"""
+Testes do algoritmo MRRR, comparado a `numpy.linalg.eigh`.
+"""
+import numpy as np
+import pytest
+
+from eigen import mrrr
+
+EPS = np.finfo(float).eps
+
+
+def glued_wilkinson(copies: int, glue: float, m: int = 21):
+    """
+    Cópias da matriz de Wilkinson `W_m^+` coladas por `glue` na sobrediagonal: cada autovalor aparece
+    `copies` vezes, separado das cópias por muito menos que a precisão da máquina.
+    """
+    alphas = np.tile(np.abs(np.arange(m) - (m - 1) / 2), copies)
+    betas = np.ones(copies * m - 1)
+    betas[m - 1 :: m] = glue
+    return (alphas, betas)
+
+
+def check_eigensystem(alphas, betas, Lambda, V, tol=1e3):
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+    norm = np.max(np.abs(np.linalg.eigvalsh(T)))
+    assert np.allclose(
+        np.sort(Lambda), np.linalg.eigvalsh(T), rtol=0, atol=tol * EPS * norm
+    )
+    assert np.max(np.abs(T @ V - V * Lambda)) <= tol * EPS * norm
+    assert (
+        np.max(np.abs(V.T @ V - np.identity(np.size(V, 1)))) <= tol * len(alphas) * EPS
+    )
+
+
+@pytest.mark.parametrize("copies", [2, 4])
+@pytest.mark.parametrize("glue", [1e-3, 1e-6, 1e-9, 1e-12, 0.0])
+def test_glued_wilkinson(copies, glue):
+    (alphas, betas) = glued_wilkinson(copies, glue)
+    (Lambda, _, V, _) = mrrr(alphas, betas)
+    check_eigensystem(alphas, betas, Lambda, V)
+
+
+@pytest.mark.parametrize("n", [2, 3, 50, 300])
+def test_random(n):
+    rng = np.random.default_rng(n)
+    (alphas, betas) = (rng.standard_normal(n), rng.standard_normal(n - 1))
+    (Lambda, _, V, _) = mrrr(alphas, betas)
+    check_eigensystem(alphas, betas, Lambda, V)
+
+
+def test_split_and_graded():
+    n = 200
+    rng = np.random.default_rng(1)
+    (alphas, betas) = (rng.standard_normal(n), rng.standard_normal(n - 1))
+    betas[::7] = 0
+    (Lambda, _, V, _) = mrrr(alphas, betas)
+    check_eigensystem(alphas, betas, Lambda, V)
+
+    (alphas, betas) = (np.linspace(0, 1, n) ** 3, np.full(n - 1, 1e-5))
+    (Lambda, _, V, _) = mrrr(alphas, betas)
+    check_eigensystem(alphas, betas, Lambda, V)
+
+
+def test_indices():
+    n = 120
+    rng = np.random.default_rng(2)
+    (alphas, betas) = (rng.standard_normal(n), rng.standard_normal(n - 1))
+    (Lambda, _, V, _) = mrrr(alphas, betas)
+    indices = np.array([0, 7, 119, 7, 60])
+    (Lambda_k, _, V_k, _) = mrrr(alphas, betas, indices=indices)
+    assert np.array_equal(Lambda_k, Lambda[indices])
+    assert np.allclose(np.abs(np.sum(V_k * V[:, indices], axis=0)), 1)
+
+
+@pytest.mark.parametrize("scale", [1e-200, 1e200])
+def test_mrrr_extreme_scales(scale):
+    rng = np.random.default_rng(7)
+    for (alphas, betas) in [
+        (rng.standard_normal(40), rng.standard_normal(39)),
+        glued_wilkinson(2, 1e-9),
+    ]:
+        (alphas, betas) = (scale * alphas, scale * betas)
+        (Lambda, _, V, _) = mrrr(alphas, betas)
+        check_eigensystem(alphas, betas, Lambda, V)
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_mrrr_rejects_non_finite(bad):
+    with pytest.raises(ValueError):
+        mrrr(np.array([1.0, 2.0, 3.0]), np.array([1.0, bad]))
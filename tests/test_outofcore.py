@@ -0,0 +1,53 @@
+"""
+Testes da tridiagonalização fora da memória, comparada à redução em memória e a `numpy.linalg.eigh`.
+"""
+import numpy as np
+import pytest
+
+from eigen import (
+    back_transform_ooc,
+    qr_algorithm,
+    tridiagonalization,
+    tridiagonalization_ooc,
+)
+
+
+def stored_symmetric(path, n, seed=0):
+    B = np.random.default_rng(seed).standard_normal((n, n))
+    A = np.memmap(path, dtype=float, mode="w+", shape=(n, n))
+    A[:] = B + B.T
+    A.flush()
+    return A
+
+
+@pytest.mark.filterwarnings(
+    "error::ResourceWarning", "error::pytest.PytestUnraisableExceptionWarning"
+)
+def test_tridiagonalization_ooc_matches_in_memory(tmp_path):
+    n = 60
+    A = stored_symmetric(tmp_path / "A.bin", n)
+    original = np.array(A)
+    (alphas, betas, reflectors) = tridiagonalization_ooc(
+        A, memory=8 * n * 7, block_size=8
+    )
+    (alphas_ref, betas_ref, H) = tridiagonalization(original, block_size=8)
+
+    assert np.array_equal(np.array(A), original)
+    assert np.allclose(alphas, alphas_ref) and np.allclose(betas, betas_ref)
+
+    Z = np.random.default_rng(1).standard_normal((n, 10))
+    out = np.memmap(tmp_path / "V.bin", dtype=float, mode="w+", shape=(n, 10))
+    back_transform_ooc(reflectors, Z, out, memory=8 * n * 3)
+    assert np.allclose(out, H @ Z)
+
+
+def test_ooc_eigenpairs_in_place(tmp_path):
+    n = 40
+    A = stored_symmetric(tmp_path / "A.bin", n, seed=2)
+    original = np.array(A)
+    (alphas, betas, reflectors) = tridiagonalization_ooc(A, out=A, memory=8 * n * 5)
+    (Lambda, _, Z, _) = qr_algorithm(alphas, betas, epsilon=1e-13)
+    V = back_transform_ooc(reflectors, Z)
+
+    assert np.allclose(np.sort(Lambda), np.linalg.eigvalsh(original), atol=1e-10)
+    assert np.allclose(original @ V, V * Lambda, atol=1e-9)
@@ -0,0 +1,67 @@
+"""
+Testes do armazenamento simétrico compactado e da tridiagonalização sobre ele, comparada à redução densa.
+"""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from eigen import (
+    pack,
+    packed_matvec,
+    packed_order,
+    tridiagonalization,
+    tridiagonalization_packed,
+    unpack,
+)
+
+
+def symmetric(n, seed=0):
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    return A + A.T
+
+
+@pytest.mark.parametrize("n", [1, 2, 9])
+def test_pack_round_trip(n):
+    A = symmetric(n)
+    P = pack(A)
+    assert len(P) == n * (n + 1) // 2 and packed_order(P) == n
+    assert np.array_equal(unpack(P), A)
+
+
+def test_packed_order_rejects_bad_length():
+    with pytest.raises(ValueError):
+        packed_order(np.zeros(4))
+
+
+def test_packed_matvec_in_chunks():
+    A = symmetric(30, 1)
+    v = np.random.default_rng(2).standard_normal(30)
+    assert np.allclose(packed_matvec(pack(A), v, chunk=7), A @ v)
+
+
+def test_tridiagonalization_packed_matches_dense():
+    A = symmetric(40, 3)
+    (alphas, betas, H) = tridiagonalization(A)
+    (alphas_p, betas_p, H_p) = tridiagonalization_packed(pack(A), chunk=50)
+    assert np.allclose(alphas_p, alphas) and np.allclose(betas_p, betas)
+    assert np.allclose(H_p, H)
+    (alphas_p, _, H_p) = tridiagonalization(pack(A))
+    assert np.allclose(alphas_p, alphas) and H_p is not None
+    assert tridiagonalization_packed(pack(A), accumulate=False)[2] is None
+
+
+def test_matrix_from_file_packed(tmp_path, ep2):
+    n = 400
+    A = symmetric(n, 4)
+    with open(tmp_path / "input", "w", encoding="utf-8") as file:
+        file.write(f"{n}\n")
+        np.savetxt(file, A)
+
+    assert np.allclose(ep2.matrix_from_file(str(tmp_path / "input")), A)
+    tracemalloc.start()
+    P = ep2.matrix_from_file(str(tmp_path / "input"), packed=True)
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert np.allclose(P, pack(A))
+    assert peak < 8 * n * n
@@ -0,0 +1,131 @@
+"""
+Testes do Algoritmo QR e das suas estratégias de deslocamento, comparados a `numpy.linalg.eigh`.
+"""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from eigen import (
+    anytime_qr,
+    exceptional_h,
+    qr_algorithm,
+    rayleigh_h,
+    shifted_qr,
+    wilkinson_h,
+)
+
+
+def tridiagonal(alphas, betas):
+    return np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+
+
+def random_tridiagonal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(n), rng.standard_normal(n - 1))
+
+
+def check_eigenpairs(alphas, betas, Lambda, V, tolerance=1e-9):
+    A = tridiagonal(alphas, betas)
+    assert np.allclose(np.sort(Lambda), np.linalg.eigvalsh(A), atol=tolerance)
+    assert np.allclose(A @ V, V * Lambda, atol=10 * tolerance)
+    assert np.allclose(V.T @ V, np.identity(len(alphas)), atol=tolerance)
+
+
+@pytest.mark.parametrize(
+    "shift", [wilkinson_h, rayleigh_h, exceptional_h(), exceptional_h(rayleigh_h, 3)]
+)
+def test_shift_strategies(shift):
+    (alphas, betas) = random_tridiagonal(40)
+    (Lambda, _, V, deflations) = shifted_qr(
+        alphas, betas, shift=shift, epsilon=1e-13, direction="qr"
+    )
+    check_eigenpairs(alphas, betas, Lambda, V)
+    assert [m for (m, _, _) in deflations] == list(range(39, 0, -1))
+
+
+def test_qr_algorithm_counts_deflation_iterations():
+    (alphas, betas) = random_tridiagonal(30, seed=1)
+    (Lambda, _, V, iterations) = qr_algorithm(alphas, betas, epsilon=1e-13)
+    (_, _, _, deflations) = shifted_qr(alphas, betas, epsilon=1e-13, direction="qr")
+    check_eigenpairs(alphas, betas, Lambda, V)
+    assert iterations == sum(count for (_, count, _) in deflations)
+
+    (alphas, betas) = (np.arange(1.0, 11.0), np.ones(9))
+    (_, _, _, unshifted) = qr_algorithm(alphas, betas, spectralShift=False)
+    (_, _, _, shifted) = qr_algorithm(alphas, betas)
+    assert shifted < unshifted
+
+
+@pytest.mark.parametrize("direction", ["ql", "auto"])
+def test_sweep_directions(direction):
+    (alphas, betas) = random_tridiagonal(40, seed=2)
+    (Lambda, _, V, deflations) = shifted_qr(
+        alphas, betas, epsilon=1e-13, direction=direction
+    )
+    check_eigenpairs(alphas, betas, Lambda, V)
+    indices = [m for (m, _, _) in deflations]
+    assert len(set(indices)) == len(indices)
+    assert len(indices) == 39 if direction == "ql" else len(indices) <= 39
+
+
+def test_auto_direction_splits_interior_blocks():
+    graded = 10.0 ** np.arange(6)
+    alphas = np.concatenate((graded[::-1], graded))
+    betas = 0.3 * np.sqrt(alphas[:-1] * alphas[1:])
+    betas[5] = 0
+    (Lambda, _, V, deflations) = shifted_qr(
+        alphas, betas, epsilon=1e-13, direction="auto"
+    )
+    check_eigenpairs(alphas, betas, Lambda, V)
+    assert {sweep for (m, _, sweep) in deflations if m < 6} == {"qr"}
+    assert {sweep for (m, _, sweep) in deflations if m >= 6} == {"ql"}
+
+
+def test_auto_direction_on_graded_matrix():
+    alphas = 10.0 ** np.arange(12)
+    betas = 0.3 * np.sqrt(alphas[:-1] * alphas[1:])
+    reference = np.linalg.eigvalsh(tridiagonal(alphas, betas))
+
+    (Lambda, _, _, deflations) = shifted_qr(
+        alphas, betas, epsilon=1e-13, direction="auto"
+    )
+    (_, _, _, qr_deflations) = shifted_qr(alphas, betas, epsilon=1e-13, direction="qr")
+    assert {sweep for (_, _, sweep) in deflations} == {"ql"}
+    assert np.allclose(np.sort(Lambda), reference, rtol=1e-12, atol=0)
+    assert sum(count for (_, count, _) in deflations) < sum(
+        count for (_, count, _) in qr_deflations
+    )
+
+
+def test_anytime_qr_converges_without_limits():
+    (alphas, betas) = random_tridiagonal(30, seed=3)
+    (Lambda, bounds, V, converged) = anytime_qr(alphas, betas, epsilon=1e-13)
+    check_eigenpairs(alphas, betas, Lambda, V)
+    assert np.all(converged)
+    assert np.all(bounds < 1e-12)
+
+
+def test_anytime_qr_cancelled_bounds_contain_eigenvalues():
+    (alphas, betas) = random_tridiagonal(30, seed=4)
+    cancel = threading.Event()
+    cancel.set()
+    (Lambda, bounds, V, converged) = anytime_qr(alphas, betas, cancel=cancel)
+    assert not np.any(converged)
+    assert np.array_equal(Lambda, alphas) and np.array_equal(V, np.identity(30))
+
+    reference = np.linalg.eigvalsh(tridiagonal(alphas, betas))
+    inside = np.abs(reference[:, None] - Lambda[None, :]) <= bounds[None, :] + 1e-12
+    assert np.all(np.any(inside, axis=1))
+
+
+def test_anytime_qr_deadline():
+    (alphas, betas) = random_tridiagonal(20, seed=5)
+    (_, _, _, expired) = anytime_qr(alphas, betas, deadline=time.monotonic() - 1)
+    (Lambda, _, V, converged) = anytime_qr(
+        alphas, betas, deadline=time.monotonic() + 3600, epsilon=1e-13
+    )
+    assert not np.any(expired)
+    assert np.all(converged)
+    check_eigenpairs(alphas, betas, Lambda, V)
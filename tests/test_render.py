@@ -0,0 +1,80 @@
+"""
+Testes da exportação das animações sem janela, em imagens PNG e GIF.
+"""
+import os
+import shutil
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from render import export_animation, export_path, open_frames
+
+
+def moving_point(fig, trajectory):
+    ax = fig.add_subplot(111)
+    ax.set_xlim(-1, 1)
+    ax.set_ylim(-1, 1)
+    (point,) = ax.plot([], [], "o")
+
+    def update(index):
+        point.set_data([trajectory[index, 0]], [trajectory[index, 1]])
+        return (point,)
+
+    return update
+
+
+def circle(frames):
+    angles = 2 * np.pi * np.arange(frames) / frames
+    return 0.8 * np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def test_export_path():
+    assert export_path("out", "modo1") == os.path.join("out", "modo1")
+    assert export_path("out/modos.gif", "modo1") == "out/modos_modo1.gif"
+
+
+def test_export_png_sequence(tmp_path):
+    target = str(tmp_path / "frames")
+    path = export_animation(
+        moving_point, circle(6), 6, target, workers=2, size=(2, 2), dpi=20
+    )
+    names = sorted(os.listdir(path))
+    assert names == [f"frame_{index:05d}.png" for index in range(6)]
+    images = [np.asarray(Image.open(os.path.join(path, name))) for name in names]
+    assert images[0].shape == (40, 40, 4)
+    assert not np.array_equal(images[0], images[3])
+
+
+@pytest.mark.filterwarnings(
+    "error::ResourceWarning", "error::pytest.PytestUnraisableExceptionWarning"
+)
+def test_export_gif(tmp_path):
+    target = str(tmp_path / "out" / "circle.gif")
+    path = export_animation(
+        moving_point, circle(5), 5, target, fps=10, workers=2, size=(2, 2), dpi=20
+    )
+    with Image.open(path) as image:
+        assert image.n_frames == 5
+    assert os.listdir(tmp_path / "out") == ["circle.gif"]
+
+
+def test_open_frames_closes_previous_frame(tmp_path):
+    paths = [str(tmp_path / f"{index}.png") for index in range(3)]
+    for path in paths:
+        Image.fromarray(np.zeros((4, 4), dtype=np.uint8)).save(path)
+
+    frames = open_frames(paths)
+    first = next(frames)
+    second = next(frames)
+    assert first.fp is None and second.fp is not None
+    frames.close()
+    assert second.fp is None
+
+
+def test_export_errors(tmp_path):
+    with pytest.raises(ValueError):
+        export_animation(moving_point, circle(2), 2, str(tmp_path / "a.avi"))
+    if shutil.which("ffmpeg") is None:
+        with pytest.raises(RuntimeError):
+            export_animation(moving_point, circle(2), 2, str(tmp_path / "a.mp4"))
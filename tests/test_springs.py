@@ -0,0 +1,42 @@
+"""
+Testes do desenho das molas do EP1 a partir do molde unitário, comparado ao desenho original ponto a ponto.
+"""
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def baseline_spring(x0, x, Ns=1000, rs=0.03, ns=5, pad=100):
+    L = np.abs(x - x0)
+    w = np.linspace(0, L, Ns)
+    xp = np.zeros(Ns)
+    xp[pad:-pad] = rs * np.sin(2 * np.pi * ns * w[pad:-pad] / L)
+    return (x0 + w, -xp)
+
+
+@pytest.mark.parametrize("length", [0.5, 3.0, 12.0, 40.0])
+def test_spring_coordinates_follow_original_shape(ep1, length):
+    (x, y) = ep1.spring_coordinates(-2.0, -2.0 + length)
+    assert (x[0], x[-1]) == (-2.0, -2.0 + length)
+    assert np.all(np.diff(x) > 0)
+    assert len(x) >= len(ep1.SPRING_TEMPLATE[0]) // 8
+
+    (xb, yb) = baseline_spring(-2.0, -2.0 + length)
+    inside = (x > xb[101]) & (x < xb[-102])
+    assert np.allclose(y[inside], np.interp(x[inside], xb, yb), atol=2e-3)
+    assert np.all(y[x < xb[99]] == 0) and np.all(y[x > xb[-100]] == 0)
+
+
+def test_springs_figure_keeps_artist_count(ep1):
+    time = np.linspace(0, 2, 50)
+    solution = np.vstack([np.sin(time + i) for i in range(5)])
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    animate = ep1.springs_figure(fig, (time, solution), [-8, -4, 0, 4, 8], 10)
+    before = len(fig.axes[0].lines)
+    for index in range(50):
+        artists = animate(index)
+    assert len(fig.axes[0].lines) == before
+    (x, _) = artists[0].get_data()
+    assert x[0] == -10 and np.isclose(x[-1], -8 + solution[0, 49])
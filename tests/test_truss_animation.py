@@ -0,0 +1,41 @@
+"""
+Testes dos quadros pré-calculados da animação dos modos das treliças do EP2.
+"""
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from EP2.trusses import truss_model
+
+
+def test_mode_frames_match_direct_evaluation(ep2):
+    (X, Y, bars, free_nodes) = truss_model("pratt", 12)
+    mode = np.random.default_rng(0).standard_normal(2 * free_nodes)
+    (positions, segments) = ep2.mode_frames(X, Y, mode, bars, frames=16)
+
+    for frame in (0, 5, 15):
+        phase = np.cos(2 * np.pi * frame / 16)
+        expected = np.column_stack((X, Y))
+        expected[:free_nodes] += phase * mode.reshape(-1, 2)
+        assert np.allclose(positions[frame], expected)
+        (I, J) = (bars[:, 0].astype(int) - 1, bars[:, 1].astype(int) - 1)
+        assert np.allclose(segments[frame, :, 0], expected[I])
+        assert np.allclose(segments[frame, :, 1], expected[J])
+
+
+def test_truss_figure_updates_artists(ep2):
+    (X, Y, bars, free_nodes) = truss_model("tower", 8)
+    mode = np.ones(2 * free_nodes)
+    trajectory = ep2.mode_frames(X, Y, mode, bars, frames=8)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    animate = ep2.truss_figure(fig, trajectory, "modo")
+
+    (lines, nodes) = animate(4)
+    assert np.allclose(np.array(lines.get_segments()), trajectory[1][4])
+    assert np.allclose(nodes.get_xdata(), trajectory[0][4, :, 0])
+    (xmin, xmax) = fig.axes[0].get_xlim()
+    (ymin, ymax) = fig.axes[0].get_ylim()
+    positions = trajectory[0].reshape(-1, 2)
+    assert xmin <= positions[:, 0].min() and positions[:, 0].max() <= xmax
+    assert ymin <= positions[:, 1].min() and positions[:, 1].max() <= ymax
@@ -0,0 +1,74 @@
+"""
+Testes da montagem vetorizada das treliças do EP2, comparada à montagem barra a barra original.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from EP2.trusses import truss_model
+
+INPUT_C = os.path.join(os.path.dirname(os.path.dirname(__file__)), "EP2", "input-c")
+
+
+def assemble_bar_by_bar(bars, free_nodes, p, A, E):
+    M = np.zeros(free_nodes)
+    K = np.zeros((2 * free_nodes, 2 * free_nodes))
+    for (i, j, angle, L) in bars:
+        (i, j) = (int(i) - 1, int(j) - 1)
+        (c, s) = (np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle)))
+        local = (A * E) / L * np.array([[c ** 2, c * s], [c * s, s ** 2]])
+        for (a, b, sign) in ((i, i, 1), (j, j, 1), (i, j, -1), (j, i, -1)):
+            if a < free_nodes and b < free_nodes:
+                K[2 * a : 2 * a + 2, 2 * b : 2 * b + 2] += sign * local
+        for a in (i, j):
+            if a < free_nodes:
+                M[a] += 0.5 * p * A * L
+    return M, K
+
+
+def test_input_c_matches_bar_by_bar(ep2):
+    (M, K, total_nodes, free_nodes, bars) = ep2.truss_from_file(INPUT_C)
+    (M_ref, K_ref) = assemble_bar_by_bar(bars, free_nodes, *ep2.truss_material(INPUT_C))
+    assert (total_nodes, free_nodes, np.shape(bars)) == (14, 12, (28, 4))
+    assert np.allclose(M, M_ref)
+    assert np.allclose(ep2.dense(K), K_ref)
+
+
+@pytest.mark.parametrize("family", ["tower", "pratt", "grid"])
+def test_generated_trusses_match_bar_by_bar(ep2, family):
+    (_, _, bars, free_nodes) = truss_model(family, 40, jitter=0.05)
+    (M, K) = ep2.truss_from_arrays(bars, free_nodes, 7800.0, 0.1, 200e9)
+    (M_ref, K_ref) = assemble_bar_by_bar(bars, free_nodes, 7800.0, 0.1, 200e9)
+    assert np.allclose(M, M_ref)
+    assert np.allclose(ep2.dense(K), K_ref)
+
+    (K_tilde, _) = ep2.mass_normalize(K, np.repeat(M, 2))
+    scaling = 1 / np.sqrt(np.repeat(M_ref, 2))
+    expected = np.linalg.eigvalsh(scaling[:, None] * K_ref * scaling)
+    assert np.allclose(np.linalg.eigvalsh(ep2.dense(K_tilde)), expected)
+
+
+def test_random_truss_file_read_in_chunks(tmp_path, ep2):
+    rng = np.random.default_rng(5)
+    (total_nodes, free_nodes, m) = (30, 25, 100)
+    ends = np.sort(rng.choice(total_nodes, (m, 2)) + 1, axis=1)
+    ends = ends[ends[:, 0] != ends[:, 1]]
+    bars = np.column_stack(
+        (ends, rng.uniform(0, 360, len(ends)), rng.uniform(1, 5, len(ends)))
+    )
+    path = tmp_path / "input-random"
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"{total_nodes} {free_nodes} {len(bars)}\n7800 0.1 200\n")
+        np.savetxt(file, bars, fmt=["%d", "%d", "%.12g", "%.12g"])
+
+    (M, K, _, _, read_bars) = ep2.truss_from_file(str(path), chunk=7)
+    (M_ref, K_ref) = assemble_bar_by_bar(bars, free_nodes, 7800.0, 0.1, 200e9)
+    assert np.allclose(read_bars, bars)
+    assert np.allclose(M, M_ref)
+    assert np.allclose(ep2.dense(K), K_ref)
+
+    (K_tilde, _) = ep2.mass_normalize(K, np.repeat(M, 2))
+    scaling = 1 / np.sqrt(np.repeat(M_ref, 2))
+    expected = np.linalg.eigvalsh(scaling[:, None] * K_ref * scaling)
+    assert np.allclose(np.linalg.eigvalsh(ep2.dense(K_tilde)), expected)
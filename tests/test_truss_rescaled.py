@@ -0,0 +1,56 @@
+"""
+Testes da solução paramétrica das treliças do EP2, comparada a `scipy.linalg.eigh` com o material trocado.
+"""
+import os
+
+import numpy as np
+import scipy.linalg
+
+from EP2.trusses import truss_model, write_truss
+
+
+def reference_eigh(ep2, filename, p, A, E):
+    (_, _, _, free_nodes, bars) = ep2.truss_from_file(filename)
+    (M, K) = ep2.truss_from_arrays(bars, free_nodes, p, A, E)
+    return scipy.linalg.eigh(ep2.dense(K), np.diag(np.repeat(M, 2)))
+
+
+def test_truss_rescaled_matches_new_material(tmp_path, ep2):
+    (_, _, bars, free_nodes) = truss_model("warren", 15)
+    path = str(tmp_path / "warren.txt")
+    write_truss(path, bars, int(np.max(bars[:, :2])), free_nodes)
+
+    (p, A, E) = (2700.0, 0.05, 70e9)
+    (Lambda, Z) = ep2.truss_rescaled(path, p, A, E)
+    (expected, _) = reference_eigh(ep2, path, p, A, E)
+    assert np.allclose(Lambda, expected, rtol=1e-9)
+
+    (_, _, _, free_nodes, bars) = ep2.truss_from_file(path)
+    (M, K) = ep2.truss_from_arrays(bars, free_nodes, p, A, E)
+    M = np.repeat(M, 2)
+    assert np.allclose(Z.T @ (M[:, None] * Z), np.identity(len(M)), atol=1e-9)
+    assert np.allclose(K @ Z, (M[:, None] * Z) * Lambda, atol=1e-6 * Lambda[-1])
+
+
+def test_truss_reference_is_read_only_and_tracks_file(tmp_path, ep2):
+    (_, _, bars, free_nodes) = truss_model("tower", 10)
+    path = str(tmp_path / "tower.txt")
+    write_truss(path, bars, int(np.max(bars[:, :2])), free_nodes)
+
+    (Lambda, Z, _) = ep2.truss_reference(path, 3)
+    assert not Lambda.flags.writeable and not Z.flags.writeable
+    assert ep2.truss_reference(path, 3)[0] is Lambda
+    (rescaled, _) = ep2.truss_rescaled(path, 7800.0, 0.1, 200e9, k=3)
+    rescaled[:] = 0
+    assert np.all(ep2.truss_reference(path, 3)[0] > 0)
+
+    write_truss(path, bars, int(np.max(bars[:, :2])), free_nodes, E=100e9)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    (updated, _, (_, _, E)) = ep2.truss_reference(path, 3)
+    assert E == 100e9
+    assert np.allclose(updated, Lambda / 2, rtol=1e-8)
+
+
+def test_truss_solution_cache_is_bounded(ep2):
+    assert ep2.truss_solution.cache_info().maxsize == 8
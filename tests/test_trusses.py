@@ -0,0 +1,46 @@
+"""
+Testes do gerador de treliças do EP2: formato das barras, numeração dos nós e estabilidade das estruturas.
+"""
+import numpy as np
+import pytest
+import scipy.linalg
+
+from EP2.trusses import FAMILIES, truss_model, write_truss
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_truss_model_format(family):
+    (X, Y, bars, free_nodes) = truss_model(family, 30, jitter=0.1, seed=3)
+    (I, J) = (bars[:, 0].astype(int) - 1, bars[:, 1].astype(int) - 1)
+    assert np.all((0 <= I) & (I < len(X)) & (0 <= J) & (J < len(X)))
+    assert np.all((0 <= bars[:, 2]) & (bars[:, 2] < 180))
+    assert np.allclose(bars[:, 3], np.hypot(X[I] - X[J], Y[I] - Y[J]))
+    assert 0 < free_nodes < len(X)
+
+    (X2, Y2, bars2, _) = truss_model(family, 30, jitter=0.1, seed=3)
+    assert np.array_equal(X, X2) and np.array_equal(bars, bars2)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_truss_model_is_stable(ep2, family):
+    (_, _, bars, free_nodes) = truss_model(family, 30)
+    (M, K) = ep2.truss_from_arrays(bars, free_nodes, 7800.0, 0.1, 200e9)
+    Lambda = scipy.linalg.eigh(
+        ep2.dense(K), np.diag(np.repeat(M, 2)), eigvals_only=True
+    )
+    assert Lambda[0] > 1e-8 * Lambda[-1]
+
+
+def test_write_truss_round_trip(tmp_path, ep2):
+    (_, _, bars, free_nodes) = truss_model("warren", 21)
+    path = str(tmp_path / "warren.txt")
+    write_truss(path, bars, 21, free_nodes, p=2700.0, A=0.05, E=70e9)
+
+    (M, K, total_nodes, free, read) = ep2.truss_from_file(path)
+    assert (total_nodes, free) == (21, free_nodes)
+    assert np.allclose(read, bars)
+    assert ep2.truss_material(path) == (2700.0, 0.05, 70e9)
+    (M_ref, K_ref) = ep2.truss_from_arrays(bars, free_nodes, 2700.0, 0.05, 70e9)
+    (K, K_ref) = (ep2.dense(K), ep2.dense(K_ref))
+    assert np.allclose(M, M_ref)
+    assert np.allclose(K, K_ref, atol=1e-12 * np.abs(K_ref).max())